@@ -1,20 +1,28 @@
+import os
 import random
 import sys
-import time
 from functools import partial
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QDialog, QApplication, QProgressDialog
-from PyQt5.uic import loadUi
 
 from GUI.solver_thread import SolverThread
-from Logic.utils import is_solvable
+from GUI.ui_cache import compiled_ui_class
+from Logic.puzzle_solver import SearchProgress
+from Logic.utils import STATE_SPACE_SIZE, is_solvable
 
+# Only half of the permutations can be reached from a solvable board
+REACHABLE_STATES = STATE_SPACE_SIZE // 2
 
-class MainWindow(QDialog):
+UI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "8-Game-Window.ui")
+# Generated from UI_PATH once and reused until the .ui file changes
+WindowUi = compiled_ui_class(UI_PATH, "Ui_Form")
+
+
+class MainWindow(QDialog, WindowUi):
     def __init__(self):
         super(MainWindow, self).__init__()
-        loadUi("8-Game-Window.ui", self)
+        self.setupUi(self)
         self.current_state = []
         self.states_memo = []
         self.state_pointer = 0
@@ -23,6 +31,9 @@ class MainWindow(QDialog):
 
         self.manhattan_radio.setChecked(True)
         self.progress_dialog = None
+        self.solver_thread = None
+        # Cancelled and finished threads stay referenced until QThread.finished; see retire_thread
+        self.retired_threads = []
         self.play_button.hide()
 
         self.random_button.clicked.connect(self.randomize)
@@ -102,27 +113,60 @@ class MainWindow(QDialog):
             self.coloring_board()
 
     def solve(self, method: str):
-        self.setEnabled(False)
-        self.progress_dialog = QProgressDialog("Searching...", None, 0, 100, self)
+        # A new solve supersedes the one in flight
+        self.cancel_solve()
+        self.progress_dialog = QProgressDialog("Searching...", "Cancel", 0, 100, self)
         self.progress_dialog.setWindowTitle("Please Wait")
         self.progress_dialog.setWindowModality(Qt.WindowModal)
         self.progress_dialog.setMinimumDuration(0)
-        self.progress_dialog.setValue(20)
+        self.progress_dialog.setValue(0)
         self.progress_dialog.setFixedSize(300, 100)
+        self.progress_dialog.canceled.connect(self.cancel_solve)
+
+        self.solver_thread = SolverThread(method, self.get_buttons_data())
+        self.solver_thread.progress.connect(self.handle_progress)
+        self.solver_thread.solved.connect(self.handle_solution)
+        self.solver_thread.start()
+
+    def cancel_solve(self):
+        if self.solver_thread is None:
+            return
+        thread = self.solver_thread
+        self.solver_thread = None
+        # Results of a cancelled or superseded search are never shown
+        thread.progress.disconnect()
+        thread.solved.disconnect()
+        thread.cancel()
+        self.retire_thread(thread)
+        self.progress_dialog.close()
+
+    def retire_thread(self, thread: SolverThread):
+        """Keep a thread referenced until QThread.finished: collecting a running QThread crashes the app."""
+        self.retired_threads.append(thread)
+        thread.finished.connect(partial(self.forget_thread, thread))
+        if thread.isFinished():  # Connected too late to hear it
+            self.forget_thread(thread)
 
-        QApplication.processEvents()
+    def forget_thread(self, thread: SolverThread):
+        if thread in self.retired_threads:
+            self.retired_threads.remove(thread)
 
-        solver_thread = SolverThread(method, self.get_buttons_data())
-        solver_thread.finished.connect(self.handle_solution)
-        solver_thread.run()
+    def handle_progress(self, progress: SearchProgress):
+        # Graph searches expand each reachable state at most once; IDS may revisit, so stay below 100
+        self.progress_dialog.setValue(min(99, 100 * progress.num_nodes // REACHABLE_STATES))
+        self.progress_dialog.setLabelText(f"Searching... {progress.num_nodes} nodes expanded, "
+                                          f"frontier {progress.frontier_size}, depth {progress.depth}, "
+                                          f"{progress.elapsed:.1f}s")
 
     def handle_solution(self, solution: dict):
-        self.progress_dialog.setValue(100)
-        time.sleep(0.5)
+        # Cleared first: closing the dialog emits canceled, which must not cancel a finished search.
+        # run() may still be returning after emitting solved, so the thread is retired, not dropped
+        self.retire_thread(self.solver_thread)
+        self.solver_thread = None
         self.progress_dialog.close()
-        self.setEnabled(True)
 
-        self.states_memo = solution['solution_path']
+        # A Solution decodes each board state only when it is stepped to
+        self.states_memo = solution['solution']
         if self.states_memo:
             self.cost_label.setText(f"Cost = {solution['cost']}")
             self.depth_label.setText(f"Max Depth = {solution['depth']}")
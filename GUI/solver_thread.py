@@ -1,15 +1,29 @@
+import threading
+
 from PyQt5.QtCore import QThread, pyqtSignal
-from Logic.solver_factory import solve_puzzle
+from Logic.solver_factory import solve_or_report
+
+# Node expansions between progress signals; small enough for the dialog to move on quick solves
+PROGRESS_INTERVAL = 2000
 
 
 class SolverThread(QThread):
-    finished = pyqtSignal(dict)
+    # Not named finished: that is QThread's own signal, emitted once run() has returned
+    solved = pyqtSignal(dict)
+    progress = pyqtSignal(object)  # Logic.puzzle_solver.SearchProgress
 
     def __init__(self, method_name: str, game_initial_state: int):
         super(SolverThread, self).__init__()
         self.method_name = method_name
         self.game_initial_state = game_initial_state
+        self.cancel_event = threading.Event()
 
     def run(self):
-        solve = solve_puzzle(self.method_name, self.game_initial_state)
-        self.finished.emit(solve)
+        # Invalid input comes back as a status "error" result, so the window always hears back
+        solve = solve_or_report(self.method_name, self.game_initial_state, observer=self.progress.emit,
+                                report_interval=PROGRESS_INTERVAL, cancel_event=self.cancel_event)
+        self.solved.emit(solve)
+
+    def cancel(self):
+        """Ask the running search to stop; it finishes with status "cancelled" at its next checkpoint."""
+        self.cancel_event.set()
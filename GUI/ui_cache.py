@@ -0,0 +1,32 @@
+import importlib.util
+import os
+
+from PyQt5 import uic
+
+
+def compiled_ui_path(ui_path: str) -> str:
+    """Location of the Python module generated from a Qt Designer file, next to it."""
+    directory, name = os.path.split(ui_path)
+    module_name = os.path.splitext(name)[0].replace("-", "_").lower()
+    return os.path.join(directory, f"{module_name}_ui.py")
+
+
+def compiled_ui_class(ui_path: str, class_name: str):
+    """Return the generated Ui_ class for a .ui file, compiling it only when the file changed.
+
+    loadUi parses the XML on every launch; the generated module is imported
+    like any other, from its cached bytecode after the first run.
+    """
+    module_path = compiled_ui_path(ui_path)
+    if not os.path.exists(module_path) or os.path.getmtime(module_path) < os.path.getmtime(ui_path):
+        # Written to a temporary file first so a concurrent launch never imports a half-written module
+        temp_path = f"{module_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            uic.compileUi(ui_path, file)
+        os.replace(temp_path, module_path)
+
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
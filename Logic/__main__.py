@@ -0,0 +1,150 @@
+"""Batch solver: python -m Logic METHOD [INPUT] streams one JSON result per input state.
+
+With --binary-input and --binary-output, states and solutions use the
+compact formats of Logic.binary_format instead of text.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+from collections import Counter
+from typing import Iterable, Iterator, List
+
+from Logic.binary_format import SolutionWriter, StateFile
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.puzzle_solver import SearchBudget
+from Logic.solver_factory import solve_many, solve_puzzle
+
+
+def parse_board(text: str) -> Board:
+    rows, _, cols = text.lower().partition("x")
+    try:
+        return Board(int(rows), int(cols))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected ROWSxCOLS, got {text!r}")
+
+
+def parse_state(line: str):
+    """Read 806547231 or 8,0,6,... / 8 0 6 ...; unparsable lines are passed on as text and reported as errors."""
+    fields = line.replace(",", " ").split()
+    try:
+        if len(fields) == 1:
+            return int(fields[0])
+        return tuple(int(field) for field in fields)
+    except ValueError:
+        return line
+
+
+def read_states(lines: Iterable[str]) -> Iterator[State]:
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield parse_state(line)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def summarize(statuses: Counter, latencies: List[float], wall_time: float) -> dict:
+    latencies.sort()
+    count = sum(statuses.values())
+    return {
+        "puzzles": count,
+        "statuses": dict(statuses),
+        "wall_time": wall_time,
+        "puzzles_per_second": count / wall_time if wall_time else 0.0,
+        "latency": {
+            "p50": percentile(latencies, 0.50),
+            "p90": percentile(latencies, 0.90),
+            "p99": percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m Logic", description=__doc__)
+    parser.add_argument("method", help="solver method name, e.g. AStarManhattan")
+    parser.add_argument("input", nargs="?", default="-", help="file with one state per line (default: stdin)")
+    parser.add_argument("--board", type=parse_board, default=CLASSIC_BOARD,
+                        help="board size as ROWSxCOLS (default 3x3)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default 1, in-process)")
+    parser.add_argument("--chunksize", type=int, default=16, help="states sent to a worker at a time")
+    parser.add_argument("--timeout-per-puzzle", type=float, default=None, help="seconds before a solve is abandoned")
+    parser.add_argument("--max-expansions", type=int, default=None, help="node expansions before a solve is abandoned")
+    parser.add_argument("--max-states", type=int, default=None, help="states a solve may hold before it is abandoned")
+    parser.add_argument("--summary", action="store_true", help="print throughput and latency percentiles to stderr")
+    parser.add_argument("--binary-input", action="store_true",
+                        help="INPUT is a binary state file (see Logic.binary_format); it sets the board")
+    parser.add_argument("--binary-output", metavar="PATH",
+                        help="write a binary solution file, in input order, instead of JSONL on stdout")
+    args = parser.parse_args(argv)
+    if args.binary_input:
+        if args.input == "-":
+            parser.error("--binary-input needs an INPUT file to memory-map")
+        state_file = StateFile(args.input)
+        args.board = state_file.board
+
+    # Fail fast on unknown methods; this also builds the method's tables before workers fork
+    try:
+        solve_puzzle(args.method, args.board.goal_state, args.board)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.binary_input:
+        input_file, states = state_file, iter(state_file)
+    else:
+        input_file = sys.stdin if args.input == "-" else open(args.input)
+        states = read_states(input_file)
+    writer = SolutionWriter(args.binary_output, args.board) if args.binary_output else None
+    in_flight = {}
+    statuses = Counter()
+    latencies = []
+    timer_started = time.perf_counter()
+
+    def remember(stream: Iterable[State]) -> Iterator[State]:
+        # Keep each state until its result is written so the record can echo it; solve_many bounds how many
+        for index, state in enumerate(stream):
+            in_flight[index] = state
+            yield state
+
+    try:
+        # Binary records carry no index, so they are written in input order
+        results = solve_many(args.method, remember(states), workers=args.workers, chunksize=args.chunksize,
+                             ordered=writer is not None, board=args.board,
+                             budget=SearchBudget(args.max_expansions, args.timeout_per_puzzle, args.max_states))
+        if writer is not None:
+            results = enumerate(results)
+        for index, result in results:
+            state = in_flight.pop(index)
+            if writer is not None:
+                writer.write(state, result)
+            else:
+                record = {"index": index, "state": state, "method": args.method}
+                record.update(result)
+                # The Solution is written as its move string, e.g. "RDLU", next to the decoded states
+                record["solution"] = result["solution"].moves
+                record["solution_path"] = list(result["solution_path"])
+                sys.stdout.write(json.dumps(record) + "\n")
+                sys.stdout.flush()
+            statuses[result["status"]] += 1
+            latencies.append(result["runtime"])
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if writer is not None:
+            writer.close()
+
+    if args.summary:
+        json.dump(summarize(statuses, latencies, time.perf_counter() - timer_started), sys.stderr)
+        sys.stderr.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import math
+import time
+from array import array
+from typing import Callable, Iterator, List, NamedTuple, Set
+
+from Logic.astar_solver import AStarPuzzleSolver, EXPLORED, FRONTIER, UNSEEN
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.heuristics import heuristic_delta
+from Logic.priority_queues import LazyHeapQueue
+from Logic.puzzle_solver import BudgetExhausted
+from Logic.solution import Solution
+
+
+class AnytimeSolution(NamedTuple):
+    """One improved solution of an anytime search."""
+    solution_path: Solution
+    cost: int
+    weight: float  # Heuristic weight of the iteration that found or confirmed the solution
+    suboptimality_bound: float  # cost <= suboptimality_bound * optimal cost
+    num_nodes: int
+    runtime: float
+
+
+class ARAStarPuzzleSolver(AStarPuzzleSolver):
+    """Anytime Repairing A*: weighted A* runs with a decreasing weight that reuse each other's work.
+
+    Each iteration orders the frontier by g + weight * h and stops once no
+    frontier entry can beat the incumbent. States whose g improves after
+    they were expanded in the current iteration are kept aside as
+    inconsistent and rejoin the frontier for the next, lower weight, so g
+    values and parent moves carry over instead of restarting from scratch.
+    """
+
+    def __init__(self, initial_state: State, heuristic: Callable[[int], float], initial_weight: float = 3.0,
+                 weight_step: float = 0.5, board: Board = CLASSIC_BOARD):
+        super().__init__(initial_state, heuristic, LazyHeapQueue(), board)
+        if initial_weight < 1 or weight_step <= 0:
+            raise ValueError(f"Need initial_weight >= 1 and weight_step > 0, got {initial_weight}, {weight_step}")
+        self.weight = initial_weight
+        self.weight_step = weight_step
+        # Suboptimal paths can be longer than 255 moves, so g gets two bytes per state on ranked boards
+        if board.ranked:
+            self.g_cost = array('H', bytes(2 * board.state_space_size))
+        self.closed = board.new_table()
+        self.inconsistent: Set[int] = set()
+        self.incumbent_cost = math.inf
+        self.suboptimality_bound = math.inf
+
+    def solve(self) -> None:
+        """Run the anytime search to the end, keeping the best solution found."""
+        for _ in self.solutions():
+            pass
+
+    def solutions(self) -> Iterator[AnytimeSolution]:
+        """Yield every improved solution until optimality is proven or the budget runs out.
+
+        An exhausted budget ends the stream quietly once a solution exists;
+        before that it propagates as BudgetExhausted.
+        """
+        if not self.board.is_solvable(self.initial_packed):
+            self.reset_solver()
+            return
+
+        timer_started = self.start_time = time.perf_counter()
+        board = self.board
+        initial_h = self.evaluate(self.initial_packed)
+        initial_rank = board.index(self.initial_packed)
+        self.state_flags[initial_rank] = FRONTIER
+        self.frontier.push(self.weight * initial_h, (self.initial_packed, 0, initial_h))
+        if self.initial_packed == board.goal:
+            self.incumbent_cost = 0
+
+        while True:
+            try:
+                self.improve_path()
+            except BudgetExhausted:
+                if self.incumbent_cost == math.inf:
+                    raise
+                break
+            if self.incumbent_cost == math.inf:
+                self.reset_solver()
+                return
+
+            # Cheaper g values found after the goal was reached rewrite parents on its chain, so the
+            # path extracted now can be shorter than the incumbent cost recorded when it was found
+            solution = self.get_path(board.goal)
+            self.incumbent_cost = solution.cost
+            lower_bound = self.lower_bound()
+            bound = min(self.weight, self.incumbent_cost / lower_bound) if lower_bound else 1.0
+            if bound < self.suboptimality_bound:
+                self.suboptimality_bound = max(1.0, bound)
+                self.solution = solution
+                self.cost = self.incumbent_cost
+                self.run_time = time.perf_counter() - timer_started
+                yield AnytimeSolution(self.solution, self.cost, self.weight, self.suboptimality_bound,
+                                      self.num_nodes, self.run_time)
+            # An iteration at weight 1 is plain A* and proves optimality
+            if self.suboptimality_bound <= 1.0 or self.weight <= 1.0:
+                break
+            self.lower_weight()
+
+        self.run_time = time.perf_counter() - timer_started
+
+    def improve_path(self) -> None:
+        """Expand in g + weight * h order while some frontier entry may still lead to a cheaper goal."""
+        board = self.board
+        goal = board.goal
+        while len(self.frontier) != 0 and self.frontier.peek_priority() < self.incumbent_cost:
+            _, (state, depth, state_h) = self.frontier.pop()
+            state_rank = board.index(state)
+            if self.closed[state_rank] or depth != self.g_cost[state_rank]:
+                continue
+            # With an admissible heuristic, g + h bounds every path through this state
+            if depth + state_h >= self.incumbent_cost:
+                continue
+            self.closed[state_rank] = 1
+            self.state_flags[state_rank] = EXPLORED
+            self.num_nodes += 1
+            self.max_search_depth = max(self.max_search_depth, depth)
+            if self.num_nodes == self.next_checkpoint:
+                self.checkpoint(len(self.frontier), depth, depth + state_h)
+
+            new_depth = depth + 1
+            zero_pos = state & board.blank_mask
+            table = self.heuristic_table
+            for neighbor, move, tile, tile_pos in board.tile_moves(state):
+                neighbor_rank = board.index(neighbor)
+                if self.state_flags[neighbor_rank] != UNSEEN and new_depth >= self.g_cost[neighbor_rank]:
+                    continue
+                self.state_flags[neighbor_rank] = FRONTIER
+                self.g_cost[neighbor_rank] = new_depth
+                self.parent_moves[neighbor_rank] = move + 1
+                if neighbor == goal:
+                    self.incumbent_cost = new_depth
+                    continue
+                if self.closed[neighbor_rank]:
+                    self.inconsistent.add(neighbor)
+                    continue
+                if table is not None:
+                    neighbor_h = heuristic_delta(table, state_h, tile, tile_pos, zero_pos)
+                else:
+                    neighbor_h = self.evaluate(neighbor)
+                self.frontier.push(new_depth + self.weight * neighbor_h, (neighbor, new_depth, neighbor_h))
+
+    def lower_bound(self) -> float:
+        """Smallest g + h over the frontier and the inconsistent states: no solution can be cheaper."""
+        bound = self.incumbent_cost
+        for state, depth, state_h in self.frontier:
+            if depth == self.g_cost[self.board.index(state)]:
+                bound = min(bound, depth + state_h)
+        for state in self.inconsistent:
+            bound = min(bound, self.g_cost[self.board.index(state)] + self.evaluate(state))
+        return bound
+
+    def lower_weight(self) -> None:
+        """Decrease the weight and rebuild the frontier, with the inconsistent states, for a fresh iteration."""
+        self.weight = max(1.0, self.weight - self.weight_step)
+        entries = {}
+        for state, depth, state_h in self.frontier:
+            state_rank = self.board.index(state)
+            if depth == self.g_cost[state_rank] and not self.closed[state_rank]:
+                entries[state] = (depth, state_h)
+        for state in self.inconsistent:
+            entries[state] = (self.g_cost[self.board.index(state)], self.evaluate(state))
+        self.inconsistent = set()
+        self.closed = self.board.new_table()
+        self.frontier = LazyHeapQueue()
+        for state, (depth, state_h) in entries.items():
+            self.frontier.push(depth + self.weight * state_h, (state, depth, state_h))
+
+    def get_cost(self) -> int:
+        """Return the cost of the best solution found."""
+        return int(self.cost)
@@ -1,48 +1,70 @@
-import heapq
 import time
-from typing import Callable, Dict
+from typing import Callable, Optional, Tuple
 
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.heuristics import INTEGER_HEURISTICS, heuristic_delta, heuristic_table, packed_evaluator
+from Logic.priority_queues import BucketQueue, LazyHeapQueue, PriorityQueue
 from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
 from Logic.utils import *
 
+UNSEEN, FRONTIER, EXPLORED = 0, 1, 2
+
 
 class AStarPuzzleSolver(PuzzleSolver):
-    def __init__(self, initial_state: int, heuristic: Callable[[int], float]):
+    def __init__(self, initial_state: State, heuristic: Callable[[int], float],
+                 frontier: Optional[PriorityQueue] = None, board: Board = CLASSIC_BOARD):
         # Initialize the A* Puzzle Solver with the given initial state
-        super().__init__(initial_state)
-        self.start_time = 0  # Start time of the search
+        super().__init__(initial_state, board)
         self.heuristic = heuristic
+        # Per-tile table for O(1) child evaluation, None for heuristics that must be evaluated in full
+        self.heuristic_table = heuristic_table(heuristic, board)
+        self.evaluate = packed_evaluator(heuristic, board)
+        if frontier is None:
+            frontier = BucketQueue() if heuristic in INTEGER_HEURISTICS else LazyHeapQueue()
+        self.frontier = frontier
         self.current_cost = 0
-        self.map_of_costs = {}
-        self.g_cost = {}
+        # Per-state buffers indexed by permutation rank
+        self.state_flags = board.new_table()
+        self.g_cost = board.new_table()
+        self.parent_moves = board.new_table()
 
     def solve(self):
         """Solve the puzzle using the A* algorithm."""
-        if not is_solvable(self.initial_state):
+        if not self.board.is_solvable(self.initial_packed):
             self.reset_solver()
             return
 
-        timer_started = time.perf_counter()
-        self.current_cost = self.heuristic(self.initial_state) + self.cost
-        heap = [(self.current_cost, self.initial_state)]
-        self.frontier_set.add(self.initial_state)
-        self.map_of_costs[self.initial_state] = self.current_cost
-        child_parent_map: Dict[int, int] = {}
-        self.g_cost[self.initial_state] = self.cost
-
-        while len(heap) != 0:
-            state_cost, state = heapq.heappop(heap)
-            self.frontier_set.remove(state)
-            self.explored_set.add(state)
-            self.max_search_depth = max(self.max_search_depth, self.g_cost[state])
-
-            if state == self.goal_state:
-                self.solution_path = self.get_path(child_parent_map, state)
-                self.cost = len(self.solution_path) - 1
-                self.num_nodes = len(self.explored_set)
+        timer_started = self.start_time = time.perf_counter()
+        initial_packed = self.initial_packed
+        initial_h = self.evaluate(initial_packed)
+        self.current_cost = initial_h + self.cost
+        initial_rank = self.board.index(initial_packed)
+        self.state_flags[initial_rank] = FRONTIER
+        self.g_cost[initial_rank] = self.cost
+        self.frontier.push(self.current_cost, (initial_packed, self.cost, initial_h))
+
+        while len(self.frontier) != 0:
+            state_cost, (state, depth, state_h) = self.frontier.pop()
+            state_rank = self.board.index(state)
+            # The queues have no decrease-key: a cheaper path pushes a new entry and the
+            # superseded one is skipped when it is popped (lazy deletion). The
+            # bidirectional and HDA* solvers skip stale entries the same way.
+            if self.state_flags[state_rank] == EXPLORED or depth != self.g_cost[state_rank]:
+                continue
+            self.state_flags[state_rank] = EXPLORED
+            self.num_nodes += 1
+            self.max_search_depth = max(self.max_search_depth, depth)
+
+            if state == self.board.goal:
+                self.solution = self.get_path(state)
+                self.cost = self.solution.cost
                 break
 
-            self.expand_state(state, heap, self.g_cost[state], child_parent_map)
+            if self.num_nodes == self.next_checkpoint:
+                self.checkpoint(len(self.frontier), depth, state_cost)
+
+            self.expand_state(state, depth, state_h)
 
         self.run_time = time.perf_counter() - timer_started
 
@@ -54,39 +76,37 @@ class AStarPuzzleSolver(PuzzleSolver):
         self.run_time = 0
         self.cost = 0
 
-    def expand_state(self, state: int, heap: List[tuple[float, int]],
-                     current_depth: int, child_parent_map: Dict[int, int]) -> None:
-        """Expand the current state by finding its valid neighbors and add them to the heap."""
-        for neighbor in get_neighbors(state):
-            self.g_cost[neighbor] = current_depth + 1
-            new_cost = current_depth + 1 + self.heuristic(neighbor)
-            # Check if the neighbor is already in explored_set or frontier
-            if neighbor not in self.explored_set and neighbor not in self.frontier_set:
-                self.frontier_set.add(neighbor)
-                heapq.heappush(heap, (new_cost, neighbor))
-                child_parent_map[neighbor] = state
-                self.map_of_costs[neighbor] = new_cost
-            elif neighbor in self.frontier_set:
-                temp = self.map_of_costs[neighbor]
-                if new_cost < temp:
-                    heap = [(cost, state) for cost, state in heap if state != neighbor]
-                    self.map_of_costs[neighbor] = new_cost
-                    heapq.heappush(heap, (new_cost, neighbor))
-                    child_parent_map[neighbor] = state
-
-    def get_path(self, child_parent_map: Dict[int, int], goal_state: int) -> List[int]:
+    def expand_state(self, state: int, current_depth: int, state_h: float) -> None:
+        """Expand the current state by finding its valid neighbors and add them to the frontier."""
+        new_depth = current_depth + 1
+        zero_pos = state & self.board.blank_mask
+        table = self.heuristic_table
+        for neighbor, move, tile, tile_pos in self.board.tile_moves(state):
+            neighbor_rank = self.board.index(neighbor)
+            flag = self.state_flags[neighbor_rank]
+            # New states and cheaper paths are pushed, leaving a stale entry behind. Explored states are
+            # reopened too: with an inconsistent heuristic such as the pattern database a state can be
+            # expanded before its shortest path is known, and skipping it would lose optimality
+            if flag == UNSEEN or new_depth < self.g_cost[neighbor_rank]:
+                self.state_flags[neighbor_rank] = FRONTIER
+                self.g_cost[neighbor_rank] = new_depth
+                self.parent_moves[neighbor_rank] = move + 1
+                if table is not None:
+                    neighbor_h = heuristic_delta(table, state_h, tile, tile_pos, zero_pos)
+                else:
+                    neighbor_h = self.evaluate(neighbor)
+                self.frontier.push(new_depth + neighbor_h, (neighbor, new_depth, neighbor_h))
+
+    def closest_state(self) -> Tuple[int, float]:
+        """Return the frontier state with the lowest heuristic value, read from the queued entries."""
+        if len(self.frontier) == 0:
+            return self.initial_packed, self.evaluate(self.initial_packed)
+        state, _, state_h = min(self.frontier, key=lambda item: item[2])
+        return state, state_h
+
+    def get_path(self, goal_state: int) -> Solution:
         """Reconstruct the solution path from the goal state back to the initial state."""
-        path = []
-        current_state = goal_state
-
-        while current_state in child_parent_map:
-            path.append(current_state)
-            current_state = child_parent_map[current_state]
-
-        path.append(self.initial_state)
-        path.reverse()
-
-        return path
+        return self.solution_from_moves(goal_state, self.parent_moves)
 
     def get_number_of_nodes(self) -> int:
         """Return the total number of nodes explored during the search."""
@@ -100,7 +120,7 @@ class AStarPuzzleSolver(PuzzleSolver):
         """Return the total runtime of the solution process."""
         return self.run_time
 
-    def get_steps(self) -> list[int]:
+    def get_steps(self) -> Solution:
         """Return the sequence of steps taken to solve the puzzle."""
         return self.solution_path
 
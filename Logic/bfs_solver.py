@@ -1,22 +1,26 @@
 import time
+from collections import deque
+from typing import Iterable
+from Logic.board import CLASSIC_BOARD, Board, State
 from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
 from Logic.utils import *
 
 
 class BFSPuzzleSolver(PuzzleSolver):
-    def __init__(self, initial_state: int):
+    def __init__(self, initial_state: State, board: Board = CLASSIC_BOARD):
         # Initialize the BFS Puzzle Solver with the given initial state
-        super().__init__(initial_state)
-        self.queue = []  # Initialize an empty queue
-        self.parent_map = {}  # To store the parent of each state
-        self.start_time = 0  # Start time of the search
+        super().__init__(initial_state, board)
+        self.queue = deque()  # Initialize an empty queue
+        self.explored = board.new_table()  # Visited flags indexed by state rank
+        self.parent_moves = board.new_table()  # Move that reached each state, plus one
 
     def solve(self) -> None:
-        if not is_solvable(self.initial_state):
+        if not self.board.is_solvable(self.initial_packed):
             self.reset_solver()
             return
 
-        if self.__is_solved(self.initial_state):
+        if self.initial_packed == self.board.goal:
             self.solution_path = [self.initial_state]
             return
 
@@ -33,14 +37,14 @@ class BFSPuzzleSolver(PuzzleSolver):
     def get_runtime(self) -> float:
         return self.run_time
 
-    def get_steps(self) -> List[int]:
+    def get_steps(self) -> Solution:
         return self.solution_path
 
     def get_cost(self) -> int:
         return self.cost
 
     def __is_solved(self, state: int) -> bool:
-        return state == self.goal_state
+        return state == self.board.goal
 
     def __get_empty_tile_position(self, state: int) -> int:
         flat_state = [int(digit) for digit in str(state).zfill(9)]
@@ -68,32 +72,31 @@ class BFSPuzzleSolver(PuzzleSolver):
         return int("".join([str(digit) for digit in flat_state]))
 
     def __generate_solution_path(self, current_state: int):
-        while current_state:
-            self.solution_path.insert(0, current_state)
-            current_state = self.parent_map[current_state]
+        self.solution = self.solution_from_moves(current_state, self.parent_moves)
 
     def __generate_neighbor_states(self, queue_size: int) -> bool:
         for _ in range(queue_size):
-            current_state = self.queue.pop(0)  # Dequeue the first element from the queue
+            current_state = self.queue.popleft()  # Dequeue the first element from the queue
             self.num_nodes += 1
-            neighbor_states = get_neighbors(current_state)
-            for neighbor_states in neighbor_states:
-                if neighbor_states not in self.explored_set:
-                    self.explored_set.add(neighbor_states)
-                    self.parent_map[neighbor_states] = current_state
-                    if self.__is_solved(neighbor_states):
+            if self.num_nodes == self.next_checkpoint:
+                self.checkpoint(len(self.queue), self.max_search_depth - 1)
+            for neighbor_state, move in self.board.successors(current_state):
+                neighbor_rank = self.board.index(neighbor_state)
+                if not self.explored[neighbor_rank]:
+                    self.explored[neighbor_rank] = 1
+                    self.parent_moves[neighbor_rank] = move + 1
+                    if self.__is_solved(neighbor_state):
                         self.run_time = time.perf_counter() - self.start_time
-                        self.__generate_solution_path(neighbor_states)
+                        self.__generate_solution_path(neighbor_state)
                         self.num_nodes += 1  # Include the goal state in the explored nodes
                         return True
-                    self.queue.append(neighbor_states)
+                    self.queue.append(neighbor_state)
         return False
 
     def __bfs(self) -> bool:
-        self.parent_map = {self.initial_state: None}  # To store the parent of each state
-        self.queue = [self.initial_state]  # Initialize an empty queue
+        self.queue = deque([self.initial_packed])
         self.start_time = time.perf_counter()  # Start the timer
-        self.explored_set.add(self.initial_state)
+        self.explored[self.board.index(self.initial_packed)] = 1
         while self.queue:
             queue_size = len(self.queue)
             self.max_search_depth += 1
@@ -102,6 +105,9 @@ class BFSPuzzleSolver(PuzzleSolver):
                 return True
         return False
 
+    def open_states(self) -> Iterable[int]:
+        return self.queue
+
     def reset_solver(self) -> None:
         """Reset solver attributes if the puzzle is determined to be unsolvable."""
         self.num_nodes = 0
@@ -0,0 +1,219 @@
+import math
+import time
+from typing import Callable, Iterable, List, Tuple
+
+from Logic.astar_solver import EXPLORED, FRONTIER, UNSEEN
+from Logic.board import CLASSIC_BOARD, OPPOSITE_MOVE, Board, State
+from Logic.heuristics import INTEGER_HEURISTICS, heuristic_delta, heuristic_table, heuristic_table_towards, \
+    packed_heuristic
+from Logic.priority_queues import BucketQueue, LazyHeapQueue
+from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
+
+FORWARD, BACKWARD = 0, 1
+
+
+class BidirectionalPuzzleSolver(PuzzleSolver):
+    """Shared bookkeeping for searches that grow one tree from the initial state and one from the goal.
+
+    Each direction keeps its own per-state tables; parent_moves[direction]
+    holds the move that reached a state from that direction's root, plus one.
+    """
+
+    def __init__(self, initial_state: State, board: Board = CLASSIC_BOARD):
+        super().__init__(initial_state, board)
+        self.parent_moves = [board.new_table(), board.new_table()]
+        self.meeting_state = None
+
+    def splice_path(self, meeting_state: int) -> Solution:
+        """Join the forward path to the meeting state with the backward path from it to the goal."""
+        moves = self.board.moves_from_parents(meeting_state, self.parent_moves[FORWARD])
+        backward_moves = self.parent_moves[BACKWARD]
+        current_state = meeting_state
+        move = backward_moves[self.board.index(current_state)]
+        while move:
+            moves.append(OPPOSITE_MOVE[move - 1])
+            current_state = self.board.apply_move(current_state, OPPOSITE_MOVE[move - 1])
+            move = backward_moves[self.board.index(current_state)]
+        return Solution.from_moves(self.initial_packed, moves, self.board)
+
+    def reset_solver(self) -> None:
+        """Reset solver attributes if the puzzle is determined to be unsolvable."""
+        self.num_nodes = 0
+        self.solution_path = []
+        self.max_search_depth = 0
+        self.run_time = 0
+        self.cost = 0
+
+    def get_number_of_nodes(self) -> int:
+        """Return the total number of nodes expanded in both directions."""
+        return self.num_nodes
+
+    def get_depth(self) -> int:
+        """Return the sum of the depths reached by both searches."""
+        return self.max_search_depth
+
+    def get_runtime(self) -> float:
+        """Return the total runtime of the solution process."""
+        return self.run_time
+
+    def get_steps(self) -> Solution:
+        """Return the sequence of steps taken to solve the puzzle."""
+        return self.solution_path
+
+    def get_cost(self) -> int:
+        """Return the cost of steps taken to solve the puzzle."""
+        return int(self.cost)
+
+
+class BidirectionalBFSPuzzleSolver(BidirectionalPuzzleSolver):
+    def __init__(self, initial_state: State, board: Board = CLASSIC_BOARD):
+        """Initialize the bidirectional BFS solver with the given initial state."""
+        super().__init__(initial_state, board)
+        # Depth from each direction's root plus one, 0 for unseen states
+        self.depths = [board.new_table(), board.new_table()]
+        self.layers: List[List[int]] = [[], []]
+
+    def solve(self) -> None:
+        """Grow BFS layers from both ends, always expanding the smaller frontier."""
+        if not self.board.is_solvable(self.initial_packed):
+            self.reset_solver()
+            return
+
+        timer_started = self.start_time = time.perf_counter()
+        board = self.board
+        layers = self.layers = [[self.initial_packed], [board.goal]]
+        layer_depths = [0, 0]
+        self.depths[FORWARD][board.index(self.initial_packed)] = 1
+        self.depths[BACKWARD][board.index(board.goal)] = 1
+        best_cost = 0 if self.initial_packed == board.goal else math.inf
+        self.meeting_state = board.goal
+
+        while best_cost == math.inf and layers[FORWARD] and layers[BACKWARD]:
+            direction = FORWARD if len(layers[FORWARD]) <= len(layers[BACKWARD]) else BACKWARD
+            depths, other_depths = self.depths[direction], self.depths[1 - direction]
+            parent_moves = self.parent_moves[direction]
+            next_depth = layer_depths[direction] + 1
+            self.max_search_depth = layer_depths[FORWARD] + layer_depths[BACKWARD] + 1
+            next_layer = []
+            # Finish the whole layer: the cheapest meeting found in it is optimal
+            for state in layers[direction]:
+                self.num_nodes += 1
+                if self.num_nodes == self.next_checkpoint:
+                    self.checkpoint(len(layers[FORWARD]) + len(layers[BACKWARD]), next_depth - 1)
+                for neighbor, move in board.successors(state):
+                    neighbor_index = board.index(neighbor)
+                    if depths[neighbor_index]:
+                        continue
+                    depths[neighbor_index] = next_depth + 1
+                    parent_moves[neighbor_index] = move + 1
+                    next_layer.append(neighbor)
+                    if other_depths[neighbor_index]:
+                        cost = next_depth + other_depths[neighbor_index] - 1
+                        if cost < best_cost:
+                            best_cost = cost
+                            self.meeting_state = neighbor
+            layers[direction] = next_layer
+            layer_depths[direction] = next_depth
+
+        self.max_search_depth = layer_depths[FORWARD] + layer_depths[BACKWARD]
+        if best_cost == math.inf:
+            self.reset_solver()
+            return
+        self.solution = self.splice_path(self.meeting_state)
+        self.cost = best_cost
+        self.run_time = time.perf_counter() - timer_started
+
+    def open_states(self) -> Iterable[int]:
+        return self.layers[FORWARD]
+
+
+class BidirectionalAStarPuzzleSolver(BidirectionalPuzzleSolver):
+    def __init__(self, initial_state: State, heuristic: Callable[[int], float], board: Board = CLASSIC_BOARD):
+        """Initialize front-to-end bidirectional A*; heuristic must be one with per-tile tables."""
+        super().__init__(initial_state, board)
+        self.heuristic = heuristic
+        # Forward estimates distance to the goal, backward estimates distance to the initial state
+        self.tables = [heuristic_table(heuristic, board),
+                       heuristic_table_towards(heuristic, self.initial_packed, board)]
+        queue_class = BucketQueue if heuristic in INTEGER_HEURISTICS else LazyHeapQueue
+        self.frontiers = [queue_class(), queue_class()]
+        self.state_flags = [board.new_table(), board.new_table()]
+        self.g_cost = [board.new_table(), board.new_table()]
+
+    def solve(self) -> None:
+        """Alternate A* steps from both ends until no open node can improve the best meeting."""
+        if not self.board.is_solvable(self.initial_packed):
+            self.reset_solver()
+            return
+
+        timer_started = self.start_time = time.perf_counter()
+        board = self.board
+        max_depths = [0, 0]
+        for direction, root in ((FORWARD, self.initial_packed), (BACKWARD, board.goal)):
+            root_h = packed_heuristic(self.tables[direction], root, board)
+            self.state_flags[direction][board.index(root)] = FRONTIER
+            self.frontiers[direction].push(root_h, (root, 0, root_h))
+        best_cost = 0 if self.initial_packed == board.goal else math.inf
+        self.meeting_state = board.goal
+
+        while self.frontiers[FORWARD] and self.frontiers[BACKWARD]:
+            direction = FORWARD if len(self.frontiers[FORWARD]) <= len(self.frontiers[BACKWARD]) else BACKWARD
+            state_cost, (state, depth, state_h) = self.frontiers[direction].pop()
+            state_index = board.index(state)
+            flags = self.state_flags[direction]
+            if flags[state_index] == EXPLORED or depth != self.g_cost[direction][state_index]:
+                continue
+            # The popped f is this side's smallest: no unfound path can be cheaper than the best meeting
+            if state_cost >= best_cost:
+                break
+            flags[state_index] = EXPLORED
+            self.num_nodes += 1
+            max_depths[direction] = max(max_depths[direction], depth)
+            self.max_search_depth = max_depths[FORWARD] + max_depths[BACKWARD]
+            if self.num_nodes == self.next_checkpoint:
+                self.checkpoint(sum(self.get_frontier_sizes()), depth, state_cost)
+            best_cost = self.expand_state(direction, state, depth, state_h, best_cost)
+
+        if best_cost == math.inf:
+            self.reset_solver()
+            return
+        self.solution = self.splice_path(self.meeting_state)
+        self.cost = best_cost
+        self.run_time = time.perf_counter() - timer_started
+
+    def expand_state(self, direction: int, state: int, depth: int, state_h: float, best_cost: float) -> float:
+        """Push the neighbors of state in one direction and return the updated best meeting cost."""
+        board = self.board
+        flags, g_cost = self.state_flags[direction], self.g_cost[direction]
+        other_flags, other_g_cost = self.state_flags[1 - direction], self.g_cost[1 - direction]
+        parent_moves = self.parent_moves[direction]
+        table = self.tables[direction]
+        zero_pos = state & board.blank_mask
+        new_depth = depth + 1
+        for neighbor, move, tile, tile_pos in board.tile_moves(state):
+            neighbor_index = board.index(neighbor)
+            flag = flags[neighbor_index]
+            if flag == UNSEEN or (flag == FRONTIER and new_depth < g_cost[neighbor_index]):
+                flags[neighbor_index] = FRONTIER
+                g_cost[neighbor_index] = new_depth
+                parent_moves[neighbor_index] = move + 1
+                neighbor_h = heuristic_delta(table, state_h, tile, tile_pos, zero_pos)
+                self.frontiers[direction].push(new_depth + neighbor_h, (neighbor, new_depth, neighbor_h))
+            if other_flags[neighbor_index] != UNSEEN:
+                cost = g_cost[neighbor_index] + other_g_cost[neighbor_index]
+                if cost < best_cost:
+                    best_cost = cost
+                    self.meeting_state = neighbor
+        return best_cost
+
+    def closest_state(self) -> Tuple[int, float]:
+        """Return the forward frontier state with the lowest estimate of its distance to the goal."""
+        if len(self.frontiers[FORWARD]) == 0:
+            return self.initial_packed, packed_heuristic(self.tables[FORWARD], self.initial_packed, self.board)
+        state, _, state_h = min(self.frontiers[FORWARD], key=lambda item: item[2])
+        return state, state_h
+
+    def get_frontier_sizes(self) -> Tuple[int, int]:
+        """Return the number of entries in the forward and backward open lists."""
+        return len(self.frontiers[FORWARD]), len(self.frontiers[BACKWARD])
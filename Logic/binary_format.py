@@ -0,0 +1,207 @@
+"""Compact binary files for batches of puzzles and their solutions.
+
+Both files start with a 16-byte header: a 4-byte magic, the format
+version, the board's rows and cols, one reserved byte and the record
+count as a little-endian uint64.
+
+A state file (magic b"8PZS") follows with one little-endian uint32
+permutation rank per puzzle, so it only holds ranked boards (at most
+9 cells). A solution file (magic b"8PZR") follows with one record per
+puzzle: the start rank (uint32), a status code (uint8) and the move count
+(uint32), then the blank moves packed four to a byte, two bits each in
+MOVE_NAMES order (R, D, L, U), lowest bits first. Inputs that are not
+states of the board are recorded with rank INVALID_RANK.
+
+Readers memory-map the file and decode records only as they are
+iterated, so inputs of tens of millions of puzzles are never parsed as
+text or held in memory as state lists.
+"""
+import mmap
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.solution import Solution
+
+STATES_MAGIC = b"8PZS"
+SOLUTIONS_MAGIC = b"8PZR"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBBxQ")
+RANK = struct.Struct("<I")
+RECORD = struct.Struct("<IBI")
+# Start rank recorded for inputs that are not states of the board (status "error")
+INVALID_RANK = 0xFFFFFFFF
+# Index in this tuple is the status code stored in solution records
+STATUSES = ("solved", "unsolvable", "cancelled", "budget_exhausted", "error")
+# Ranks decoded per struct.iter_unpack call while streaming a state file
+READ_CHUNK = 1 << 16
+
+
+def pack_moves(moves: Sequence[int]) -> bytes:
+    """Pack blank moves (0-3) four to a byte, the first move in the lowest two bits."""
+    packed = bytearray((len(moves) + 3) // 4)
+    for index, move in enumerate(moves):
+        packed[index >> 2] |= move << ((index & 3) << 1)
+    return bytes(packed)
+
+
+def unpack_moves(data: bytes, count: int) -> List[int]:
+    """Inverse of pack_moves for the first count moves of data."""
+    return [(data[index >> 2] >> ((index & 3) << 1)) & 3 for index in range(count)]
+
+
+def _check_ranked(board: Board) -> None:
+    if not board.ranked:
+        raise ValueError(f"Binary puzzle files store 4-byte ranks and need at most 9 cells, got {board}")
+
+
+def _write_header(file: BinaryIO, magic: bytes, board: Board, count: int) -> None:
+    file.seek(0)
+    file.write(HEADER.pack(magic, FORMAT_VERSION, board.rows, board.cols, count))
+
+
+class _MappedFile:
+    """Read-only memory map of a binary puzzle file with its header parsed."""
+
+    def __init__(self, path: str, magic: bytes):
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is too short for a puzzle file header")
+        file_magic, version, rows, cols, self.count = HEADER.unpack_from(self.data)
+        if file_magic != magic or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} {magic.decode()} file")
+        self.path = path
+        self.board = Board(rows, cols)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class StateFile(_MappedFile):
+    """Memory-mapped batch of puzzles, one 4-byte rank each, with random access and streaming."""
+
+    def __init__(self, path: str):
+        super().__init__(path, STATES_MAGIC)
+        if len(self.data) != HEADER.size + RANK.size * self.count:
+            self.close()
+            raise ValueError(f"{path} should hold {self.count} ranks")
+
+    def rank(self, index: int) -> int:
+        if not 0 <= index < self.count:
+            raise IndexError(f"puzzle index {index} out of range")
+        return RANK.unpack_from(self.data, HEADER.size + RANK.size * index)[0]
+
+    def __getitem__(self, index: int) -> State:
+        return self.board.decode(self.board.unrank(self.rank(index)))
+
+    def ranks(self) -> Iterator[int]:
+        """Stream the ranks in file order, copying and decoding READ_CHUNK at a time from the map.
+
+        The chunks are copies rather than views, so the file can be closed
+        while an iterator is still suspended.
+        """
+        end = HEADER.size + RANK.size * self.count
+        for start in range(HEADER.size, end, RANK.size * READ_CHUNK):
+            for (rank,) in RANK.iter_unpack(self.data[start:min(end, start + RANK.size * READ_CHUNK)]):
+                yield rank
+
+    def __iter__(self) -> Iterator[State]:
+        for rank in self.ranks():
+            yield self.board.decode(self.board.unrank(rank))
+
+
+def write_states(path: str, states: Iterable[State], board: Board = CLASSIC_BOARD) -> int:
+    """Stream states into a state file and return how many were written."""
+    _check_ranked(board)
+    count = 0
+    with open(path, "wb") as file:
+        _write_header(file, STATES_MAGIC, board, 0)
+        for state in states:
+            file.write(RANK.pack(board.rank(board.encode(state))))
+            count += 1
+        _write_header(file, STATES_MAGIC, board, count)
+    return count
+
+
+class SolutionRecord(NamedTuple):
+    state: Optional[State]  # None for inputs recorded with INVALID_RANK
+    status: str
+    moves: List[int]  # Blank moves from state, empty unless solved
+    board: Board = CLASSIC_BOARD  # The board of the file the record was read from
+
+    def solution(self) -> Solution:
+        """The moves as a Solution from the recorded state, decoded lazily."""
+        if self.status != "solved":
+            return Solution(board=self.board)
+        return Solution.from_moves(self.board.encode(self.state), self.moves, self.board)
+
+    def solution_path(self) -> List[State]:
+        """Replay the moves into the full list of states, as solve_puzzle returns it."""
+        return self.solution().solution_path
+
+
+class SolutionWriter:
+    """Append solve results to a solution file; the record count is written on close."""
+
+    def __init__(self, path: str, board: Board = CLASSIC_BOARD):
+        _check_ranked(board)
+        self.board = board
+        self.count = 0
+        self.file = open(path, "wb")
+        _write_header(self.file, SOLUTIONS_MAGIC, board, 0)
+
+    def write(self, state: State, result: dict) -> None:
+        board = self.board
+        try:
+            rank = board.rank(board.encode(state))
+        except ValueError:  # Unparsable text, or not a state of the board
+            rank = INVALID_RANK
+        moves = []
+        if result["status"] == "solved":
+            solution = result.get("solution") or Solution.from_path(result["solution_path"], board)
+            moves = solution.move_codes()
+        self.file.write(RECORD.pack(rank, STATUSES.index(result["status"]), len(moves)))
+        self.file.write(pack_moves(moves))
+        self.count += 1
+
+    def close(self) -> None:
+        if not self.file.closed:
+            _write_header(self.file, SOLUTIONS_MAGIC, self.board, self.count)
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SolutionFile(_MappedFile):
+    """Memory-mapped solution file, decoded record by record as it is iterated."""
+
+    def __init__(self, path: str):
+        super().__init__(path, SOLUTIONS_MAGIC)
+
+    def __iter__(self) -> Iterator[SolutionRecord]:
+        board = self.board
+        offset = HEADER.size
+        for _ in range(self.count):
+            rank, status, move_count = RECORD.unpack_from(self.data, offset)
+            offset += RECORD.size
+            move_bytes = (move_count + 3) // 4
+            moves = unpack_moves(self.data[offset:offset + move_bytes], move_count)
+            offset += move_bytes
+            state = None if rank == INVALID_RANK else board.decode(board.unrank(rank))
+            yield SolutionRecord(state, STATUSES[status], moves, board)
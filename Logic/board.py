@@ -0,0 +1,291 @@
+from itertools import permutations
+from math import factorial
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# Moves of the blank, in the order the solvers expand them.
+RIGHT, DOWN, LEFT, UP = 0, 1, 2, 3
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+OPPOSITE_MOVE = [LEFT, UP, RIGHT, DOWN]
+MOVE_NAMES = "RDLU"
+
+# Boards with more cells than this are not ranked: n! no longer fits in a flat buffer.
+MAX_RANKED_SIZE = 9
+# Boards with at most this many cells can also be written as a decimal integer (one digit per tile).
+MAX_DECIMAL_SIZE = 10
+
+State = Union[int, Sequence[int]]
+
+
+class SparseTable(dict):
+    """Dict stand-in for a zero-initialized bytearray, used when states cannot be ranked."""
+
+    def __missing__(self, key: int) -> int:
+        return 0
+
+
+class Board:
+    """Geometry and packed state encoding of a rows x cols sliding puzzle.
+
+    The goal has the blank in the top-left corner followed by tiles 1..n-1 in
+    row-major order, i.e. 12345678 on the 3x3 board. A packed state keeps the
+    blank position in the lowest field and the tile at position p in field
+    p + 1, each field tile_bits wide (four bits up to 4x4, five up to 5x6).
+    """
+
+    def __init__(self, rows: int = 3, cols: int = 3):
+        if rows < 2 or cols < 2:
+            raise ValueError(f"Unsupported board size: {rows}x{cols}")
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.tile_bits = max(4, (self.size - 1).bit_length())
+        self.tile_mask = (1 << self.tile_bits) - 1
+        self.blank_mask = self.tile_mask
+        self.move_table = self._build_move_table()
+        self.move_by_direction = self._build_move_by_direction()
+        self.goal = self.pack_tiles(range(self.size))
+        self.goal_state = self.decode(self.goal)
+
+        # Ranked boards index per-state data by permutation rank in flat buffers
+        self.ranked = self.size <= MAX_RANKED_SIZE
+        self.state_space_size = factorial(self.size)
+        if self.ranked:
+            self._prefix_length = self.size // 2
+            self._prefix_mask = (1 << (self._prefix_length * self.tile_bits)) - 1
+            self._suffix_shift = (self._prefix_length + 1) * self.tile_bits
+
+    def __getattr__(self, name: str):
+        # Rank tables are built on first use, so processes that never rank a state skip their cost
+        if name in ("_prefix_ranks", "_suffix_ranks") and self.ranked:
+            self._prefix_ranks, self._suffix_ranks = self._build_rank_tables()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        return f"Board({self.rows}, {self.cols})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Board) and (self.rows, self.cols) == (other.rows, other.cols)
+
+    def __hash__(self) -> int:
+        return hash((self.rows, self.cols))
+
+    def __reduce__(self):
+        # Pickle the dimensions only: the tables are rebuilt on demand, and every result that
+        # crosses a process boundary would otherwise carry its own copy of the rank tables
+        return _shared_board, (self.rows, self.cols)
+
+    def _build_move_table(self) -> List[Tuple[Tuple[int, int, int], ...]]:
+        """Precompute (new blank position, shift of the moved tile, move) for every blank position."""
+        table = []
+        for zero_pos in range(self.size):
+            row, col = divmod(zero_pos, self.cols)
+            moves = []
+            for move, (d_row, d_col) in enumerate(DIRECTIONS):
+                new_row, new_col = row + d_row, col + d_col
+                if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
+                    new_zero_pos = new_row * self.cols + new_col
+                    moves.append((new_zero_pos, (new_zero_pos + 1) * self.tile_bits, move))
+            table.append(tuple(moves))
+        return table
+
+    def _build_move_by_direction(self) -> List[List[Optional[Tuple[int, int]]]]:
+        """Index the move table by direction, with None where the move leaves the board."""
+        table = [[None] * len(DIRECTIONS) for _ in range(self.size)]
+        for zero_pos, moves in enumerate(self.move_table):
+            for new_zero_pos, shift, move in moves:
+                table[zero_pos][move] = (new_zero_pos, shift)
+        return table
+
+    def _build_rank_tables(self) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """Precompute the Lehmer-code contribution of the first and the last board positions.
+
+        The digit of a prefix position only depends on the tiles before it and the
+        digit of a suffix position only on the tiles after it, so the rank splits
+        into two independent lookups.
+        """
+        prefix_ranks = {}
+        for tiles in permutations(range(self.size), self._prefix_length):
+            key = index = 0
+            for pos, tile in enumerate(tiles):
+                digit = tile - sum(1 for earlier in tiles[:pos] if earlier < tile)
+                index += digit * factorial(self.size - 1 - pos)
+                key |= tile << (pos * self.tile_bits)
+            prefix_ranks[key] = index
+
+        suffix_ranks = {}
+        suffix_length = self.size - self._prefix_length
+        for tiles in permutations(range(self.size), suffix_length):
+            key = index = 0
+            for pos, tile in enumerate(tiles):
+                digit = sum(1 for later in tiles[pos + 1:] if later < tile)
+                index += digit * factorial(suffix_length - 1 - pos)
+                key |= tile << (pos * self.tile_bits)
+            suffix_ranks[key] = index
+        return prefix_ranks, suffix_ranks
+
+    def pack_tiles(self, tiles: Sequence[int]) -> int:
+        """Pack a row-major sequence of tiles (0 for the blank)."""
+        packed = 0
+        zero_pos = 0
+        for pos, tile in enumerate(tiles):
+            packed |= tile << ((pos + 1) * self.tile_bits)
+            if tile == 0:
+                zero_pos = pos
+        return packed | zero_pos
+
+    def unpack_tiles(self, packed: int) -> Tuple[int, ...]:
+        """Return the row-major tiles of a packed state."""
+        tiles = []
+        packed >>= self.tile_bits
+        for _ in range(self.size):
+            tiles.append(packed & self.tile_mask)
+            packed >>= self.tile_bits
+        return tuple(tiles)
+
+    def encode(self, state: State) -> int:
+        """Pack a state given as a decimal integer (small boards only) or as a sequence of tiles."""
+        if isinstance(state, int):
+            if self.size > MAX_DECIMAL_SIZE:
+                raise ValueError(f"{self} states must be given as a sequence of tiles")
+            if not 0 <= state < 10 ** self.size:
+                raise ValueError(f"Not a {self} state: {state}")
+            tiles = []
+            remaining = state
+            for _ in range(self.size):
+                remaining, tile = divmod(remaining, 10)
+                tiles.append(tile)
+            tiles.reverse()
+            if sorted(tiles) != list(range(self.size)):
+                raise ValueError(f"Not a {self} state: {state}")
+            return self.pack_tiles(tiles)
+        if len(state) != self.size or sorted(state) != list(range(self.size)):
+            raise ValueError(f"Not a {self} state: {state}")
+        return self.pack_tiles(state)
+
+    def decode(self, packed: int) -> State:
+        """Inverse of encode: a decimal integer on small boards, a tuple of tiles otherwise."""
+        tiles = self.unpack_tiles(packed)
+        if self.size > MAX_DECIMAL_SIZE:
+            return tiles
+        state = 0
+        for tile in tiles:
+            state = state * 10 + tile
+        return state
+
+    def neighbors(self, packed: int) -> List[int]:
+        """Generate the packed neighbor states by sliding a tile into the blank."""
+        zero_pos = packed & self.blank_mask
+        zero_shift = (zero_pos + 1) * self.tile_bits
+        neighbors_list = []
+        for new_zero_pos, shift, _ in self.move_table[zero_pos]:
+            tile = (packed >> shift) & self.tile_mask
+            neighbors_list.append(packed - zero_pos + new_zero_pos + (tile << zero_shift) - (tile << shift))
+        return neighbors_list
+
+    def successors(self, packed: int) -> List[Tuple[int, int]]:
+        """Generate (neighbor, move) pairs for a packed state, in the same order as neighbors."""
+        zero_pos = packed & self.blank_mask
+        zero_shift = (zero_pos + 1) * self.tile_bits
+        successors_list = []
+        for new_zero_pos, shift, move in self.move_table[zero_pos]:
+            tile = (packed >> shift) & self.tile_mask
+            successors_list.append((packed - zero_pos + new_zero_pos + (tile << zero_shift) - (tile << shift), move))
+        return successors_list
+
+    def tile_moves(self, packed: int) -> List[Tuple[int, int, int, int]]:
+        """Generate (neighbor, move, moved tile, tile's old position) for a packed state.
+
+        The moved tile always lands on the old blank position, packed & blank_mask.
+        """
+        zero_pos = packed & self.blank_mask
+        zero_shift = (zero_pos + 1) * self.tile_bits
+        moves = []
+        for new_zero_pos, shift, move in self.move_table[zero_pos]:
+            tile = (packed >> shift) & self.tile_mask
+            moves.append((packed - zero_pos + new_zero_pos + (tile << zero_shift) - (tile << shift),
+                          move, tile, new_zero_pos))
+        return moves
+
+    def apply_move(self, packed: int, move: int) -> int:
+        """Slide the blank of a packed state in the given direction (the move must be legal)."""
+        zero_pos = packed & self.blank_mask
+        new_zero_pos, shift = self.move_by_direction[zero_pos][move]
+        tile = (packed >> shift) & self.tile_mask
+        return packed - zero_pos + new_zero_pos + (tile << ((zero_pos + 1) * self.tile_bits)) - (tile << shift)
+
+    def is_solvable(self, packed: int) -> bool:
+        """Check whether the goal can be reached from a packed state.
+
+        On boards with an odd number of columns the parity of the tile
+        inversions is invariant; with an even number of columns a vertical move
+        changes it together with the blank's row, so their sum is invariant.
+        """
+        tiles = [tile for tile in self.unpack_tiles(packed) if tile != 0]
+        inversions = sum(1 for i in range(len(tiles)) for j in range(i + 1, len(tiles)) if tiles[i] > tiles[j])
+        if self.cols % 2 == 0:
+            inversions += (packed & self.blank_mask) // self.cols
+        return inversions % 2 == 0
+
+    def rank(self, packed: int) -> int:
+        """Return the permutation rank of a packed state on a ranked board, in [0, state_space_size)."""
+        return (self._prefix_ranks[(packed >> self.tile_bits) & self._prefix_mask]
+                + self._suffix_ranks[packed >> self._suffix_shift])
+
+    def unrank(self, index: int) -> int:
+        """Return the packed state with the given permutation rank."""
+        remaining = list(range(self.size))
+        tiles = []
+        for pos in range(self.size):
+            digit, index = divmod(index, factorial(self.size - 1 - pos))
+            tiles.append(remaining.pop(digit))
+        return self.pack_tiles(tiles)
+
+    def index(self, packed: int) -> int:
+        """Key for per-state tables: the rank on ranked boards, the packed state itself otherwise."""
+        if self.ranked:
+            return self.rank(packed)
+        return packed
+
+    def new_table(self):
+        """Return a zeroed per-state table addressed by index(): a flat bytearray when ranked."""
+        if self.ranked:
+            return bytearray(self.state_space_size)
+        return SparseTable()
+
+    def moves_from_parents(self, goal: int, parent_moves) -> List[int]:
+        """Walk parent moves (stored as move + 1, 0 for the root) back from goal; return the moves from the root."""
+        moves = []
+        current_state = goal
+        move = parent_moves[self.index(current_state)]
+        while move:
+            moves.append(move - 1)
+            current_state = self.apply_move(current_state, OPPOSITE_MOVE[move - 1])
+            move = parent_moves[self.index(current_state)]
+        moves.reverse()
+        return moves
+
+    def moves_along(self, path: Sequence[int]) -> List[int]:
+        """Return the blank moves leading through a path of packed states."""
+        step_moves = {1: RIGHT, self.cols: DOWN, -1: LEFT, -self.cols: UP}
+        return [step_moves[(after & self.blank_mask) - (before & self.blank_mask)]
+                for before, after in zip(path, path[1:])]
+
+    def path_from_start(self, start: int, moves: Sequence[int]) -> List[int]:
+        """Replay blank moves from a packed start state and return the packed path."""
+        path = [start]
+        for move in moves:
+            path.append(self.apply_move(path[-1], move))
+        return path
+
+
+CLASSIC_BOARD = Board(3, 3)
+# Boards rebuilt from pickles, one per size, so unpickled results share their tables
+_shared_boards: Dict[Tuple[int, int], Board] = {(3, 3): CLASSIC_BOARD}
+
+
+def _shared_board(rows: int, cols: int) -> Board:
+    board = _shared_boards.get((rows, cols))
+    if board is None:
+        board = _shared_boards[rows, cols] = Board(rows, cols)
+    return board
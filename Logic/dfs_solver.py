@@ -1,40 +1,44 @@
 import time
-from typing import Tuple, Dict
+from typing import Iterable, Tuple
+from Logic.board import CLASSIC_BOARD, Board, State
 from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
 from Logic.utils import *
 
 
 class DFSPuzzleSolver(PuzzleSolver):
-    def __init__(self, initial_state: int):
+    def __init__(self, initial_state: State, board: Board = CLASSIC_BOARD):
         """Initialize the DFS Puzzle Solver with the given initial state."""
-        super().__init__(initial_state)
+        super().__init__(initial_state, board)
+        self.seen = board.new_table()  # Explored or frontier flags indexed by state rank
+        self.parent_moves = board.new_table()  # Move that reached each state, plus one
+        self.stack: List[Tuple[int, int]] = []  # (state, depth) pairs still to expand
 
     def solve(self) -> None:
         """Solve the puzzle using the Depth-First Search (DFS) algorithm."""
-        if not is_solvable(self.initial_state):
+        if not self.board.is_solvable(self.initial_packed):
             self.reset_solver()
             return
 
-        timer_started = time.perf_counter()
-        stack_frontier: List[Tuple[int, int]] = [(self.initial_state, 0)]
-        self.frontier_set.add(self.initial_state)
-        child_parent_map: Dict[int, int] = {}
-        self.explored_set = set()
+        timer_started = self.start_time = time.perf_counter()
+        stack_frontier = self.stack = [(self.initial_packed, 0)]
+        self.seen[self.board.index(self.initial_packed)] = 1
 
         # DFS loop
         while stack_frontier:
             state, depth = stack_frontier.pop()
-            self.frontier_set.remove(state)
-            self.explored_set.add(state)
             self.num_nodes += 1
             self.max_search_depth = max(self.max_search_depth, depth)
 
-            if state == self.goal_state:
-                self.solution_path = self.get_path(child_parent_map, state)
+            if state == self.board.goal:
+                self.solution = self.get_path(state)
                 self.cost = depth
                 break
 
-            self.expand_state(state, stack_frontier, depth, child_parent_map)
+            if self.num_nodes == self.next_checkpoint:
+                self.checkpoint(len(stack_frontier), depth)
+
+            self.expand_state(state, stack_frontier, depth)
 
         self.run_time = time.perf_counter() - timer_started
 
@@ -46,30 +50,22 @@ class DFSPuzzleSolver(PuzzleSolver):
         self.run_time = 0
         self.cost = 0
 
-    def expand_state(self, state: int, stack: List[Tuple[int, int]],
-                     current_depth: int, child_parent_map: Dict[int, int]) -> None:
+    def expand_state(self, state: int, stack: List[Tuple[int, int]], current_depth: int) -> None:
         """Expand the current state by finding its valid neighbors and add them to the stack."""
-        for neighbor in get_neighbors(state):
-            # Check if the neighbor is already in explored_set or stack_frontier
-            # if neighbor not in self.explored_set and not any(neighbor == s[0] for s in stack):
-            if neighbor not in self.explored_set and neighbor not in self.frontier_set:
+        for neighbor, move in self.board.successors(state):
+            # Check if the neighbor is already explored or on the stack
+            neighbor_rank = self.board.index(neighbor)
+            if not self.seen[neighbor_rank]:
                 stack.append((neighbor, current_depth + 1))
-                self.frontier_set.add(neighbor)
-                child_parent_map[neighbor] = state
-
-    def get_path(self, child_parent_map: Dict[int, int], goal_state: int) -> List[int]:
-        """Reconstruct the solution path from the goal state back to the initial state."""
-        path = []
-        current_state = goal_state
+                self.seen[neighbor_rank] = 1
+                self.parent_moves[neighbor_rank] = move + 1
 
-        while current_state in child_parent_map:
-            path.append(current_state)
-            current_state = child_parent_map[current_state]
+    def open_states(self) -> Iterable[int]:
+        return (state for state, _ in self.stack)
 
-        path.append(self.initial_state)
-        path.reverse()
-
-        return path
+    def get_path(self, goal_state: int) -> Solution:
+        """Reconstruct the solution path from the goal state back to the initial state."""
+        return self.solution_from_moves(goal_state, self.parent_moves)
 
     def get_number_of_nodes(self) -> int:
         """Return the total number of nodes explored during the search."""
@@ -83,7 +79,7 @@ class DFSPuzzleSolver(PuzzleSolver):
         """Return the total runtime of the solution process."""
         return self.run_time
 
-    def get_steps(self) -> List[int]:
+    def get_steps(self) -> Solution:
         """Return the sequence of steps taken to solve the puzzle."""
         return self.solution_path
 
@@ -0,0 +1,117 @@
+import mmap
+import os
+import time
+from typing import Dict
+
+from Logic.board import CLASSIC_BOARD, Board
+from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
+from Logic.utils import *
+
+DATABASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "distances.bin")
+UNREACHABLE = 0xFF
+
+# Mapped databases by absolute path, each mapped once per process
+_databases: Dict[str, mmap.mmap] = {}
+
+
+def build_distance_database(path: str = DATABASE_PATH) -> None:
+    """Run one BFS from the goal and write the optimal distance of every ranked state, one byte each."""
+    distances = bytearray([UNREACHABLE]) * STATE_SPACE_SIZE
+    distances[rank(GOAL_PACKED)] = 0
+    layer = [GOAL_PACKED]
+    depth = 0
+    while layer:
+        depth += 1
+        next_layer = []
+        for state in layer:
+            for neighbor in packed_neighbors(state):
+                neighbor_rank = rank(neighbor)
+                if distances[neighbor_rank] == UNREACHABLE:
+                    distances[neighbor_rank] = depth
+                    next_layer.append(neighbor)
+        layer = next_layer
+
+    # Write to a temporary file first so readers never map a half-written table
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(distances)
+    os.replace(temp_path, path)
+
+
+def load_distance_database(path: str = DATABASE_PATH) -> mmap.mmap:
+    """Memory-map the distance database read-only, building it once if the file does not exist."""
+    path = os.path.abspath(path)
+    database = _databases.get(path)
+    if database is None:
+        if not os.path.exists(path):
+            build_distance_database(path)
+        with open(path, "rb") as file:
+            database = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(database) != STATE_SPACE_SIZE:
+            database.close()
+            raise ValueError(f"Corrupt distance database at {path}: expected {STATE_SPACE_SIZE} bytes")
+        _databases[path] = database
+    return database
+
+
+class DatabasePuzzleSolver(PuzzleSolver):
+    def __init__(self, initial_state: int, board: Board = CLASSIC_BOARD):
+        """Initialize the database solver with the given initial state."""
+        if board != CLASSIC_BOARD:
+            raise ValueError("The distance database only covers the 3x3 board")
+        super().__init__(initial_state, board)
+
+    def solve(self) -> None:
+        """Look up the optimal cost and walk downhill through neighbors to the goal."""
+        if not self.board.is_solvable(self.initial_packed):
+            self.reset_solver()
+            return
+
+        timer_started = time.perf_counter()
+        database = load_distance_database()
+        state = self.initial_packed
+        distance = database[rank(state)]
+        self.cost = distance
+        self.max_search_depth = distance
+        path = [state]
+
+        while distance:
+            self.num_nodes += 1
+            for neighbor in packed_neighbors(state):
+                if database[rank(neighbor)] == distance - 1:
+                    state = neighbor
+                    distance -= 1
+                    break
+            path.append(state)
+        self.solution = Solution.from_packed_path(path, self.board)
+
+        self.run_time = time.perf_counter() - timer_started
+
+    def reset_solver(self) -> None:
+        """Reset solver attributes if the puzzle is determined to be unsolvable."""
+        self.num_nodes = 0
+        self.solution_path = []
+        self.max_search_depth = 0
+        self.run_time = 0
+        self.cost = 0
+
+    def get_number_of_nodes(self) -> int:
+        """Return the number of states expanded while walking down the database."""
+        return self.num_nodes
+
+    def get_depth(self) -> int:
+        """Return the depth of the solution."""
+        return self.max_search_depth
+
+    def get_runtime(self) -> float:
+        """Return the total runtime of the lookup."""
+        return self.run_time
+
+    def get_steps(self) -> Solution:
+        """Return the sequence of steps taken to solve the puzzle."""
+        return self.solution_path
+
+    def get_cost(self) -> int:
+        """Return the optimal cost read from the database."""
+        return self.cost
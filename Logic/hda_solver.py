@@ -0,0 +1,314 @@
+import math
+import multiprocessing
+import os
+import random
+import time
+import traceback
+from queue import Empty
+from typing import Callable, Dict, List, Optional
+
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.heuristics import INTEGER_HEURISTICS, heuristic_delta, heuristic_table, packed_evaluator
+from Logic.priority_queues import BucketQueue, LazyHeapQueue
+from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
+from Logic.utils import *
+
+# Children bound for the same worker are sent together once this many are pending
+DEFAULT_BATCH_SIZE = 64
+# Expansions between two looks at the inbox
+EXPANSIONS_PER_ROUND = 256
+# Expansions between two status messages to the coordinator
+STATUS_INTERVAL = 1000
+ZOBRIST_SEED = 0x5EED
+
+
+def zobrist_keys(board: Board, seed: int = ZOBRIST_SEED) -> List[List[int]]:
+    """Return KEYS[pos][tile], random 64-bit words whose XOR over a board hashes the state."""
+    rng = random.Random(seed)
+    return [[rng.getrandbits(64) for _ in range(board.size)] for _ in range(board.size)]
+
+
+def zobrist_hash(keys: List[List[int]], packed: int, board: Board = CLASSIC_BOARD) -> int:
+    """Zobrist hash of a packed state; children update it with four XORs instead."""
+    value = 0
+    for pos, tile in enumerate(board.unpack_tiles(packed)):
+        value ^= keys[pos][tile]
+    return value
+
+
+def _hda_worker(worker_id: int, board: Board, heuristic: Callable, keys: List[List[int]], inboxes: list,
+                control, incumbent, batch_size: int) -> None:
+    """Run one HDA* worker: own the states hashing to worker_id and expand them in local f order.
+
+    Inbox messages are ("nodes", [(state, hash, g, h, move + 1), ...]),
+    ("probe", wave), ("trace", state) and ("stop",). The worker answers on
+    the control queue and counts node batches sent and received so the
+    coordinator can detect termination.
+    """
+    try:
+        num_workers = len(inboxes)
+        inbox = inboxes[worker_id]
+        for queue in inboxes:
+            # Batches still queued for a stopped peer must not keep this process alive
+            queue.cancel_join_thread()
+        table = heuristic_table(heuristic, board)
+        evaluate = packed_evaluator(heuristic, board)
+        frontier = BucketQueue() if heuristic in INTEGER_HEURISTICS else LazyHeapQueue()
+        g_cost: Dict[int, int] = {}
+        parent_moves: Dict[int, int] = {}
+        outboxes: List[list] = [[] for _ in range(num_workers)]
+        goal = board.goal
+        sent = received = expansions = max_depth = 0
+        next_status = STATUS_INTERVAL
+
+        def insert(state: int, state_hash: int, depth: int, state_h: float, move: int) -> None:
+            # States may be reopened: workers only expand in local f order, so a cheaper path can arrive late
+            if depth >= g_cost.get(state, math.inf):
+                return
+            g_cost[state] = depth
+            parent_moves[state] = move
+            if state == goal:
+                with incumbent.get_lock():
+                    incumbent.value = min(incumbent.value, depth)
+            else:
+                frontier.push(depth + state_h, (state, state_hash, depth, state_h))
+
+        def flush(owner: int) -> None:
+            nonlocal sent
+            inboxes[owner].put(("nodes", outboxes[owner]))
+            outboxes[owner] = []
+            sent += 1
+
+        while True:
+            bound = incumbent.value
+            idle = len(frontier) == 0 or frontier.peek_priority() >= bound
+            messages = [inbox.get()] if idle else []
+            while True:
+                try:
+                    messages.append(inbox.get_nowait())
+                except Empty:
+                    break
+
+            for message in messages:
+                kind = message[0]
+                if kind == "nodes":
+                    received += 1
+                    for node in message[1]:
+                        insert(*node)
+                elif kind == "probe":
+                    bound = incumbent.value
+                    idle = len(frontier) == 0 or frontier.peek_priority() >= bound
+                    control.put(("probe", message[1], worker_id, idle, sent, received))
+                elif kind == "trace":
+                    control.put(("trace", parent_moves[message[1]]))
+                elif kind == "stop":
+                    control.put(("stopped", worker_id, expansions, max_depth))
+                    return
+
+            bound = incumbent.value
+            for _ in range(EXPANSIONS_PER_ROUND):
+                if len(frontier) == 0 or frontier.peek_priority() >= bound:
+                    break
+                _, (state, state_hash, depth, state_h) = frontier.pop()
+                if depth != g_cost[state]:
+                    continue
+                expansions += 1
+                max_depth = max(max_depth, depth)
+
+                new_depth = depth + 1
+                zero_pos = state & board.blank_mask
+                for neighbor, move, tile, tile_pos in board.tile_moves(state):
+                    if table is not None:
+                        neighbor_h = heuristic_delta(table, state_h, tile, tile_pos, zero_pos)
+                    else:
+                        neighbor_h = evaluate(neighbor)
+                    if new_depth + neighbor_h >= bound:
+                        continue
+                    neighbor_hash = (state_hash ^ keys[tile_pos][tile] ^ keys[zero_pos][0]
+                                     ^ keys[zero_pos][tile] ^ keys[tile_pos][0])
+                    owner = neighbor_hash % num_workers
+                    if owner == worker_id:
+                        insert(neighbor, neighbor_hash, new_depth, neighbor_h, move + 1)
+                        bound = incumbent.value
+                    else:
+                        outboxes[owner].append((neighbor, neighbor_hash, new_depth, neighbor_h, move + 1))
+                        if len(outboxes[owner]) >= batch_size:
+                            flush(owner)
+            for owner in range(num_workers):
+                if outboxes[owner]:
+                    flush(owner)
+
+            if expansions >= next_status:
+                next_status = expansions + STATUS_INTERVAL
+                control.put(("status", worker_id, expansions, len(frontier), max_depth))
+    except Exception:
+        control.put(("error", worker_id, traceback.format_exc()))
+
+
+class HDAStarPuzzleSolver(PuzzleSolver):
+    """Hash-distributed A*: states are partitioned across worker processes by a Zobrist hash.
+
+    Each worker owns the open list and best g-costs of its states and
+    forwards generated children to their owners in batches. The first goal
+    sets a shared incumbent cost; workers then only expand nodes with
+    f below it. The search ends when every worker is out of such nodes and
+    no batch is in flight, checked with two consecutive probe waves whose
+    sent and received batch counts agree (the four-counter method), at which
+    point the incumbent is optimal for an admissible heuristic.
+    """
+
+    def __init__(self, initial_state: State, heuristic: Callable[[int], float], workers: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, board: Board = CLASSIC_BOARD):
+        super().__init__(initial_state, board)
+        self.heuristic = heuristic
+        self.evaluate = packed_evaluator(heuristic, board)
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.keys = zobrist_keys(board)
+        # Latest counts reported by each worker
+        self.worker_expansions: Dict[int, int] = {}
+        self.frontier_sizes: Dict[int, int] = {}
+
+    def owner(self, packed: int) -> int:
+        """Index of the worker that owns a packed state."""
+        return zobrist_hash(self.keys, packed, self.board) % self.workers
+
+    def solve(self) -> None:
+        """Start the workers, wait for a proven optimal cost, then trace the path back through the owners."""
+        if not self.board.is_solvable(self.initial_packed):
+            self.reset_solver()
+            return
+
+        timer_started = self.start_time = time.perf_counter()
+        if self.initial_packed == self.board.goal:
+            self.solution_path = [self.initial_state]
+            self.run_time = time.perf_counter() - timer_started
+            return
+
+        context = multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(self.workers)]
+        control = context.Queue()
+        incumbent = context.Value('d', math.inf)
+        processes = [context.Process(target=_hda_worker, daemon=True,
+                                     args=(worker_id, self.board, self.heuristic, self.keys, inboxes, control,
+                                           incumbent, self.batch_size))
+                     for worker_id in range(self.workers)]
+        for process in processes:
+            process.start()
+        try:
+            initial_hash = zobrist_hash(self.keys, self.initial_packed, self.board)
+            initial_node = (self.initial_packed, initial_hash, 0, self.evaluate(self.initial_packed), 0)
+            inboxes[initial_hash % self.workers].put(("nodes", [initial_node]))
+            self.wait_for_termination(inboxes, control, sent=1)
+            self.cost = int(incumbent.value)
+            self.solution = self.trace_path(inboxes, control)
+        finally:
+            self.stop_workers(processes, inboxes, control)
+        self.run_time = time.perf_counter() - timer_started
+
+    def receive(self, control) -> tuple:
+        """Next control message; status messages update the node count and may run a checkpoint."""
+        while True:
+            message = control.get()
+            kind = message[0]
+            if kind == "error":
+                raise RuntimeError(f"HDA* worker {message[1]} failed:\n{message[2]}")
+            if kind != "status":
+                return message
+            _, worker_id, expansions, frontier_size, max_depth = message
+            self.num_nodes += expansions - self.worker_expansions.get(worker_id, 0)
+            self.worker_expansions[worker_id] = expansions
+            self.frontier_sizes[worker_id] = frontier_size
+            self.max_search_depth = max(self.max_search_depth, max_depth)
+            # Counts arrive in steps of STATUS_INTERVAL per worker, so the checkpoint may be passed rather than hit
+            if 0 <= self.next_checkpoint <= self.num_nodes:
+                self.checkpoint(sum(self.frontier_sizes.values()), max_depth)
+
+    def wait_for_termination(self, inboxes: list, control, sent: int) -> None:
+        """Run probe waves until two in a row find every worker idle with equal, unchanged batch counts."""
+        previous = None
+        wave = 0
+        while True:
+            wave += 1
+            for inbox in inboxes:
+                inbox.put(("probe", wave))
+            replies = []
+            while len(replies) < self.workers:
+                message = self.receive(control)
+                if message[0] == "probe" and message[1] == wave:
+                    replies.append(message)
+            all_idle = all(reply[3] for reply in replies)
+            counts = (sent + sum(reply[4] for reply in replies), sum(reply[5] for reply in replies))
+            if all_idle and counts[0] == counts[1]:
+                if counts == previous:
+                    return
+                previous = counts
+            else:
+                previous = None
+                time.sleep(0.001)
+
+    def trace_path(self, inboxes: list, control) -> Solution:
+        """Follow parent moves from the goal, asking each state's owner in turn."""
+        state = self.board.goal
+        moves = []
+        while True:
+            inboxes[self.owner(state)].put(("trace", state))
+            _, move = self.receive(control)
+            if not move:
+                break
+            moves.append(move - 1)
+            state = self.board.apply_move(state, OPPOSITE_MOVE[move - 1])
+        moves.reverse()
+        return Solution.from_moves(self.initial_packed, moves, self.board)
+
+    def stop_workers(self, processes: list, inboxes: list, control) -> None:
+        """Stop every worker, collecting final expansion counts, and reap the processes."""
+        for inbox in inboxes:
+            inbox.put(("stop",))
+        stopped = 0
+        while stopped < len(processes) and any(process.is_alive() for process in processes):
+            try:
+                message = control.get(timeout=0.1)
+            except Empty:
+                continue
+            if message[0] == "stopped":
+                stopped += 1
+                _, worker_id, expansions, max_depth = message
+                self.num_nodes += expansions - self.worker_expansions.get(worker_id, 0)
+                self.worker_expansions[worker_id] = expansions
+                self.max_search_depth = max(self.max_search_depth, max_depth)
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        for inbox in inboxes:
+            inbox.cancel_join_thread()
+
+    def reset_solver(self) -> None:
+        """Reset solver attributes if the puzzle is determined to be unsolvable."""
+        self.num_nodes = 0
+        self.solution_path = []
+        self.max_search_depth = 0
+        self.run_time = 0
+        self.cost = 0
+
+    def get_number_of_nodes(self) -> int:
+        """Return the total number of nodes expanded by all workers."""
+        return self.num_nodes
+
+    def get_depth(self) -> int:
+        """Return the maximum search depth reached by any worker."""
+        return self.max_search_depth
+
+    def get_runtime(self) -> float:
+        """Return the total runtime, including starting and stopping the workers."""
+        return self.run_time
+
+    def get_steps(self) -> Solution:
+        """Return the sequence of steps taken to solve the puzzle."""
+        return self.solution_path
+
+    def get_cost(self) -> int:
+        """Return the cost of steps taken to solve the puzzle."""
+        return int(self.cost)
@@ -1,3 +1,7 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from Logic.board import CLASSIC_BOARD, Board
+
 TARGET_POSITIONS = {
     '1': (0, 1),
     '2': (0, 2),
@@ -53,6 +57,107 @@ def misplaced_tiles_heuristic(state: int) -> float:
     return misplaced_count
 
 
+# Heuristics that only take integer values, so A* can keep its frontier in a bucket queue
+INTEGER_HEURISTICS = {manhattan_heuristic, misplaced_tiles_heuristic}
+
+
+# Tile costs take the tile's target position; towards the goal that is the tile's own number
+def _manhattan_cost(board: Board, target: int, pos: int) -> int:
+    return abs(pos // board.cols - target // board.cols) + abs(pos % board.cols - target % board.cols)
+
+
+def _euclidean_cost(board: Board, target: int, pos: int) -> float:
+    return ((pos // board.cols - target // board.cols) ** 2 + (pos % board.cols - target % board.cols) ** 2) ** 0.5
+
+
+def _misplaced_cost(board: Board, target: int, pos: int) -> int:
+    return int(target != pos)
+
+
+# Heuristics that are a sum of per-tile contributions and can be updated incrementally
+_TILE_COSTS: Dict[Callable, Callable[[Board, int, int], float]] = {
+    manhattan_heuristic: _manhattan_cost,
+    euclidean_heuristic: _euclidean_cost,
+    misplaced_tiles_heuristic: _misplaced_cost,
+}
+_tile_tables: Dict[Tuple[Callable, Board], List[List[float]]] = {}
+
+
+def heuristic_table_towards(heuristic: Callable, target: int, board: Board = CLASSIC_BOARD) -> List[List[float]]:
+    """Return TABLE[tile][pos] estimating the distance to the packed target state instead of the goal."""
+    tile_cost = _TILE_COSTS.get(heuristic)
+    if tile_cost is None:
+        raise ValueError(f"{heuristic.__name__} cannot estimate distances to an arbitrary state")
+    targets = [0] * board.size
+    for pos, tile in enumerate(board.unpack_tiles(target)):
+        targets[tile] = pos
+    # The blank contributes nothing
+    table = [[0] * board.size for _ in range(board.size)]
+    for tile in range(1, board.size):
+        for pos in range(board.size):
+            table[tile][pos] = tile_cost(board, targets[tile], pos)
+    return table
+
+
+def heuristic_table(heuristic: Callable, board: Board = CLASSIC_BOARD) -> Optional[List[List[float]]]:
+    """Return TABLE[tile][pos], the contribution of tile when it sits at pos, or None if heuristic has no table."""
+    if heuristic not in _TILE_COSTS:
+        return None
+    key = (heuristic, board)
+    if key not in _tile_tables:
+        _tile_tables[key] = heuristic_table_towards(heuristic, board.goal, board)
+    return _tile_tables[key]
+
+
+MANHATTAN_TABLE = heuristic_table(manhattan_heuristic)
+EUCLIDEAN_TABLE = heuristic_table(euclidean_heuristic)
+MISPLACED_TABLE = heuristic_table(misplaced_tiles_heuristic)
+HEURISTIC_TABLES = {
+    manhattan_heuristic: MANHATTAN_TABLE,
+    euclidean_heuristic: EUCLIDEAN_TABLE,
+    misplaced_tiles_heuristic: MISPLACED_TABLE,
+}
+
+
+def packed_heuristic(table: List[List[float]], packed: int, board: Board = CLASSIC_BOARD) -> float:
+    """Evaluate a table-backed heuristic on a packed state."""
+    total = 0
+    packed >>= board.tile_bits
+    for pos in range(board.size):
+        total += table[packed & board.tile_mask][pos]
+        packed >>= board.tile_bits
+    return total
+
+
+# Heuristics evaluated directly on packed states, as factories taking the board
+_PACKED_EVALUATORS: Dict[Callable, Callable[[Board], Callable[[int], float]]] = {}
+
+
+def register_packed_evaluator(heuristic: Callable, factory: Callable[[Board], Callable[[int], float]],
+                              integer: bool = False) -> None:
+    """Let the solvers evaluate heuristic on packed states of any board through factory(board)."""
+    _PACKED_EVALUATORS[heuristic] = factory
+    if integer:
+        INTEGER_HEURISTICS.add(heuristic)
+
+
+def packed_evaluator(heuristic: Callable, board: Board = CLASSIC_BOARD) -> Callable[[int], float]:
+    """Return a function evaluating heuristic on packed states of board."""
+    table = heuristic_table(heuristic, board)
+    if table is not None:
+        return lambda packed: packed_heuristic(table, packed, board)
+    if heuristic in _PACKED_EVALUATORS:
+        return _PACKED_EVALUATORS[heuristic](board)
+    if board == CLASSIC_BOARD:
+        return lambda packed: heuristic(board.decode(packed))
+    raise ValueError(f"{heuristic.__name__} only supports the 3x3 board")
+
+
+def heuristic_delta(table: List[List[float]], parent_h: float, moved_tile: int, from_pos: int, to_pos: int) -> float:
+    """Return the child's heuristic after moved_tile slides from from_pos to to_pos, in O(1)."""
+    return parent_h - table[moved_tile][from_pos] + table[moved_tile][to_pos]
+
+
 # if __name__ == "__main__":
 #     state = 541623078
 #     print("Manhattan Heuristic:", manhattan_heuristic(state))
@@ -0,0 +1,115 @@
+import math
+import time
+from typing import Callable, Iterable, Optional
+
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.heuristics import heuristic_delta, heuristic_table, packed_evaluator
+from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
+from Logic.utils import *
+
+FOUND = -1
+EPSILON = 1e-9  # Slack for rounding error accumulated by incremental real-valued heuristics
+
+
+class IDAStarPuzzleSolver(PuzzleSolver):
+    def __init__(self, initial_state: State, heuristic: Callable[[int], float], board: Board = CLASSIC_BOARD):
+        """Initialize the IDA* Puzzle Solver with the given initial state and heuristic."""
+        super().__init__(initial_state, board)
+        self.heuristic = heuristic
+        self.heuristic_table = heuristic_table(heuristic, board)
+        self.evaluate = packed_evaluator(heuristic, board)
+        self.path: List[int] = []  # Packed states on the current search path, the only per-node memory
+
+    def solve(self) -> None:
+        """Solve the puzzle with iterative deepening on f = g + h."""
+        if not self.board.is_solvable(self.initial_packed):
+            self.reset_solver()
+            return
+
+        timer_started = self.start_time = time.perf_counter()
+        initial_packed = self.initial_packed
+        initial_h = self.evaluate(initial_packed)
+        bound = initial_h
+        self.path = [initial_packed]
+
+        while True:
+            result = self.search(initial_packed, 0, initial_h, bound, None)
+            if result == FOUND:
+                break
+            if result == math.inf:
+                self.reset_solver()
+                return
+            # Path costs are integers, so the next bound can be rounded up; this keeps
+            # real-valued heuristics such as Euclidean from adding an iteration per distinct f
+            bound = math.ceil(result - EPSILON)
+
+        self.solution = Solution.from_packed_path(self.path, self.board)
+        self.cost = self.solution.cost
+        self.run_time = time.perf_counter() - timer_started
+
+    def search(self, state: int, depth: int, state_h: float, bound: float, forbidden_move: Optional[int]) -> float:
+        """Depth-first search below the f bound; return FOUND or the smallest f that exceeded it."""
+        f_cost = depth + state_h
+        if f_cost > bound + EPSILON:
+            return f_cost
+        if state == self.board.goal:
+            return FOUND
+
+        self.num_nodes += 1
+        self.max_search_depth = max(self.max_search_depth, depth)
+        if self.num_nodes == self.next_checkpoint:
+            self.checkpoint(len(self.path), depth, bound)
+        minimum = math.inf
+        zero_pos = state & self.board.blank_mask
+        table = self.heuristic_table
+        for neighbor, move, tile, tile_pos in self.board.tile_moves(state):
+            # Never undo the move that led here
+            if move == forbidden_move:
+                continue
+            if table is not None:
+                neighbor_h = heuristic_delta(table, state_h, tile, tile_pos, zero_pos)
+            else:
+                neighbor_h = self.evaluate(neighbor)
+
+            self.path.append(neighbor)
+            result = self.search(neighbor, depth + 1, neighbor_h, bound, OPPOSITE_MOVE[move])
+            if result == FOUND:
+                return FOUND
+            self.path.pop()
+            minimum = min(minimum, result)
+        return minimum
+
+    def tracked_states(self, frontier_size: int) -> int:
+        return len(self.path)
+
+    def open_states(self) -> Iterable[int]:
+        return self.path
+
+    def reset_solver(self) -> None:
+        """Reset solver attributes if the puzzle is determined to be unsolvable."""
+        self.num_nodes = 0
+        self.solution_path = []
+        self.max_search_depth = 0
+        self.run_time = 0
+        self.cost = 0
+
+    def get_number_of_nodes(self) -> int:
+        """Return the total number of nodes expanded over all iterations."""
+        return self.num_nodes
+
+    def get_depth(self) -> int:
+        """Return the maximum search depth reached during the exploration."""
+        return self.max_search_depth
+
+    def get_runtime(self) -> float:
+        """Return the total runtime of the solution process."""
+        return self.run_time
+
+    def get_steps(self) -> Solution:
+        """Return the sequence of steps taken to solve the puzzle."""
+        return self.solution_path
+
+    def get_cost(self) -> int:
+        """Return the cost of steps taken to solve the puzzle."""
+        return self.cost
@@ -1,35 +1,39 @@
 import time
-from typing import Tuple, Dict, List
+from typing import Iterable, Tuple, Dict, List
+from Logic.board import CLASSIC_BOARD, Board, State
 from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
 from Logic.utils import *
 
 
 class IDSPuzzleSolver(PuzzleSolver):
 
-    def __init__(self, game_initial_state: int):
+    def __init__(self, game_initial_state: State, board: Board = CLASSIC_BOARD):
         """Initialize the DFS Puzzle Solver with the given initial state."""
-        super().__init__(game_initial_state)
+        super().__init__(game_initial_state, board)
+        self.stack: List[Tuple[int, int]] = []  # (state, depth) pairs still to expand in this iteration
 
     def solve(self) -> None:
-        if not is_solvable(self.initial_state):
+        if not self.board.is_solvable(self.initial_packed):
             self.reset_solver()
             return
 
-        timer_started = time.perf_counter()
+        timer_started = self.start_time = time.perf_counter()
         depth_limit = 0
         self.num_nodes = 0
         self.max_search_depth = 0
         self.run_time = 0
+        initial_packed = self.initial_packed
 
         while True:
             self.frontier_set = set()
             self.explored_set = set()
-            stack_frontier: List[Tuple[int, int]] = [(self.initial_state, 0)]
-            self.frontier_set.add((self.initial_state, 0))
-            child_parent_map: Dict[Tuple[int, int], Tuple[int, int]] = {(self.initial_state, 0): (-1, -1)}
+            stack_frontier = self.stack = [(initial_packed, 0)]
+            self.max_search_depth = depth_limit
+            self.frontier_set.add((initial_packed, 0))
+            child_parent_map: Dict[Tuple[int, int], Tuple[int, int]] = {(initial_packed, 0): (-1, -1)}
 
-            self.solution_path = self.depth_limited_search(depth_limit, stack_frontier, child_parent_map)
-            if self.solution_path:
+            if self.depth_limited_search(depth_limit, stack_frontier, child_parent_map):
                 self.run_time = time.perf_counter() - timer_started
                 self.cost = len(self.solution_path) - 1
                 self.max_search_depth = depth_limit
@@ -38,32 +42,38 @@ class IDSPuzzleSolver(PuzzleSolver):
                 depth_limit += 1
 
     def depth_limited_search(self, depth_limit: int, stack_frontier: List[Tuple[int, int]],
-                             child_parent_map: Dict[Tuple[int, int], Tuple[int, int]]) -> list[int]:
+                             child_parent_map: Dict[Tuple[int, int], Tuple[int, int]]) -> bool:
         while stack_frontier:
             state, depth = stack_frontier.pop()
             self.frontier_set.remove((state, depth))
             self.explored_set.add((state, depth))
             self.num_nodes += 1
 
-            if state == self.goal_state:
+            if state == self.board.goal:
                 self.get_path(state, child_parent_map, depth)
-                return self.solution_path
+                return True
+
+            if self.num_nodes == self.next_checkpoint:
+                self.checkpoint(len(stack_frontier), depth, depth_limit)
 
             if depth < depth_limit:
                 self.expand_state(state, stack_frontier, depth, child_parent_map, depth_limit)
-        return []
+        return False
 
     def get_path(self, current_state: int, child_parent_map: Dict[Tuple[int, int], Tuple[int, int]], depth: int):
         state = (current_state, depth)
+        path = []
         while state != (-1, -1):
-            self.solution_path.insert(0, state[0])
+            path.append(state[0])
             state = child_parent_map[state]
+        path.reverse()
+        self.solution = Solution.from_packed_path(path, self.board)
 
     def expand_state(self, state: int, stack: List[Tuple[int, int]],
                      current_depth: int, child_parent_map: Dict[Tuple[int, int], Tuple[int, int]],
                      limit: int) -> None:
         """Expand the current state by finding its valid neighbors and add them to the stack."""
-        for neighbor in get_neighbors(state):
+        for neighbor in self.board.neighbors(state):
             neighbor_with_depth = (neighbor, current_depth + 1)
             if (neighbor_with_depth not in self.explored_set) and (neighbor_with_depth not in self.frontier_set):
                 # if neighbor_with_depth[1] < limit:
@@ -71,6 +81,12 @@ class IDSPuzzleSolver(PuzzleSolver):
                 self.frontier_set.add(neighbor_with_depth)
                 child_parent_map[neighbor_with_depth] = (state, current_depth)
 
+    def tracked_states(self, frontier_size: int) -> int:
+        return len(self.explored_set) + len(self.frontier_set)
+
+    def open_states(self) -> Iterable[int]:
+        return (state for state, _ in self.stack)
+
     def reset_solver(self) -> None:
         """Reset solver attributes if the puzzle is determined to be unsolvable."""
         self.num_nodes = 0
@@ -91,5 +107,5 @@ class IDSPuzzleSolver(PuzzleSolver):
     def get_runtime(self) -> float:
         return self.run_time
 
-    def get_steps(self) -> List[int]:
+    def get_steps(self) -> Solution:
         return self.solution_path
@@ -0,0 +1,92 @@
+from typing import Dict, List
+
+from Logic.board import CLASSIC_BOARD, Board
+from Logic.heuristics import heuristic_table, manhattan_heuristic, register_packed_evaluator
+
+
+def _longest_increasing_run(values: List[int]) -> int:
+    """Length of the longest strictly increasing subsequence."""
+    best = [0] * len(values)
+    for i, value in enumerate(values):
+        best[i] = 1 + max((best[j] for j in range(i) if values[j] < value), default=0)
+    return max(best, default=0)
+
+
+def build_conflict_table(length: int) -> bytearray:
+    """Extra moves forced by tiles in their goal line but in the wrong order.
+
+    A line of `length` cells is encoded in base length + 1, cell i holding
+    (goal offset + 1) * (length + 1) ** i for a tile whose goal is on this
+    line and 0 otherwise. Every tile outside the longest increasing run of
+    goal offsets has to leave the line and come back: two extra moves.
+    """
+    base = length + 1
+    table = bytearray(base ** length)
+    for code in range(len(table)):
+        offsets = []
+        remaining = code
+        for _ in range(length):
+            remaining, digit = divmod(remaining, base)
+            if digit:
+                offsets.append(digit - 1)
+        # Codes with repeated offsets never occur and are left unchecked
+        table[code] = 2 * (len(offsets) - _longest_increasing_run(offsets))
+    return table
+
+
+class LinearConflict:
+    """Manhattan distance plus row and column linear conflicts on one board."""
+
+    def __init__(self, board: Board = CLASSIC_BOARD):
+        self.board = board
+        self.manhattan = heuristic_table(manhattan_heuristic, board)
+        self.row_table = build_conflict_table(board.cols)
+        self.col_table = build_conflict_table(board.rows)
+        # ROW_CODE[tile][pos] is the tile's contribution to the code of its current row
+        self.row_code = [[0] * board.size for _ in range(board.size)]
+        self.col_code = [[0] * board.size for _ in range(board.size)]
+        for tile in range(1, board.size):
+            goal_row, goal_col = divmod(tile, board.cols)
+            for pos in range(board.size):
+                row, col = divmod(pos, board.cols)
+                if row == goal_row:
+                    self.row_code[tile][pos] = (goal_col + 1) * (board.cols + 1) ** col
+                if col == goal_col:
+                    self.col_code[tile][pos] = (goal_row + 1) * (board.rows + 1) ** row
+
+    def evaluate(self, packed: int) -> int:
+        board = self.board
+        cols = board.cols
+        row_codes = [0] * board.rows
+        col_codes = [0] * cols
+        total = 0
+        state = packed >> board.tile_bits
+        for pos in range(board.size):
+            tile = state & board.tile_mask
+            state >>= board.tile_bits
+            total += self.manhattan[tile][pos]
+            row_codes[pos // cols] += self.row_code[tile][pos]
+            col_codes[pos % cols] += self.col_code[tile][pos]
+        for code in row_codes:
+            total += self.row_table[code]
+        for code in col_codes:
+            total += self.col_table[code]
+        return total
+
+
+_evaluators: Dict[Board, LinearConflict] = {}
+
+
+def linear_conflict(board: Board = CLASSIC_BOARD) -> LinearConflict:
+    """Return the shared linear-conflict tables for a board."""
+    if board not in _evaluators:
+        _evaluators[board] = LinearConflict(board)
+    return _evaluators[board]
+
+
+def linear_conflict_heuristic(state: int) -> float:
+    """Manhattan distance plus linear conflicts for the 8-puzzle from an integer representation."""
+    return linear_conflict().evaluate(CLASSIC_BOARD.encode(state))
+
+
+register_packed_evaluator(linear_conflict_heuristic, lambda board: linear_conflict(board).evaluate, integer=True)
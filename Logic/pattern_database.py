@@ -0,0 +1,135 @@
+import mmap
+import os
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from Logic.board import CLASSIC_BOARD, Board
+from Logic.heuristics import register_packed_evaluator
+
+PATTERN_DATABASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pattern_databases")
+# Abstract state spaces grow as size! / (size - k - 1)!, so groups stay small enough to build in Python
+MAX_GROUP_SIZE = 4
+UNREACHABLE = 0xFF
+
+
+def default_partition(board: Board) -> Tuple[Tuple[int, ...], ...]:
+    """Split the tiles into consecutive groups of at most MAX_GROUP_SIZE, e.g. 1-4 and 5-8 on 3x3."""
+    tiles = list(range(1, board.size))
+    return tuple(tuple(tiles[i:i + MAX_GROUP_SIZE]) for i in range(0, len(tiles), MAX_GROUP_SIZE))
+
+
+def build_pattern_table(board: Board, group: Sequence[int]) -> bytearray:
+    """Backward 0-1 BFS over abstract states (blank plus the group's tile positions) from the goal.
+
+    Only moves of group tiles are counted, so the tables of disjoint groups
+    can be added. The result holds, for every placement of the group, the
+    minimum over blank positions, indexed by sum(position_i * size ** i).
+    """
+    size = board.size
+    group_size = len(group)
+    weights = [size ** i for i in range(group_size)]
+    # Abstract state key: blank + size * placement index
+    distances = bytearray([UNREACHABLE]) * (size ** (group_size + 1))
+    goal_positions = tuple(group)
+    distances[size * sum(pos * weight for pos, weight in zip(goal_positions, weights))] = 0
+    queue = deque([(0, goal_positions)])
+
+    while queue:
+        zero_pos, positions = queue.popleft()
+        placement = sum(pos * weight for pos, weight in zip(positions, weights))
+        distance = distances[zero_pos + size * placement]
+        for new_zero_pos, _, _ in board.move_table[zero_pos]:
+            if new_zero_pos in positions:
+                # A group tile slides into the blank: one counted move
+                moved = positions.index(new_zero_pos)
+                new_positions = positions[:moved] + (zero_pos,) + positions[moved + 1:]
+                new_placement = placement + (zero_pos - new_zero_pos) * weights[moved]
+                new_distance = distance + 1
+            else:
+                new_positions = positions
+                new_placement = placement
+                new_distance = distance
+            key = new_zero_pos + size * new_placement
+            if new_distance < distances[key]:
+                distances[key] = new_distance
+                if new_distance == distance:
+                    queue.appendleft((new_zero_pos, new_positions))
+                else:
+                    queue.append((new_zero_pos, new_positions))
+
+    table = bytearray([UNREACHABLE]) * (size ** group_size)
+    for placement in range(len(table)):
+        base = size * placement
+        table[placement] = min(distances[base:base + size])
+    return table
+
+
+class PatternDatabase:
+    """Additive disjoint pattern databases for one board, persisted as one byte per placement.
+
+    Tables are built on first use and memory-mapped read-only afterwards,
+    so every process shares the same pages.
+    """
+
+    def __init__(self, board: Board = CLASSIC_BOARD, groups: Optional[Sequence[Sequence[int]]] = None,
+                 directory: str = PATTERN_DATABASE_DIR):
+        self.board = board
+        self.groups = tuple(tuple(group) for group in (groups or default_partition(board)))
+        self.directory = directory
+        self.weights = [[board.size ** i for i in range(len(group))] for group in self.groups]
+        self._tables: List[mmap.mmap] = []
+
+    def table_path(self, group: Sequence[int]) -> str:
+        name = f"pdb_{self.board.rows}x{self.board.cols}_{'-'.join(map(str, group))}.bin"
+        return os.path.join(self.directory, name)
+
+    def tables(self) -> List[mmap.mmap]:
+        """Return the memory-mapped tables, building any that are missing on disk."""
+        if not self._tables:
+            os.makedirs(self.directory, exist_ok=True)
+            for group in self.groups:
+                path = self.table_path(group)
+                if not os.path.exists(path):
+                    # Write to a temporary file first so readers never map a half-written table
+                    temp_path = f"{path}.{os.getpid()}.tmp"
+                    with open(temp_path, "wb") as file:
+                        file.write(build_pattern_table(self.board, group))
+                    os.replace(temp_path, path)
+                with open(path, "rb") as file:
+                    self._tables.append(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return self._tables
+
+    def evaluate(self, packed: int) -> int:
+        """Sum the group tables for a packed state."""
+        board = self.board
+        positions = [0] * board.size
+        state = packed >> board.tile_bits
+        for pos in range(board.size):
+            positions[state & board.tile_mask] = pos
+            state >>= board.tile_bits
+
+        total = 0
+        for table, group, weights in zip(self.tables(), self.groups, self.weights):
+            placement = 0
+            for tile, weight in zip(group, weights):
+                placement += positions[tile] * weight
+            total += table[placement]
+        return total
+
+
+_databases: Dict[Board, PatternDatabase] = {}
+
+
+def pattern_database(board: Board = CLASSIC_BOARD) -> PatternDatabase:
+    """Return the shared pattern database for a board with the default partition."""
+    if board not in _databases:
+        _databases[board] = PatternDatabase(board)
+    return _databases[board]
+
+
+def pattern_database_heuristic(state: int) -> float:
+    """Additive pattern-database heuristic for the 8-puzzle from an integer representation."""
+    return pattern_database().evaluate(CLASSIC_BOARD.encode(state))
+
+
+register_packed_evaluator(pattern_database_heuristic, lambda board: pattern_database(board).evaluate, integer=True)
@@ -0,0 +1,97 @@
+import heapq
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, List, Tuple
+
+
+class PriorityQueue(ABC):
+    """Min-priority queue used by the A* frontier.
+
+    Neither implementation supports removing or re-prioritizing an entry.
+    A cheaper path is pushed as a new entry and the superseded one is
+    skipped when popped (lazy deletion), which the solver detects by
+    comparing the entry's g-cost with its current best g-cost.
+    """
+
+    @abstractmethod
+    def push(self, priority: float, item: Any) -> None:
+        pass
+
+    @abstractmethod
+    def pop(self) -> Tuple[float, Any]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the queued items in no particular order, superseded entries included."""
+        pass
+
+
+class LazyHeapQueue(PriorityQueue):
+    """Binary heap for arbitrary (e.g. float) priorities."""
+
+    def __init__(self):
+        self.heap: List[Tuple[float, Any]] = []
+
+    def push(self, priority: float, item: Any) -> None:
+        heapq.heappush(self.heap, (priority, item))
+
+    def pop(self) -> Tuple[float, Any]:
+        return heapq.heappop(self.heap)
+
+    def peek_priority(self) -> float:
+        """Return the lowest priority without popping; superseded entries are not skipped."""
+        return self.heap[0][0]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (item for _, item in self.heap)
+
+
+class BucketQueue(PriorityQueue):
+    """Array of LIFO buckets indexed by integer priority.
+
+    Push and pop are O(1) amortized. Popping the most recently pushed entry
+    of the lowest bucket favours deeper nodes among equal f-costs.
+    """
+
+    def __init__(self):
+        self.buckets: List[List[Any]] = []
+        self.min_priority = 0
+        self.size = 0
+
+    def push(self, priority: float, item: Any) -> None:
+        priority = int(priority)
+        while len(self.buckets) <= priority:
+            self.buckets.append([])
+        self.buckets[priority].append(item)
+        if self.size == 0 or priority < self.min_priority:
+            self.min_priority = priority
+        self.size += 1
+
+    def pop(self) -> Tuple[float, Any]:
+        if self.size == 0:
+            raise IndexError("pop from an empty priority queue")
+        while not self.buckets[self.min_priority]:
+            self.min_priority += 1
+        self.size -= 1
+        return self.min_priority, self.buckets[self.min_priority].pop()
+
+    def peek_priority(self) -> float:
+        """Return the lowest priority without popping; superseded entries are not skipped."""
+        if self.size == 0:
+            raise IndexError("peek into an empty priority queue")
+        while not self.buckets[self.min_priority]:
+            self.min_priority += 1
+        return self.min_priority
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        return (item for bucket in self.buckets for item in bucket)
@@ -1,18 +1,135 @@
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.heuristics import manhattan_heuristic, packed_evaluator
+from Logic.solution import Solution
+
+
+class SearchProgress(NamedTuple):
+    """Snapshot of a running search, passed to progress observers."""
+    num_nodes: int  # Nodes expanded so far
+    frontier_size: int  # Open-list, stack or queue length (the recursion depth for IDA*)
+    depth: int  # Depth of the node being expanded
+    bound: Optional[float]  # f of that node for A*, the f or depth limit of the iteration for IDA* and IDS
+    elapsed: float  # Seconds since the search started
+
+
+ProgressObserver = Callable[[SearchProgress], None]
+DEFAULT_REPORT_INTERVAL = 10000
+# Node expansions between checks of the cancellation event, the deadline and the state budget
+CHECK_INTERVAL = 1000
+
+
+class SearchBudget(NamedTuple):
+    """Limits on a single solve; None leaves a dimension unbounded."""
+    max_expansions: Optional[int] = None
+    max_seconds: Optional[float] = None  # Wall-clock time from attaching the budget
+    max_states: Optional[int] = None  # States held by the search at once, see PuzzleSolver.tracked_states
+
+
+class SearchCancelled(Exception):
+    """Raised out of solve() once the solver's cancellation event is set."""
+
+
+class BudgetExhausted(Exception):
+    """Raised out of solve() when a SearchBudget limit is reached; limit is "expansions", "deadline" or "states"."""
+
+    def __init__(self, limit: str):
+        super().__init__(f"Search budget exhausted: {limit}")
+        self.limit = limit
 
 
 class PuzzleSolver(ABC):
-    def __init__(self, initial_state: int):
+    def __init__(self, initial_state: State, board: Board = CLASSIC_BOARD):
+        self.board = board
         self.initial_state = initial_state
-        self.goal_state = 12345678
+        self.initial_packed = board.encode(initial_state)
+        self.goal_state = board.goal_state
         self.num_nodes = 0
         self.max_search_depth = 0
         self.run_time = 0
-        self.solution_path = []
+        self.solution = Solution(board=board)
         self.explored_set = set()
         self.frontier_set = set()
         self.cost = 0
+        self.start_time = 0.0
+        # Solvers compare num_nodes against next_checkpoint after every expansion; -1 never matches
+        self.next_checkpoint = -1
+        self.observer: Optional[ProgressObserver] = None
+        self.report_interval = DEFAULT_REPORT_INTERVAL
+        self.next_report = 0
+        self.cancel_event: Optional[threading.Event] = None
+        self.budget = SearchBudget()
+        self.deadline: Optional[float] = None
+
+    def attach_observer(self, observer: ProgressObserver, interval: int = DEFAULT_REPORT_INTERVAL) -> None:
+        """Call observer with a SearchProgress every interval node expansions."""
+        if interval < 1:
+            raise ValueError(f"Report interval must be positive, got {interval}")
+        self.observer = observer
+        self.report_interval = interval
+        self.next_report = self.num_nodes + interval
+        self.schedule_checkpoint()
+
+    def attach_cancel_event(self, event: threading.Event) -> None:
+        """Make solve() raise SearchCancelled within CHECK_INTERVAL expansions of event being set."""
+        self.cancel_event = event
+        self.schedule_checkpoint()
+
+    def attach_budget(self, budget: SearchBudget) -> None:
+        """Make solve() raise BudgetExhausted once a limit is reached.
+
+        The expansion limit is exact; the deadline and the state limit are
+        checked every CHECK_INTERVAL expansions.
+        """
+        if budget.max_expansions is not None and budget.max_expansions < 1:
+            raise ValueError(f"max_expansions must be positive, got {budget.max_expansions}")
+        self.budget = budget
+        self.deadline = None if budget.max_seconds is None else time.perf_counter() + budget.max_seconds
+        self.schedule_checkpoint()
+
+    def schedule_checkpoint(self) -> None:
+        due = []
+        if self.observer is not None:
+            due.append(self.next_report)
+        if self.cancel_event is not None or self.deadline is not None or self.budget.max_states is not None:
+            due.append(self.num_nodes + CHECK_INTERVAL)
+        if self.budget.max_expansions is not None:
+            due.append(self.budget.max_expansions)
+        self.next_checkpoint = min(due) if due else -1
+
+    def checkpoint(self, frontier_size: int, depth: int, bound: Optional[float] = None) -> None:
+        """Called by the solvers when num_nodes reaches next_checkpoint: enforce limits and report progress."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise SearchCancelled()
+        if self.budget.max_expansions is not None and self.num_nodes >= self.budget.max_expansions:
+            raise BudgetExhausted("expansions")
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise BudgetExhausted("deadline")
+        if self.budget.max_states is not None and self.tracked_states(frontier_size) > self.budget.max_states:
+            raise BudgetExhausted("states")
+        if self.observer is not None and self.num_nodes >= self.next_report:
+            self.next_report += self.report_interval
+            self.observer(SearchProgress(self.num_nodes, frontier_size, depth, bound,
+                                         time.perf_counter() - self.start_time))
+        self.schedule_checkpoint()
+
+    def tracked_states(self, frontier_size: int) -> int:
+        """States held by the search: expanded plus open for graph searches; overridden by tree searches."""
+        return self.num_nodes + frontier_size
+
+    def open_states(self) -> Iterable[int]:
+        """Packed states waiting to be expanded, used to pick the closest state of an interrupted search."""
+        return ()
+
+    def closest_state(self) -> Tuple[int, float]:
+        """Return the open state with the lowest heuristic value (Manhattan for uninformed searches) and that value."""
+        evaluate = getattr(self, "evaluate", None) or packed_evaluator(manhattan_heuristic, self.board)
+        candidates = list(self.open_states()) or [self.initial_packed]
+        return min(((state, evaluate(state)) for state in candidates), key=lambda candidate: candidate[1])
 
     @abstractmethod
     def solve(self) -> None:
@@ -31,5 +148,22 @@ class PuzzleSolver(ABC):
         pass
 
     @abstractmethod
-    def get_steps(self) -> List[int]:
+    def get_steps(self) -> Solution:
         pass
+
+    @property
+    def solution_path(self) -> Solution:
+        """The states of the solution, decoded as they are read: a view of self.solution."""
+        return self.solution
+
+    @solution_path.setter
+    def solution_path(self, path: Sequence[State]) -> None:
+        self.solution = Solution.from_path(path, self.board)
+
+    def get_solution(self) -> Solution:
+        """Return the solution as a start state and move string (see Logic.solution.Solution)."""
+        return self.solution
+
+    def solution_from_moves(self, goal: int, parent_moves) -> Solution:
+        """Rebuild the solution from stored parent moves without decoding any state."""
+        return Solution.from_moves(self.initial_packed, self.board.moves_from_parents(goal, parent_moves), self.board)
@@ -0,0 +1,107 @@
+"""Solver and heuristic registries behind solve_puzzle.
+
+Entries name their implementation as "module:attribute" and the module is
+only imported when the entry is first used, so starting a process that
+solves with one method does not pay for importing every other (NumPy for
+VectorBFS, the heuristic tables behind the pattern database). Plugins add
+entries with register_solver and register_heuristic.
+"""
+from importlib import import_module
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+from Logic.board import Board, State
+from Logic.puzzle_solver import PuzzleSolver
+
+Target = Union[str, Callable]
+
+
+class SolverEntry(NamedTuple):
+    target: Target  # Solver class, or "module:attribute" naming it
+    heuristic: Optional[Target] = None  # Registered heuristic name or heuristic function, passed after the state
+
+
+_solvers: Dict[str, SolverEntry] = {}
+_heuristics: Dict[str, Target] = {}
+
+
+def _resolve(target: Target) -> Callable:
+    if callable(target):
+        return target
+    module_name, _, attribute = target.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+def register_solver(name: str, target: Target, heuristic: Optional[Target] = None) -> None:
+    """Make name available to solve_puzzle.
+
+    target is called as target(state, board=board), or as
+    target(state, heuristic, board=board) when a heuristic is given.
+    """
+    _solvers[name] = SolverEntry(target, heuristic)
+
+
+def register_heuristic(name: str, target: Target) -> None:
+    """Register a heuristic function, or its "module:attribute", under name."""
+    _heuristics[name] = target
+
+
+def get_heuristic(name: str) -> Callable[[int], float]:
+    """Return the heuristic registered under name, importing its module on first use."""
+    target = _heuristics.get(name)
+    if target is None:
+        raise ValueError(f"Unknown heuristic: {name}")
+    heuristic = _heuristics[name] = _resolve(target)
+    return heuristic
+
+
+def create_solver(name: str, initial_state: State, board: Board) -> PuzzleSolver:
+    """Instantiate the solver registered under name, importing its module on first use."""
+    entry = _solvers.get(name)
+    if entry is None:
+        raise ValueError(f"Unsupported method name: {name}")
+    solver_class = _resolve(entry.target)
+    heuristic = entry.heuristic
+    if isinstance(heuristic, str):
+        heuristic = get_heuristic(heuristic)
+    # Keep the resolved entry so later calls skip the lookups
+    _solvers[name] = SolverEntry(solver_class, heuristic)
+    if heuristic is None:
+        return solver_class(initial_state, board=board)
+    return solver_class(initial_state, heuristic, board=board)
+
+
+def solver_names() -> List[str]:
+    return list(_solvers)
+
+
+def heuristic_names() -> List[str]:
+    return list(_heuristics)
+
+
+register_heuristic("manhattan", "Logic.heuristics:manhattan_heuristic")
+register_heuristic("euclidean", "Logic.heuristics:euclidean_heuristic")
+register_heuristic("misplaced_tiles", "Logic.heuristics:misplaced_tiles_heuristic")
+register_heuristic("pattern_database", "Logic.pattern_database:pattern_database_heuristic")
+register_heuristic("linear_conflict", "Logic.linear_conflict:linear_conflict_heuristic")
+register_heuristic("walking_distance", "Logic.walking_distance:walking_distance_heuristic")
+
+register_solver("AStarManhattan", "Logic.astar_solver:AStarPuzzleSolver", "manhattan")
+register_solver("AStarEuclidean", "Logic.astar_solver:AStarPuzzleSolver", "euclidean")
+register_solver("AStarMisplacedTiles", "Logic.astar_solver:AStarPuzzleSolver", "misplaced_tiles")
+register_solver("AStarPDB", "Logic.astar_solver:AStarPuzzleSolver", "pattern_database")
+register_solver("AStarLinearConflict", "Logic.astar_solver:AStarPuzzleSolver", "linear_conflict")
+register_solver("AStarWalkingDistance", "Logic.astar_solver:AStarPuzzleSolver", "walking_distance")
+register_solver("ARAStarManhattan", "Logic.arastar_solver:ARAStarPuzzleSolver", "manhattan")
+register_solver("IDAStarManhattan", "Logic.idastar_solver:IDAStarPuzzleSolver", "manhattan")
+register_solver("IDAStarEuclidean", "Logic.idastar_solver:IDAStarPuzzleSolver", "euclidean")
+register_solver("IDAStarMisplacedTiles", "Logic.idastar_solver:IDAStarPuzzleSolver", "misplaced_tiles")
+register_solver("IDAStarPDB", "Logic.idastar_solver:IDAStarPuzzleSolver", "pattern_database")
+register_solver("BidirectionalAStarManhattan", "Logic.bidirectional_solver:BidirectionalAStarPuzzleSolver",
+                "manhattan")
+register_solver("HDAStarManhattan", "Logic.hda_solver:HDAStarPuzzleSolver", "manhattan")
+register_solver("BFSPuzzleSolver", "Logic.bfs_solver:BFSPuzzleSolver")
+register_solver("BidirectionalBFS", "Logic.bidirectional_solver:BidirectionalBFSPuzzleSolver")
+register_solver("VectorBFS", "Logic.vector_bfs:VectorBFSPuzzleSolver")
+register_solver("DFSPuzzleSolver", "Logic.dfs_solver:DFSPuzzleSolver")
+register_solver("IDSPuzzleSolver", "Logic.ids_solver:IDSPuzzleSolver")
+register_solver("Database", "Logic.distance_database:DatabasePuzzleSolver")
@@ -0,0 +1,161 @@
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from Logic.board import CLASSIC_BOARD, MOVE_NAMES, Board, State
+from Logic.solution import Solution
+from Logic.utils import canonicalize, transpose_moves
+
+# Stored per entry: status, cost, depth, num_nodes, runtime, moves as a MOVE_NAMES string, and the
+# method-specific result keys (suboptimality_bound, winner, ...) as a JSON object
+CachedSolve = Tuple[str, int, int, int, float, str, str]
+# Result keys rebuilt from the fixed columns, or added per lookup, rather than stored as extras
+_COLUMN_KEYS = {"solution_path", "solution", "runtime", "depth", "num_nodes", "cost", "status", "cached",
+                "lookup_time"}
+
+
+class ResultCache:
+    """Two-tier cache of solve_puzzle results keyed by (method, board, state).
+
+    The first tier is an in-memory LRU of at most max_entries solves; the
+    optional second tier is a SQLite file that keeps results across restarts.
+    Solutions are stored as their start state plus a move string and returned
+    as a Logic.solution.Solution. Cached results keep the runtime, depth and node count of the
+    original solve, and any method-specific keys such as suboptimality_bound
+    or winner, and report the lookup time separately.
+
+    With symmetry, a state and its transpose share one entry stored under
+    the canonical state (see Logic.utils.canonicalize); moves are mirrored
+    on the way in and out. A mirrored hit returns the transposed solution
+    of the other state: as short as the method's own answer for optimal
+    methods, but not necessarily the path a non-optimal method such as DFS
+    would have produced.
+    """
+
+    def __init__(self, max_entries: int = 4096, path: Optional[str] = None, symmetry: bool = True):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.path = path
+        self.symmetry = symmetry
+        self.entries: "OrderedDict[tuple, CachedSolve]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.connection = None
+        if path is not None:
+            self.connection = sqlite3.connect(path)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " method TEXT NOT NULL, board TEXT NOT NULL, state TEXT NOT NULL,"
+                " status TEXT NOT NULL, cost INTEGER NOT NULL, depth INTEGER NOT NULL,"
+                " num_nodes INTEGER NOT NULL, runtime REAL NOT NULL, moves TEXT NOT NULL,"
+                " extra TEXT NOT NULL DEFAULT '{}', PRIMARY KEY (method, board, state))")
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(results)")]
+            if "extra" not in columns:  # Files written before extras were stored
+                self.connection.execute("ALTER TABLE results ADD COLUMN extra TEXT NOT NULL DEFAULT '{}'")
+            self.connection.commit()
+
+    def key(self, method_name: str, state: State, board: Board) -> Tuple[tuple, bool]:
+        """Return the entry key for a solve and whether the state was transposed to reach it."""
+        packed = board.encode(state)
+        transposed = False
+        if self.symmetry:
+            packed, transposed = canonicalize(packed, board)
+        return (method_name, f"{board.rows}x{board.cols}", packed), transposed
+
+    @staticmethod
+    def _row_key(key: tuple) -> tuple:
+        # Packed states of 4x4 and larger boards overflow SQLite's 64-bit integers
+        method_name, board_name, packed = key
+        return method_name, board_name, str(packed)
+
+    def get(self, method_name: str, state: State, board: Board = CLASSIC_BOARD) -> Optional[dict]:
+        """Return the cached result for a solve, or None (counted as a miss)."""
+        lookup_started = time.perf_counter()
+        key, transposed = self.key(method_name, state, board)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        elif self.connection is not None:
+            row = self.connection.execute(
+                "SELECT status, cost, depth, num_nodes, runtime, moves, extra FROM results"
+                " WHERE method = ? AND board = ? AND state = ?", self._row_key(key)).fetchone()
+            if row is not None:
+                entry = tuple(row)
+                self.disk_hits += 1
+                self._remember(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        status, cost, depth, num_nodes, runtime, moves, extra = entry
+        solution = Solution(board=board)
+        if status == "solved":
+            step_moves = [MOVE_NAMES.index(name) for name in moves]
+            if transposed:
+                step_moves = transpose_moves(step_moves)
+            solution = Solution.from_moves(board.encode(state), step_moves, board)
+        result = {
+            "solution_path": solution,
+            "solution": solution,
+            "runtime": runtime,
+            "depth": depth,
+            "num_nodes": num_nodes,
+            "cost": cost,
+            "status": status,
+        }
+        result.update(json.loads(extra))
+        result.update(cached=True, lookup_time=time.perf_counter() - lookup_started)
+        return result
+
+    def put(self, method_name: str, state: State, result: dict, board: Board = CLASSIC_BOARD) -> None:
+        """Store a finished solve; interrupted solves and errors are not cached."""
+        if result["status"] not in ("solved", "unsolvable"):
+            return
+        key, transposed = self.key(method_name, state, board)
+        solution = result.get("solution") or Solution.from_path(result["solution_path"], board)
+        step_moves = solution.move_codes()
+        if transposed:
+            step_moves = transpose_moves(step_moves)
+        moves = "".join(MOVE_NAMES[move] for move in step_moves)
+        extra = json.dumps({name: value for name, value in result.items() if name not in _COLUMN_KEYS})
+        entry = (result["status"], result["cost"], result["depth"], result["num_nodes"], result["runtime"], moves,
+                 extra)
+        self._remember(key, entry)
+        if self.connection is not None:
+            self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                    self._row_key(key) + entry)
+            self.connection.commit()
+
+    def _remember(self, key: tuple, entry: CachedSolve) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss counters; disk_hits counts the hits served by the SQLite tier."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.entries),
+        }
+
+    def clear(self) -> None:
+        """Drop the in-memory tier; the SQLite file is left untouched."""
+        self.entries.clear()
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
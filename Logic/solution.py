@@ -0,0 +1,120 @@
+from collections.abc import Sequence as SequenceABC
+from typing import Iterator, List, Optional, Sequence
+
+from Logic.board import CLASSIC_BOARD, DOWN, LEFT, MOVE_NAMES, OPPOSITE_MOVE, RIGHT, UP, Board, State
+
+
+class Solution(SequenceABC):
+    """A solution path stored as its packed start state and a string of blank moves (MOVE_NAMES letters).
+
+    Board states are decoded only when indexed or iterated, so stepping
+    through a long path costs one move per step: the last position looked
+    up is remembered and the next lookup walks from it, or from the start
+    if that is closer. A solution without a start state is empty (no path,
+    as for unsolvable or interrupted searches). solve_puzzle results hold a
+    Solution under "solution_path" for every status; serialize it through
+    moves, or through solution_path for the full list of decoded states.
+    """
+
+    def __init__(self, start: Optional[int] = None, moves: str = "", board: Board = CLASSIC_BOARD):
+        if start is None and moves:
+            raise ValueError("An empty solution has no moves")
+        self.start = start
+        self.moves = moves
+        self.board = board
+        self.cursor_index = 0
+        self.cursor_packed = start
+
+    @classmethod
+    def from_moves(cls, start: int, moves: Sequence[int], board: Board = CLASSIC_BOARD) -> "Solution":
+        """Build a solution from a packed start state and blank moves (0-3)."""
+        return cls(start, "".join(MOVE_NAMES[move] for move in moves), board)
+
+    @classmethod
+    def from_packed_path(cls, path: Sequence[int], board: Board = CLASSIC_BOARD) -> "Solution":
+        if not path:
+            return cls(board=board)
+        return cls.from_moves(path[0], board.moves_along(path), board)
+
+    @classmethod
+    def from_path(cls, path: Sequence[State], board: Board = CLASSIC_BOARD) -> "Solution":
+        """Build a solution from a list of states as solvers return them.
+
+        Only the first state is encoded; the moves are read off where the
+        blank sits in each state, which is much cheaper on long DFS paths.
+        """
+        if not path:
+            return cls(board=board)
+        if isinstance(path[0], int):
+            blanks = [str(state).zfill(board.size).index("0") for state in path]
+        else:
+            blanks = [state.index(0) for state in path]
+        step_moves = {1: RIGHT, board.cols: DOWN, -1: LEFT, -board.cols: UP}
+        moves = "".join(MOVE_NAMES[step_moves[after - before]] for before, after in zip(blanks, blanks[1:]))
+        return cls(board.encode(path[0]), moves, board)
+
+    @property
+    def cost(self) -> int:
+        return len(self.moves)
+
+    def move_codes(self) -> List[int]:
+        """The blank moves as integers 0-3 (RIGHT, DOWN, LEFT, UP)."""
+        return [MOVE_NAMES.index(name) for name in self.moves]
+
+    def packed(self, index: int) -> int:
+        """Return the packed state after index moves."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"solution index {index} out of range")
+        board = self.board
+        if index < abs(index - self.cursor_index):
+            self.cursor_index, self.cursor_packed = 0, self.start
+        packed = self.cursor_packed
+        for step in range(self.cursor_index, index):
+            packed = board.apply_move(packed, MOVE_NAMES.index(self.moves[step]))
+        for step in range(self.cursor_index - 1, index - 1, -1):
+            packed = board.apply_move(packed, OPPOSITE_MOVE[MOVE_NAMES.index(self.moves[step])])
+        self.cursor_index, self.cursor_packed = index, packed
+        return packed
+
+    def packed_states(self) -> Iterator[int]:
+        """Yield the packed states of the path from the start, one move at a time."""
+        if self.start is None:
+            return
+        packed = self.start
+        yield packed
+        for name in self.moves:
+            packed = self.board.apply_move(packed, MOVE_NAMES.index(name))
+            yield packed
+
+    def __len__(self) -> int:
+        return 0 if self.start is None else len(self.moves) + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return self.board.decode(self.packed(index))
+
+    def __iter__(self) -> Iterator[State]:
+        decode = self.board.decode
+        return (decode(packed) for packed in self.packed_states())
+
+    @property
+    def solution_path(self) -> List[State]:
+        """Every state of the path, decoded: the list solve_puzzle results carry as "solution_path"."""
+        return list(self)
+
+    def __eq__(self, other) -> bool:
+        # Compares equal to the list of states it stands for, as solution_path used to be
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(state == expected for state, expected in zip(self, other))
+        if not isinstance(other, Solution):
+            return NotImplemented
+        return (self.start, self.moves, self.board) == (other.start, other.moves, other.board)
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.moves, self.board))
+
+    def __repr__(self) -> str:
+        return f"Solution({self.start!r}, {self.moves!r}, {self.board!r})"
@@ -1,35 +1,286 @@
-from Logic.astar_solver import AStarPuzzleSolver
-from Logic.heuristics import manhattan_heuristic, euclidean_heuristic, misplaced_tiles_heuristic
-from Logic.bfs_solver import BFSPuzzleSolver
-from Logic.dfs_solver import DFSPuzzleSolver
-from Logic.ids_solver import IDSPuzzleSolver
-
-
-def solve_puzzle(method_name: str, game_initial_state: int) -> dict:
-    if method_name == "AStarManhattan":
-        solver = AStarPuzzleSolver(game_initial_state, manhattan_heuristic)
-    elif method_name == "AStarEuclidean":
-        solver = AStarPuzzleSolver(game_initial_state, euclidean_heuristic)
-    elif method_name == "AStarMisplacedTiles":
-        solver = AStarPuzzleSolver(game_initial_state, misplaced_tiles_heuristic)
-    elif method_name == "BFSPuzzleSolver":
-        solver = BFSPuzzleSolver(game_initial_state)
-    elif method_name == "DFSPuzzleSolver":
-        solver = DFSPuzzleSolver(game_initial_state)
-    elif method_name == "IDSPuzzleSolver":
-        solver = IDSPuzzleSolver(game_initial_state)
-    else:
-        raise ValueError(f"Unsupported method name: {method_name}")
-
-    solver.solve()
-    return {
-        "solution_path": solver.get_steps(),
+import os
+import threading
+import time
+from collections import deque
+from itertools import islice
+from queue import Empty
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from Logic.board import CLASSIC_BOARD, Board, State
+from Logic.puzzle_solver import DEFAULT_REPORT_INTERVAL, BudgetExhausted, ProgressObserver, PuzzleSolver, \
+    SearchBudget, SearchCancelled
+from Logic.registry import create_solver, get_heuristic
+from Logic.result_cache import ResultCache
+from Logic.solution import Solution
+
+# Members raced by the "Portfolio" method: any path will do
+PORTFOLIO_METHODS = ("AStarManhattan", "DFSPuzzleSolver", "BFSPuzzleSolver")
+# Members raced by the "PortfolioOptimal" method, all drawn from OPTIMAL_METHODS
+OPTIMAL_PORTFOLIO_METHODS = ("AStarManhattan", "IDAStarManhattan", "BidirectionalBFS")
+# Methods whose solutions are always shortest (admissible heuristics or uniform-cost layers)
+OPTIMAL_METHODS = {
+    "AStarManhattan", "AStarEuclidean", "AStarMisplacedTiles", "AStarPDB", "AStarLinearConflict",
+    "AStarWalkingDistance", "ARAStarManhattan", "IDAStarManhattan", "IDAStarEuclidean", "IDAStarMisplacedTiles",
+    "IDAStarPDB", "BidirectionalAStarManhattan", "HDAStarManhattan", "BFSPuzzleSolver", "BidirectionalBFS",
+    "VectorBFS", "IDSPuzzleSolver", "Database",
+}
+
+
+def solve_puzzle(method_name: str, game_initial_state: State, board: Board = CLASSIC_BOARD,
+                 cache: Optional[ResultCache] = None, observer: Optional[ProgressObserver] = None,
+                 report_interval: int = DEFAULT_REPORT_INTERVAL, cancel_event: Optional[threading.Event] = None,
+                 budget: Optional[SearchBudget] = None) -> dict:
+    if cache is not None:
+        cached = cache.get(method_name, game_initial_state, board)
+        if cached is not None:
+            return cached
+
+    if method_name in ("Portfolio", "PortfolioOptimal"):
+        optimal = method_name == "PortfolioOptimal"
+        methods = OPTIMAL_PORTFOLIO_METHODS if optimal else PORTFOLIO_METHODS
+        result = solve_portfolio(game_initial_state, methods, optimal, board, cancel_event, budget)
+        if cache is not None:
+            cache.put(method_name, game_initial_state, result, board)
+            result["cached"] = False
+        return result
+
+    solver = create_solver(method_name, game_initial_state, board)
+
+    if observer is not None:
+        solver.attach_observer(observer, report_interval)
+    if cancel_event is not None:
+        solver.attach_cancel_event(cancel_event)
+    if budget is not None:
+        solver.attach_budget(budget)
+    try:
+        solver.solve()
+    except SearchCancelled:
+        return _interrupted_result(solver, "cancelled")
+    except BudgetExhausted as exhausted:
+        result = _interrupted_result(solver, "budget_exhausted")
+        closest_state, closest_h = solver.closest_state()
+        result.update(budget=exhausted.limit, closest_state=board.decode(closest_state), closest_h=closest_h)
+        return result
+    solution = solver.get_solution()
+    result = {
+        # The Solution doubles as the solution_path view: a sequence of states decoded as they are read
+        "solution_path": solution,
+        "solution": solution,
         "runtime": solver.get_runtime(),
         "depth": solver.get_depth(),
         "num_nodes": solver.get_number_of_nodes(),
         "cost": solver.get_cost(),
+        "status": "solved" if solution else "unsolvable",
     }
+    if hasattr(solver, "suboptimality_bound"):
+        result["suboptimality_bound"] = solver.suboptimality_bound
+    if cache is not None:
+        cache.put(method_name, game_initial_state, result, board)
+        result["cached"] = False
+    return result
+
+
+def solve_anytime(game_initial_state: State, board: Board = CLASSIC_BOARD, budget: Optional[SearchBudget] = None,
+                  initial_weight: float = 3.0, weight_step: float = 0.5) -> Iterator[dict]:
+    """Stream ARA* (Manhattan) solutions as they improve, each with its suboptimality bound.
+
+    The last one is optimal unless the budget ran out first; a budget that
+    runs out before any solution yields a single budget_exhausted result.
+    """
+    from Logic.arastar_solver import ARAStarPuzzleSolver
+
+    solver = ARAStarPuzzleSolver(game_initial_state, get_heuristic("manhattan"), initial_weight, weight_step, board)
+    if budget is not None:
+        solver.attach_budget(budget)
+    try:
+        for solution in solver.solutions():
+            yield {
+                "solution_path": solution.solution_path,
+                "solution": solution.solution_path,
+                "runtime": solution.runtime,
+                "depth": solver.max_search_depth,
+                "num_nodes": solution.num_nodes,
+                "cost": solution.cost,
+                "status": "solved",
+                "weight": solution.weight,
+                "suboptimality_bound": solution.suboptimality_bound,
+            }
+    except BudgetExhausted as exhausted:
+        result = _interrupted_result(solver, "budget_exhausted")
+        closest_state, closest_h = solver.closest_state()
+        result.update(budget=exhausted.limit, closest_state=board.decode(closest_state), closest_h=closest_h)
+        yield result
+
+
+def _unsolved_result(status: str, board: Board, runtime: float = 0, depth: int = 0, num_nodes: int = 0,
+                     **extra) -> dict:
+    """Result without a path; solution_path is an empty Solution, as in every other result."""
+    solution = Solution(board=board)
+    result = {"solution_path": solution, "solution": solution, "runtime": runtime, "depth": depth,
+              "num_nodes": num_nodes, "cost": 0, "status": status}
+    result.update(extra)
+    return result
+
+
+def _interrupted_result(solver: PuzzleSolver, status: str) -> dict:
+    """Result of a search stopped before it finished: no path, but the depth reached and nodes expanded so far."""
+    return _unsolved_result(status, solver.board, time.perf_counter() - solver.start_time, solver.max_search_depth,
+                            solver.num_nodes)
+
+
+def solve_or_report(method_name: str, game_initial_state: State, board: Board = CLASSIC_BOARD,
+                    budget: Optional[SearchBudget] = None, **options) -> dict:
+    """Run solve_puzzle, turning an invalid state into a result with status "error" instead of raising.
+
+    Other keyword options (observer, report_interval, cancel_event) are passed on to solve_puzzle.
+    """
+    try:
+        return solve_puzzle(method_name, game_initial_state, board, budget=budget, **options)
+    except ValueError as error:
+        return _unsolved_result("error", board, error=str(error))
+
+
+def _race_member(method_name: str, game_initial_state: State, board: Board, budget: Optional[SearchBudget],
+                 results) -> None:
+    try:
+        result = solve_or_report(method_name, game_initial_state, board, budget)
+    except Exception as error:
+        result = _unsolved_result("error", board, error=repr(error))
+    results.put((method_name, result))
+
+
+def solve_portfolio(game_initial_state: State, methods: Sequence[str] = PORTFOLIO_METHODS, optimal: bool = False,
+                    board: Board = CLASSIC_BOARD, cancel_event: Optional[threading.Event] = None,
+                    budget: Optional[SearchBudget] = None) -> dict:
+    """Race methods in one process each and return the first solved or unsolvable result.
+
+    With optimal every method must be in OPTIMAL_METHODS, so the first
+    answer is also a shortest one. The losers are terminated as soon as
+    there is a winner, whose name is reported under "winner"; runtime is
+    the wall-clock time of the whole race. The budget applies to each
+    member. If every member fails, the last failure is returned with
+    winner None; members that exit without reporting (killed, out of
+    memory) count as failures, and if none reported at all the result has
+    status "error". Setting cancel_event stops the race within 50ms.
+    """
+    if not methods:
+        raise ValueError("A portfolio needs at least one method")
+    if optimal and not set(methods) <= OPTIMAL_METHODS:
+        raise ValueError(f"Not optimal: {', '.join(sorted(set(methods) - OPTIMAL_METHODS))}")
+
+    # Imported here rather than at the top: short-lived single-solve processes never need it
+    import multiprocessing
+
+    timer_started = time.perf_counter()
+    context = multiprocessing.get_context()
+    results = context.Queue()
+    # Not daemonic, so members such as HDA* can start processes of their own
+    members = [context.Process(target=_race_member, args=(method, game_initial_state, board, budget, results))
+               for method in methods]
+    for member in members:
+        member.start()
+    winner = None
+    result = None
+    pending = len(members)
+    try:
+        while pending and winner is None:
+            # Checked before waiting: a member's queued result reaches the pipe before it exits
+            all_exited = all(member.exitcode is not None for member in members)
+            try:
+                method, result = results.get(timeout=0.05)
+            except Empty:
+                if cancel_event is not None and cancel_event.is_set():
+                    return _unsolved_result("cancelled", board, time.perf_counter() - timer_started, winner=None)
+                if all_exited:
+                    break  # The members still pending died without reporting
+                continue
+            pending -= 1
+            if result["status"] in ("solved", "unsolvable"):
+                winner = method
+    finally:
+        for member in members:
+            if member.is_alive():
+                member.terminate()
+            member.join()
+        results.cancel_join_thread()
+    if result is None:
+        result = _unsolved_result("error", board, error="Every portfolio member exited without a result")
+    result.update(runtime=time.perf_counter() - timer_started, winner=winner)
+    return result
+
+
+_worker_method: Optional[str] = None
+_worker_board: Board = CLASSIC_BOARD
+_worker_budget: Optional[SearchBudget] = None
+
+
+def _init_worker(method_name: str, board: Board, budget: Optional[SearchBudget]) -> None:
+    """Set up a pool worker once: keep the method and board, and warm the method's lookup tables.
+
+    Solving the goal builds or maps everything the method uses lazily
+    (per-tile heuristic tables, pattern and distance databases), so no
+    task has to ship or rebuild them.
+    """
+    global _worker_method, _worker_board, _worker_budget
+    _worker_method = method_name
+    _worker_board = board
+    _worker_budget = budget
+    solve_puzzle(method_name, board.goal_state, board)
+
+
+def _solve_chunk(states: List[State]) -> List[dict]:
+    return [solve_or_report(_worker_method, state, _worker_board, _worker_budget) for state in states]
+
+
+def solve_many(method_name: str, states: Iterable[State], workers: Optional[int] = None, chunksize: int = 16,
+               ordered: bool = True, board: Board = CLASSIC_BOARD,
+               budget: Optional[SearchBudget] = None) -> Iterator[Union[dict, Tuple[int, dict]]]:
+    """Solve a stream of states over a process pool, yielding results as a generator.
+
+    States are consumed lazily and at most a few chunks per worker are in
+    flight, so arbitrarily long inputs run in bounded memory. With ordered
+    results come back in input order; otherwise (index, result) pairs are
+    yielded as chunks complete. workers=1 solves in the calling process.
+    Results go through solve_or_report, with the budget applied to each state.
+    """
+    workers = workers or os.cpu_count() or 1
+    states = iter(states)
+    if workers == 1:
+        for index, state in enumerate(states):
+            result = solve_or_report(method_name, state, board, budget)
+            yield result if ordered else (index, result)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    max_in_flight = workers * 4
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(method_name, board, budget)) as executor:
+        pending = deque()
+        next_index = 0
+        try:
+            while True:
+                while len(pending) < max_in_flight:
+                    chunk = list(islice(states, chunksize))
+                    if not chunk:
+                        break
+                    pending.append((next_index, executor.submit(_solve_chunk, chunk)))
+                    next_index += len(chunk)
+                if not pending:
+                    return
 
+                if ordered:
+                    _, future = pending.popleft()
+                    yield from future.result()
+                    continue
+                done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                for start, future in [entry for entry in pending if entry[1] in done]:
+                    pending.remove((start, future))
+                    for offset, result in enumerate(future.result()):
+                        yield start + offset, result
+        finally:
+            # A caller that stops iterating early should not wait for queued chunks
+            for _, future in pending:
+                future.cancel()
 
 # 806547231
 # 641302758
@@ -38,12 +289,7 @@ def solve_puzzle(method_name: str, game_initial_state: int) -> dict:
 # 035428617
 # 725310648
 
-# "AStarManhattan"
-# "AStarEuclidean"
-# "AStarMisplacedTiles"
-# "BFSPuzzleSolver"
-# "DFSPuzzleSolver"
-# "IDSPuzzleSolver"
+# Method names: Logic/registry.py, plus "Portfolio" and "PortfolioOptimal"
 
 # if __name__ == "__main__":
 #     initial_state = 725310648
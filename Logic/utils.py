@@ -1,34 +1,62 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from Logic.board import CLASSIC_BOARD, DIRECTIONS, DOWN, LEFT, OPPOSITE_MOVE, RIGHT, UP, Board
+
+# The 3x3 engine, see Logic.board.Board for the packed representation: the low
+# nibble holds the blank position and nibble ``p + 1`` the tile at position ``p``.
+TILE_BITS = CLASSIC_BOARD.tile_bits
+TILE_MASK = CLASSIC_BOARD.tile_mask
+BLANK_MASK = CLASSIC_BOARD.blank_mask
+MOVE_TABLE = CLASSIC_BOARD.move_table
+MOVE_BY_DIRECTION = CLASSIC_BOARD.move_by_direction
+GOAL_PACKED = CLASSIC_BOARD.goal
+STATE_SPACE_SIZE = CLASSIC_BOARD.state_space_size
+
+packed_neighbors = CLASSIC_BOARD.neighbors
+packed_successors = CLASSIC_BOARD.successors
+packed_tile_moves = CLASSIC_BOARD.tile_moves
+apply_move = CLASSIC_BOARD.apply_move
+rank = CLASSIC_BOARD.rank
+unrank = CLASSIC_BOARD.unrank
+
+
+def pack(state: int) -> int:
+    """Convert an integer state (e.g. 12345678) to its packed representation."""
+    packed = 0
+    zero_pos = 0
+    for pos in range(8, -1, -1):
+        state, tile = divmod(state, 10)
+        packed = (packed << TILE_BITS) | tile
+        if tile == 0:
+            zero_pos = pos
+    return (packed << TILE_BITS) | zero_pos
+
+
+def unpack(packed: int) -> int:
+    """Convert a packed state back to its integer representation."""
+    state = 0
+    packed >>= TILE_BITS
+    for _ in range(9):
+        state = state * 10 + (packed & TILE_MASK)
+        packed >>= TILE_BITS
+    return state
 
 
 def find_empty_tile(state: int) -> int:
     """Find the position of the empty tile (represented by 0) in the puzzle."""
-    state_str = str(state).zfill(9)
-    return state_str.index('0')
+    return pack(state) & BLANK_MASK
 
 
 def swap(state: int, empty_pos: int, new_pos: int) -> int:
     """Swap the empty tile (0) with another tile at new_pos and return the new state as an integer."""
-    state_str = list(str(state).zfill(9))
-    state_str[empty_pos], state_str[new_pos] = state_str[new_pos], state_str[empty_pos]
-    return int(''.join(state_str))
+    tile = state // 10 ** (8 - new_pos) % 10
+    return state + tile * 10 ** (8 - empty_pos) - tile * 10 ** (8 - new_pos)
 
 
 def get_neighbors(state: int) -> List[int]:
     """Generate valid neighbor states by moving the empty tile (0)."""
-    neighbors_list = []
-    zero_pos = find_empty_tile(state)
-    row, col = divmod(zero_pos, 3)
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-    for direction in directions:
-        new_row, new_col = row + direction[0], col + direction[1]
-        if 0 <= new_row < 3 and 0 <= new_col < 3:
-            new_zero_pos = new_row * 3 + new_col
-            new_state = swap(state, zero_pos, new_zero_pos)
-            neighbors_list.append(new_state)
-
-    return neighbors_list
+    return [unpack(neighbor) for neighbor in packed_neighbors(pack(state))]
 
 
 def count_inversions(state: int) -> int:
@@ -47,6 +75,63 @@ def is_solvable(state: int) -> bool:
     return count_inversions(state) % 2 == 0
 
 
+# Transposing a square board swaps horizontal and vertical blank moves
+TRANSPOSED_MOVE = [DOWN, RIGHT, UP, LEFT]
+
+
+def has_transpose_symmetry(board: Board = CLASSIC_BOARD) -> bool:
+    """Square boards map their goal to itself under transpose plus tile relabeling."""
+    return board.rows == board.cols
+
+
+@lru_cache(maxsize=None)
+def _transposed_positions(board: Board) -> Tuple[int, ...]:
+    return tuple((pos % board.cols) * board.cols + pos // board.cols for pos in range(board.size))
+
+
+def transpose_state(packed: int, board: Board = CLASSIC_BOARD) -> int:
+    """Mirror a packed state in the main diagonal and relabel the tiles so the goal maps to itself.
+
+    Tile t belongs at position t, so it is renamed after its mirrored goal
+    position. Distances to the goal are preserved and applying it twice
+    gives the original state back.
+    """
+    positions = _transposed_positions(board)
+    tiles = [0] * board.size
+    for pos, tile in enumerate(board.unpack_tiles(packed)):
+        tiles[positions[pos]] = positions[tile]
+    return board.pack_tiles(tiles)
+
+
+def canonicalize(packed: int, board: Board = CLASSIC_BOARD) -> Tuple[int, bool]:
+    """Return the representative of a packed state's symmetry class and whether it is the transposed state.
+
+    The representative is the smaller packed state of the pair; boards
+    without the symmetry are their own representatives.
+    """
+    if not has_transpose_symmetry(board):
+        return packed, False
+    transposed = transpose_state(packed, board)
+    if transposed < packed:
+        return transposed, True
+    return packed, False
+
+
+def uncanonicalize(packed: int, transposed: bool, board: Board = CLASSIC_BOARD) -> int:
+    """Map a representative back to the state canonicalize was given."""
+    return transpose_state(packed, board) if transposed else packed
+
+
+def uncanonicalize_path(path: Sequence[int], transposed: bool, board: Board = CLASSIC_BOARD) -> List[int]:
+    """Map a packed solution path of the representative back to one of the original state."""
+    return [uncanonicalize(packed, transposed, board) for packed in path]
+
+
+def transpose_moves(moves: Sequence[int]) -> List[int]:
+    """Blank moves solving the transposed state, given moves solving the state (and the other way round)."""
+    return [TRANSPOSED_MOVE[move] for move in moves]
+
+
 # if __name__ == "__main__":
     # initial_state = 123405678
     # empty_tile_position = find_empty_tile(initial_state)
@@ -0,0 +1,148 @@
+import time
+from math import factorial
+from typing import Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the vectorized BFS needs it
+    np = None
+
+from Logic.board import CLASSIC_BOARD, DIRECTIONS, Board, State
+from Logic.puzzle_solver import PuzzleSolver
+from Logic.solution import Solution
+from Logic.utils import *
+
+
+class VectorBFS:
+    """Layer-synchronous BFS over whole layers at once, with NumPy arrays indexed by permutation rank.
+
+    A layer is kept as an (m, size) array of tiles plus the blank positions.
+    All successors of a layer are produced by fancy indexing per move
+    direction, ranked with a vectorized Lehmer code, filtered against a
+    visited bitmap and deduplicated with np.unique.
+    """
+
+    def __init__(self, board: Board = CLASSIC_BOARD):
+        if np is None:
+            raise ImportError("The vectorized BFS requires NumPy")
+        if not board.ranked:
+            raise ValueError(f"The vectorized BFS needs a ranked board (at most 9 cells), got {board}")
+        self.board = board
+        self.size = board.size
+        self.weights = np.array([factorial(board.size - 1 - pos) for pos in range(board.size)], dtype=np.int64)
+        # New blank position for every blank position and move, -1 where the move leaves the board
+        self.targets = np.full((board.size, len(DIRECTIONS)), -1, dtype=np.int64)
+        for zero_pos, moves in enumerate(board.move_by_direction):
+            for move, target in enumerate(moves):
+                if target is not None:
+                    self.targets[zero_pos, move] = target[0]
+        self.visited = np.zeros(board.state_space_size, dtype=bool)
+        # Move that first reached each rank, plus one; 0 for unreached states and the root
+        self.parent_moves = np.zeros(board.state_space_size, dtype=np.uint8)
+
+    def rank(self, tiles: "np.ndarray") -> "np.ndarray":
+        """Lehmer-code ranks of an (m, size) tile array, matching Board.rank."""
+        ranks = np.zeros(len(tiles), dtype=np.int64)
+        for pos in range(self.size - 1):
+            digits = (tiles[:, pos + 1:] < tiles[:, pos:pos + 1]).sum(axis=1)
+            ranks += digits * self.weights[pos]
+        return ranks
+
+    def expand(self, tiles: "np.ndarray", blanks: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Return the tiles, blank positions and moves of all successors of a layer."""
+        child_tiles, child_blanks, child_moves = [], [], []
+        for move in range(len(DIRECTIONS)):
+            targets = self.targets[blanks, move]
+            legal = np.nonzero(targets >= 0)[0]
+            moved = tiles[legal]
+            rows = np.arange(len(legal))
+            new_blanks = targets[legal]
+            moved[rows, blanks[legal]] = moved[rows, new_blanks]
+            moved[rows, new_blanks] = 0
+            child_tiles.append(moved)
+            child_blanks.append(new_blanks)
+            child_moves.append(np.full(len(legal), move, dtype=np.uint8))
+        return np.concatenate(child_tiles), np.concatenate(child_blanks), np.concatenate(child_moves)
+
+    def layers(self, start: int) -> Iterator["np.ndarray"]:
+        """Yield the ranks of each BFS layer from a packed start state, starting with depth 0.
+
+        Each call starts a fresh search: visited and parent_moves are cleared first.
+        """
+        self.visited.fill(False)
+        self.parent_moves.fill(0)
+        start_tiles = np.array([self.board.unpack_tiles(start)], dtype=np.uint8)
+        tiles = start_tiles
+        blanks = np.array([start & self.board.blank_mask], dtype=np.int64)
+        ranks = self.rank(tiles)
+        self.visited[ranks] = True
+        while len(ranks):
+            yield ranks
+            child_tiles, child_blanks, child_moves = self.expand(tiles, blanks)
+            child_ranks = self.rank(child_tiles)
+            fresh = np.nonzero(~self.visited[child_ranks])[0]
+            # The first occurrence of a rank within the layer wins, like the sequential BFS
+            ranks, first = np.unique(child_ranks[fresh], return_index=True)
+            keep = fresh[first]
+            self.visited[ranks] = True
+            self.parent_moves[ranks] = child_moves[keep] + 1
+            tiles, blanks = child_tiles[keep], child_blanks[keep]
+
+    def layer_sizes(self, start: int) -> List[int]:
+        """Number of states at each distance from a packed start state, over its whole reachable space."""
+        return [len(ranks) for ranks in self.layers(start)]
+
+
+class VectorBFSPuzzleSolver(PuzzleSolver):
+    def __init__(self, initial_state: State, board: Board = CLASSIC_BOARD):
+        """Initialize the vectorized BFS solver with the given initial state."""
+        super().__init__(initial_state, board)
+        self.search = VectorBFS(board)
+
+    def solve(self) -> None:
+        """Expand whole BFS layers until the goal's rank appears in one."""
+        if not self.board.is_solvable(self.initial_packed):
+            self.reset_solver()
+            return
+
+        timer_started = self.start_time = time.perf_counter()
+        goal_rank = self.board.rank(self.board.goal)
+        for depth, ranks in enumerate(self.search.layers(self.initial_packed)):
+            self.max_search_depth = depth
+            if self.search.visited[goal_rank]:
+                self.solution = self.solution_from_moves(self.board.goal, self.search.parent_moves)
+                self.cost = self.solution.cost
+                break
+            self.num_nodes += len(ranks)
+            # Layers are expanded whole, so limits and progress are checked between layers
+            if 0 <= self.next_checkpoint <= self.num_nodes:
+                self.checkpoint(len(ranks), depth)
+        self.run_time = time.perf_counter() - timer_started
+
+    def reset_solver(self) -> None:
+        """Reset solver attributes if the puzzle is determined to be unsolvable."""
+        self.num_nodes = 0
+        self.solution_path = []
+        self.max_search_depth = 0
+        self.run_time = 0
+        self.cost = 0
+
+    def get_number_of_nodes(self) -> int:
+        """Return the number of states in the fully expanded layers."""
+        return self.num_nodes
+
+    def get_depth(self) -> int:
+        """Return the depth of the layer that contains the goal."""
+        return self.max_search_depth
+
+    def get_runtime(self) -> float:
+        """Return the total runtime of the solution process."""
+        return self.run_time
+
+    def get_steps(self) -> Solution:
+        """Return the sequence of steps taken to solve the puzzle."""
+        return self.solution_path
+
+    def get_cost(self) -> int:
+        """Return the cost of steps taken to solve the puzzle."""
+        return self.cost
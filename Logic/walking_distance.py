@@ -0,0 +1,112 @@
+from collections import deque
+from typing import Dict, Tuple
+
+from Logic.board import CLASSIC_BOARD, Board
+from Logic.heuristics import register_packed_evaluator
+
+
+def build_walking_distance_table(lines: int, length: int) -> Dict[int, int]:
+    """BFS over walking-distance patterns from the goal, for one axis.
+
+    A pattern counts, for every line (row or column) i and goal line j, the
+    tiles from line j that currently sit in line i, plus the line of the
+    blank. A move takes any tile from a line next to the blank's line across
+    to it. Keys are the counts as base length + 1 digits, pattern[i][j] at
+    digit i * lines + j, with the blank's line on top.
+    """
+    base = length + 1
+    blank_weight = base ** (lines * lines)
+    goal = [[0] * lines for _ in range(lines)]
+    for line in range(lines):
+        goal[line][line] = length
+    goal[0][0] -= 1  # The blank starts in the first line
+
+    def key_of(pattern: Tuple[Tuple[int, ...], ...], blank_line: int) -> int:
+        key = blank_line * blank_weight
+        for i in range(lines):
+            for j in range(lines):
+                key += pattern[i][j] * base ** (i * lines + j)
+        return key
+
+    start = tuple(tuple(row) for row in goal)
+    table = {key_of(start, 0): 0}
+    queue = deque([(start, 0, 0)])
+    while queue:
+        pattern, blank_line, distance = queue.popleft()
+        for other_line in (blank_line - 1, blank_line + 1):
+            if not 0 <= other_line < lines:
+                continue
+            for goal_line in range(lines):
+                if pattern[other_line][goal_line] == 0:
+                    continue
+                moved = [list(row) for row in pattern]
+                moved[other_line][goal_line] -= 1
+                moved[blank_line][goal_line] += 1
+                new_pattern = tuple(tuple(row) for row in moved)
+                key = key_of(new_pattern, other_line)
+                if key not in table:
+                    table[key] = distance + 1
+                    queue.append((new_pattern, other_line, distance + 1))
+    return table
+
+
+class WalkingDistance:
+    """Sum of the vertical and horizontal walking distances on one board."""
+
+    def __init__(self, board: Board = CLASSIC_BOARD):
+        self.board = board
+        self.vertical_table = _walking_distance_table(board.rows, board.cols)
+        self.horizontal_table = _walking_distance_table(board.cols, board.rows)
+        # KEY[tile][pos] is the tile's contribution to the pattern key of each axis
+        vertical_base, horizontal_base = board.cols + 1, board.rows + 1
+        self.vertical_blank = [(pos // board.cols) * vertical_base ** (board.rows * board.rows)
+                               for pos in range(board.size)]
+        self.horizontal_blank = [(pos % board.cols) * horizontal_base ** (board.cols * board.cols)
+                                 for pos in range(board.size)]
+        self.vertical_key = [[0] * board.size for _ in range(board.size)]
+        self.horizontal_key = [[0] * board.size for _ in range(board.size)]
+        for tile in range(1, board.size):
+            goal_row, goal_col = divmod(tile, board.cols)
+            for pos in range(board.size):
+                row, col = divmod(pos, board.cols)
+                self.vertical_key[tile][pos] = vertical_base ** (row * board.rows + goal_row)
+                self.horizontal_key[tile][pos] = horizontal_base ** (col * board.cols + goal_col)
+
+    def evaluate(self, packed: int) -> int:
+        board = self.board
+        zero_pos = packed & board.blank_mask
+        vertical = self.vertical_blank[zero_pos]
+        horizontal = self.horizontal_blank[zero_pos]
+        state = packed >> board.tile_bits
+        for pos in range(board.size):
+            tile = state & board.tile_mask
+            state >>= board.tile_bits
+            vertical += self.vertical_key[tile][pos]
+            horizontal += self.horizontal_key[tile][pos]
+        return self.vertical_table[vertical] + self.horizontal_table[horizontal]
+
+
+# Tables depend only on the axis shape, so square boards share one table for both axes
+_tables: Dict[Tuple[int, int], Dict[int, int]] = {}
+_evaluators: Dict[Board, WalkingDistance] = {}
+
+
+def _walking_distance_table(lines: int, length: int) -> Dict[int, int]:
+    if (lines, length) not in _tables:
+        _tables[(lines, length)] = build_walking_distance_table(lines, length)
+    return _tables[(lines, length)]
+
+
+def walking_distance(board: Board = CLASSIC_BOARD) -> WalkingDistance:
+    """Return the shared walking-distance tables for a board, generating them on first use."""
+    if board not in _evaluators:
+        _evaluators[board] = WalkingDistance(board)
+    return _evaluators[board]
+
+
+def walking_distance_heuristic(state: int) -> float:
+    """Walking distance for the 8-puzzle from an integer representation."""
+    return walking_distance().evaluate(CLASSIC_BOARD.encode(state))
+
+
+register_packed_evaluator(walking_distance_heuristic, lambda board: walking_distance(board).evaluate, integer=True)
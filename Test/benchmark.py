@@ -0,0 +1,191 @@
+"""Benchmark every solver method on a fixed corpus binned by optimal depth, and guard against regressions.
+
+Run from the repository root:
+    python Test/benchmark.py --output baseline.json
+    python Test/benchmark.py --baseline baseline.json [--threshold 0.25]
+The second form exits with status 1 when a method got slower, expanded more
+nodes, used more memory or returned costlier solutions than the baseline
+allows. Times are compared after --repeat runs, taking the fastest.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.board import CLASSIC_BOARD
+from Logic.registry import create_solver, solver_names
+from Logic.solver_factory import solve_puzzle
+
+# Well-known hard 3x3 instances, shared with the other benchmark scripts
+HARD_STATES = [806547231, 641302758, 158327064, 328451670, 35428617, 725310648]
+# Methods that are exponential in the solution depth only run on instances up to this optimal depth
+MAX_DEPTH = {"IDSPuzzleSolver": 20, "IDAStarMisplacedTiles": 26}
+DEPTH_BINS = [(1, 8), (9, 16), (17, 24), (25, 31)]
+# Relative slack on time and memory; node counts and costs are deterministic and compared exactly
+DEFAULT_THRESHOLD = 0.25
+# Slowdowns smaller than this many seconds are timer noise on millisecond-sized bins
+MIN_TIME_DELTA = 0.01
+
+
+def default_methods() -> List[str]:
+    """Every registered method that can solve 3x3 boards here (VectorBFS needs NumPy, plugins may be 4x4-only)."""
+    methods = []
+    for name in solver_names():
+        try:
+            create_solver(name, CLASSIC_BOARD.goal_state, CLASSIC_BOARD)
+        except (ImportError, ValueError):
+            continue
+        methods.append(name)
+    return methods
+
+
+def bin_name(low: int, high: int) -> str:
+    return f"{low}-{high}"
+
+
+def build_corpus(per_bin: int, seed: int) -> Dict[str, List[Tuple[int, int]]]:
+    """Return (state, optimal depth) pairs per depth bin: random walks from the goal, binned by exact distance.
+
+    The hard states form their own bin. Random walks of random length reach
+    every bin, where shuffled boards would almost never be shallow.
+    """
+    rng = random.Random(seed)
+    corpus = {"hard": [(state, solve_puzzle("Database", state)['cost']) for state in HARD_STATES]}
+    bins = {bin_name(low, high): [] for low, high in DEPTH_BINS}
+    seen = set(HARD_STATES)
+    while any(len(states) < per_bin for states in bins.values()):
+        packed = CLASSIC_BOARD.goal
+        for _ in range(rng.randrange(1, 80)):
+            packed = rng.choice(CLASSIC_BOARD.neighbors(packed))
+        state = CLASSIC_BOARD.decode(packed)
+        if state in seen:
+            continue
+        seen.add(state)
+        depth = solve_puzzle("Database", state)['cost']
+        for low, high in DEPTH_BINS:
+            states = bins[bin_name(low, high)]
+            if low <= depth <= high and len(states) < per_bin:
+                states.append((state, depth))
+    corpus.update(bins)
+    return corpus
+
+
+def measure(method: str, states: List[Tuple[int, int]], repeat: int, memory: bool) -> dict:
+    """Solve each state, keeping the fastest of repeat runs; peak memory is traced in a separate pass."""
+    wall_time = 0.0
+    nodes = 0
+    cost = 0
+    for state, _ in states:
+        best = None
+        for _ in range(repeat):
+            timer_started = time.perf_counter()
+            result = solve_puzzle(method, state)
+            elapsed = time.perf_counter() - timer_started
+            best = elapsed if best is None else min(best, elapsed)
+        wall_time += best
+        nodes += result['num_nodes']
+        cost += result['cost']
+
+    peak_memory = 0
+    if memory:
+        # tracemalloc slows allocation down, so it never overlaps with the timed runs
+        for state, _ in states:
+            tracemalloc.start()
+            solve_puzzle(method, state)
+            peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    return {
+        "instances": len(states),
+        "wall_time": wall_time,
+        "nodes": nodes,
+        "nodes_per_sec": nodes / wall_time if wall_time else 0.0,
+        "peak_memory": peak_memory,
+        "cost": cost,
+    }
+
+
+def run(methods: List[str], per_bin: int, seed: int, repeat: int, memory: bool) -> dict:
+    corpus = build_corpus(per_bin, seed)
+    results = {}
+    for method in methods:
+        # Warm up lazily built tables so they do not count towards the first solve
+        solve_puzzle(method, CLASSIC_BOARD.goal_state)
+        results[method] = {}
+        for name, instances in corpus.items():
+            eligible = [(state, depth) for state, depth in instances if depth <= MAX_DEPTH.get(method, depth)]
+            if eligible:
+                results[method][name] = measure(method, eligible, repeat, memory)
+                row = results[method][name]
+                print(f"{method:28s} {name:>6s} {row['wall_time']:8.3f}s {row['nodes']:10d} nodes "
+                      f"{row['nodes_per_sec']:10.0f}/s {row['peak_memory'] / 2 ** 20:8.1f}MB cost {row['cost']}",
+                      file=sys.stderr)
+    return {
+        "meta": {"seed": seed, "per_bin": per_bin, "repeat": repeat, "python": platform.python_version(),
+                 "corpus": {name: [state for state, _ in states] for name, states in corpus.items()}},
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """Return a description of every measurement that regressed beyond the threshold."""
+    regressions = []
+    for method, bins in baseline["results"].items():
+        for name, old in bins.items():
+            new = current["results"].get(method, {}).get(name)
+            if new is None:
+                continue
+            label = f"{method} [{name}]"
+            if new["cost"] > old["cost"]:
+                regressions.append(f"{label}: cost {old['cost']} -> {new['cost']}")
+            if new["nodes"] > old["nodes"]:
+                regressions.append(f"{label}: nodes {old['nodes']} -> {new['nodes']}")
+            if new["wall_time"] > max(old["wall_time"] * (1 + threshold), old["wall_time"] + MIN_TIME_DELTA):
+                regressions.append(f"{label}: wall time {old['wall_time']:.3f}s -> {new['wall_time']:.3f}s")
+            if old["peak_memory"] and new["peak_memory"] > old["peak_memory"] * (1 + threshold):
+                regressions.append(f"{label}: peak memory {old['peak_memory']} -> {new['peak_memory']} bytes")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--methods", default=",".join(default_methods()), help="comma-separated method names")
+    parser.add_argument("--per-bin", type=int, default=4, help="random instances per depth bin")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per instance, the fastest counts")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write the results as JSON, e.g. a new baseline")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown and memory growth (default 0.25)")
+    args = parser.parse_args()
+
+    current = run(args.methods.split(","), args.per_bin, args.seed, args.repeat, not args.no_memory)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline["meta"]["corpus"] != current["meta"]["corpus"]:
+            print("Baseline was recorded on a different corpus (seed or --per-bin differ)", file=sys.stderr)
+            return 2
+        regressions = compare(current, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
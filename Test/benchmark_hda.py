@@ -0,0 +1,83 @@
+"""Measure how HDA* scales with the number of worker processes against single-process A*.
+
+Run from the repository root: python Test/benchmark_hda.py [--workers 1,2,4,8] [--board 4x4]
+Speedup is relative to HDA* with one worker; expansions above single-process
+A* are the search overhead of expanding in local rather than global f order.
+Worker counts above the machine's cores only measure that overhead.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.astar_solver import AStarPuzzleSolver
+from Logic.board import Board
+from Logic.hda_solver import DEFAULT_BATCH_SIZE, HDAStarPuzzleSolver
+from Logic.heuristics import manhattan_heuristic
+
+from benchmark import HARD_STATES
+
+
+def instance_set(board: Board, count: int, walk_length: int, seed: int) -> list:
+    """The hard states on the 3x3 board; otherwise seeded random walks of walk_length moves from the goal."""
+    if board == Board():
+        return list(HARD_STATES)
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        packed = board.goal
+        for _ in range(walk_length):
+            packed = rng.choice(board.neighbors(packed))
+        states.append(board.decode(packed))
+    return states
+
+
+def run(solver) -> tuple:
+    timer_started = time.perf_counter()
+    solver.solve()
+    return time.perf_counter() - timer_started, solver.get_number_of_nodes(), solver.get_cost()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4,8", help="comma-separated worker counts")
+    parser.add_argument("--board", default="4x4", help="board shape as ROWSxCOLS, 3x3 uses the hard states")
+    parser.add_argument("--count", type=int, default=5, help="random-walk instances on larger boards")
+    parser.add_argument("--walk-length", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    rows, cols = map(int, args.board.lower().split("x"))
+    board = Board(rows, cols)
+    states = instance_set(board, args.count, args.walk_length, args.seed)
+    print(f"{len(states)} instances on {board}, {os.cpu_count()} cores")
+
+    astar_time = astar_nodes = 0
+    costs = []
+    for state in states:
+        elapsed, nodes, cost = run(AStarPuzzleSolver(state, manhattan_heuristic, board=board))
+        astar_time += elapsed
+        astar_nodes += nodes
+        costs.append(cost)
+    print(f"{'A*':>10s} {astar_time:8.3f}s {astar_nodes:10d} nodes")
+
+    baseline = None
+    for workers in map(int, args.workers.split(",")):
+        total_time = total_nodes = 0
+        for state, cost in zip(states, costs):
+            solver = HDAStarPuzzleSolver(state, manhattan_heuristic, workers, args.batch_size, board)
+            elapsed, nodes, hda_cost = run(solver)
+            if hda_cost != cost:
+                raise SystemExit(f"HDA* with {workers} workers found cost {hda_cost} for {state}, A* found {cost}")
+            total_time += elapsed
+            total_nodes += nodes
+        baseline = baseline or total_time
+        print(f"{f'HDA* x{workers}':>10s} {total_time:8.3f}s {total_nodes:10d} nodes  "
+              f"speedup {baseline / total_time:5.2f}  overhead {total_nodes / astar_nodes - 1:+7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare A* node expansions of the informed heuristics against Manhattan distance.
+
+Run from the repository root: python Test/benchmark_heuristics.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.solver_factory import solve_puzzle
+from Logic.utils import is_solvable
+
+from benchmark import HARD_STATES
+
+METHODS = ["AStarManhattan", "AStarLinearConflict", "AStarWalkingDistance", "AStarPDB"]
+
+
+def instance_set(count: int = 20, seed: int = 2024) -> list:
+    """The hard states plus a fixed sample of random solvable states."""
+    rng = random.Random(seed)
+    states = list(HARD_STATES)
+    tiles = list(range(9))
+    while len(states) < len(HARD_STATES) + count:
+        rng.shuffle(tiles)
+        state = int(''.join(map(str, tiles)))
+        if is_solvable(state):
+            states.append(state)
+    return states
+
+
+def main() -> None:
+    states = instance_set()
+    # Warm up lazily built tables so they do not count towards the first solve
+    for method in METHODS:
+        solve_puzzle(method, states[0])
+
+    print(f"{'method':22s} {'expanded':>10s} {'vs manhattan':>13s} {'time':>8s}")
+    baseline = None
+    for method in METHODS:
+        expanded = 0
+        timer_started = time.perf_counter()
+        for state in states:
+            expanded += solve_puzzle(method, state)['num_nodes']
+        elapsed = time.perf_counter() - timer_started
+        baseline = baseline or expanded
+        print(f"{method:22s} {expanded:10d} {expanded / baseline:12.1%} {elapsed:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
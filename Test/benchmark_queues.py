@@ -0,0 +1,67 @@
+"""Compare A* frontier implementations on the hard instances.
+
+Run from the repository root: python Test/benchmark_queues.py [--queues rebuild,lazy-heap,bucket]
+The rebuild queue takes minutes on 806547231 with the misplaced-tiles heuristic.
+"""
+import argparse
+import heapq
+import os
+import sys
+import time
+from typing import Any, Iterator, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Logic.astar_solver import AStarPuzzleSolver
+from Logic.heuristics import manhattan_heuristic, misplaced_tiles_heuristic
+from Logic.priority_queues import BucketQueue, LazyHeapQueue, PriorityQueue
+
+from benchmark import HARD_STATES
+
+
+class RebuildHeapQueue(PriorityQueue):
+    """The previous decrease-key: drop the old entry by rebuilding the heap, O(frontier) per update."""
+
+    def __init__(self):
+        self.heap = []
+
+    def push(self, priority: float, item: Any) -> None:
+        state = item[0]
+        if any(entry[1][0] == state for entry in self.heap):
+            self.heap = [entry for entry in self.heap if entry[1][0] != state]
+            heapq.heapify(self.heap)
+        heapq.heappush(self.heap, (priority, item))
+
+    def pop(self) -> Tuple[float, Any]:
+        return heapq.heappop(self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (item for _, item in self.heap)
+
+
+QUEUES = {"rebuild": RebuildHeapQueue, "lazy-heap": LazyHeapQueue, "bucket": BucketQueue}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queues", default=",".join(QUEUES), help="comma-separated subset of " + ", ".join(QUEUES))
+    args = parser.parse_args()
+    queues = [(name, QUEUES[name]) for name in args.queues.split(",")]
+    for heuristic in (manhattan_heuristic, misplaced_tiles_heuristic):
+        print(heuristic.__name__)
+        for state in HARD_STATES:
+            line = f"  {state:09d}"
+            for name, queue_class in queues:
+                solver = AStarPuzzleSolver(state, heuristic, queue_class())
+                timer_started = time.perf_counter()
+                solver.solve()
+                elapsed = time.perf_counter() - timer_started
+                line += f"  {name}: {elapsed:7.3f}s cost={solver.get_cost():2d} nodes={solver.get_number_of_nodes():6d}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Report cold-start costs: importing the solver entry points and the first solve of each method.
+
+Run from the repository root: python Test/benchmark_startup.py [--repeat 5] [--methods AStarManhattan,...]
+Every measurement runs in a fresh interpreter, as a short-lived CLI call or
+pool worker would; the fastest of --repeat runs is reported. First-solve
+times include importing the method's modules and building its tables,
+except files already cached on disk (pattern and distance databases).
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Logic.registry import solver_names
+
+IMPORTS = ["Logic.board", "Logic.solver_factory", "Logic.__main__"]
+PROBE = """
+import time
+timer_started = time.perf_counter()
+{statement}
+print(time.perf_counter() - timer_started)
+"""
+
+
+def cold_time(statement: str, repeat: int) -> float:
+    """Fastest wall time of statement over repeat fresh interpreters."""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout
+        times.append(float(output.split()[-1]))
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--methods", default=",".join(solver_names()), help="comma-separated method names")
+    args = parser.parse_args()
+
+    print("import")
+    for module in IMPORTS:
+        print(f"  {module:28s} {cold_time(f'import {module}', args.repeat) * 1000:8.1f}ms")
+    print("import + first solve of 102345678")
+    for method in args.methods.split(","):
+        statement = f"from Logic.solver_factory import solve_puzzle; solve_puzzle({method!r}, 102345678)"
+        print(f"  {method:28s} {cold_time(statement, args.repeat) * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
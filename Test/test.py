@@ -28,3 +28,553 @@
 #     assert result['cost'] == 3
 #     assert result['solution_path'] == [[[1, 2, 5], [3, 4, 0], [6, 7, 8]], [[1, 2, 0], [3, 4, 5], [6, 7, 8]],
 #                                        [[1, 0, 2], [3, 4, 5], [6, 7, 8]], [[0, 1, 2], [3, 4, 5], [6, 7, 8]]]
+
+
+import itertools
+import json
+import multiprocessing
+import os
+import pickle
+import random
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from Logic.__main__ import main as cli_main
+from Logic.astar_solver import AStarPuzzleSolver
+from Logic.binary_format import SolutionFile, StateFile, pack_moves, unpack_moves, write_states
+from Logic.board import Board
+from Logic.distance_database import load_distance_database
+from Logic.hda_solver import HDAStarPuzzleSolver
+from Logic.heuristics import (HEURISTIC_TABLES, euclidean_heuristic, heuristic_delta, manhattan_heuristic,
+                              misplaced_tiles_heuristic, packed_heuristic)
+from Logic.linear_conflict import linear_conflict_heuristic
+from Logic.pattern_database import pattern_database_heuristic
+from Logic.priority_queues import BucketQueue, LazyHeapQueue
+from Logic.puzzle_solver import SearchBudget
+from Logic.registry import heuristic_names, register_heuristic, register_solver, solver_names
+from Logic.result_cache import ResultCache
+from Logic.solution import Solution
+from Logic.solver_factory import (OPTIMAL_PORTFOLIO_METHODS, PORTFOLIO_METHODS, solve_anytime, solve_many,
+                                  solve_or_report, solve_portfolio, solve_puzzle)
+from Logic.utils import (GOAL_PACKED, STATE_SPACE_SIZE, canonicalize, get_neighbors, is_solvable, pack,
+                         packed_neighbors, packed_tile_moves, rank, transpose_state, uncanonicalize,
+                         uncanonicalize_path, unpack, unrank)
+from Logic.walking_distance import walking_distance_heuristic
+
+
+def random_solvable_state() -> int:
+    tiles = list(range(9))
+    while True:
+        random.shuffle(tiles)
+        state = int(''.join(map(str, tiles)))
+        if is_solvable(state):
+            return state
+
+
+def test_pack_round_trip():
+    for state in (12345678, 806547231, 725310648, 123405678):
+        assert unpack(pack(state)) == state
+
+
+def test_neighbors_follow_direction_order():
+    assert get_neighbors(12345678) == [102345678, 312045678]
+    assert get_neighbors(123405678) == [123450678, 123475608, 123045678, 103425678]
+    assert [unpack(n) for n in packed_neighbors(pack(806547231))] == [860547231, 846507231, 86547231]
+
+
+def test_rank_is_a_bijection():
+    assert rank(pack(12345678)) == 0
+    assert rank(pack(876543210)) == STATE_SPACE_SIZE - 1
+    for index in range(0, STATE_SPACE_SIZE, 997):
+        assert rank(unrank(index)) == index
+
+
+def test_factory_with_bfs():
+    result = solve_puzzle("BFSPuzzleSolver", 125340678)
+    assert result['depth'] == 3
+    assert result['cost'] == 3
+    assert result['solution_path'] == [125340678, 120345678, 102345678, 12345678]
+    # The goal given as a sequence of tiles is recognised as well as the integer form
+    assert solve_puzzle("BFSPuzzleSolver", tuple(range(9)))['status'] == "solved"
+
+
+def test_database_matches_bfs(tmp_path):
+    for state in (806547231, 641302758, 125340678):
+        expected = solve_puzzle("BFSPuzzleSolver", state)
+        result = solve_puzzle("Database", state)
+        assert result['cost'] == expected['cost']
+        assert result['solution_path'][0] == state
+        assert result['solution_path'][-1] == 12345678
+        assert len(result['solution_path']) == result['cost'] + 1
+    assert solve_puzzle("Database", (1, 0, 2, 3, 4, 5, 6, 7, 8))['cost'] == 1
+    assert solve_puzzle("Database", (1, 0, 2, 3, 4, 5, 6, 8, 7))['status'] == "unsolvable"
+
+    # Each path gets its own mapping
+    other_path = str(tmp_path / "distances.bin")
+    other = load_distance_database(other_path)
+    assert other is not load_distance_database() and other is load_distance_database(other_path)
+    assert other[:] == load_distance_database()[:]
+
+
+def test_bucket_queue_pops_lowest_priority_last_in_first():
+    queue = BucketQueue()
+    queue.push(5, "a")
+    queue.push(3, "b")
+    queue.push(3, "c")
+    queue.push(4, "d")
+    assert [queue.pop() for _ in range(len(queue))] == [(3, "c"), (3, "b"), (4, "d"), (5, "a")]
+
+
+def test_lazy_heap_queue_keeps_superseded_entries():
+    queue = LazyHeapQueue()
+    queue.push(7.5, (1, 6))
+    queue.push(4.5, (1, 3))  # cheaper path to the same state
+    assert queue.pop() == (4.5, (1, 3))
+    assert queue.pop() == (7.5, (1, 6))  # stale entry, skipped by the solver
+
+
+def test_astar_decrease_key_stays_optimal():
+    configurations = [(manhattan_heuristic, BucketQueue), (manhattan_heuristic, LazyHeapQueue),
+                      (misplaced_tiles_heuristic, BucketQueue), (euclidean_heuristic, LazyHeapQueue)]
+    random.seed(8)
+    for _ in range(10):
+        state = random_solvable_state()
+        optimal = solve_puzzle("Database", state)['cost']
+        for heuristic, queue_class in configurations:
+            solver = AStarPuzzleSolver(state, heuristic, queue_class())
+            solver.solve()
+            assert solver.get_cost() == optimal
+            assert solver.get_steps()[0] == state and solver.get_steps()[-1] == 12345678
+
+
+def test_heuristic_delta_matches_full_evaluation():
+    random.seed(5)
+    for _ in range(50):
+        packed = pack(random_solvable_state())
+        for heuristic, table in HEURISTIC_TABLES.items():
+            parent_h = packed_heuristic(table, packed)
+            assert parent_h == heuristic(unpack(packed))
+            for neighbor, _, tile, tile_pos in packed_tile_moves(packed):
+                child_h = heuristic_delta(table, parent_h, tile, tile_pos, packed & 0xF)
+                assert abs(child_h - heuristic(unpack(neighbor))) < 1e-9
+
+
+def test_idastar_is_optimal():
+    random.seed(6)
+    for _ in range(10):
+        state = random_solvable_state()
+        optimal = solve_puzzle("Database", state)['cost']
+        for method in ("IDAStarManhattan", "IDAStarEuclidean"):
+            result = solve_puzzle(method, state)
+            assert result['cost'] == optimal
+            assert result['solution_path'][0] == state and result['solution_path'][-1] == 12345678
+    assert solve_puzzle("IDAStarManhattan", 123456870)['solution_path'] == []
+
+
+def test_board_solvability_matches_reachability():
+    board = Board(2, 3)
+    reachable = {board.goal}
+    layer = [board.goal]
+    while layer:
+        layer = [n for state in layer for n in board.neighbors(state) if n not in reachable and not reachable.add(n)]
+    solvable = [p for p in itertools.permutations(range(6)) if board.is_solvable(board.pack_tiles(p))]
+    assert len(reachable) == len(solvable) == 360
+    assert all(board.is_solvable(state) for state in reachable)
+    for invalid in (9012345678, 112345678, -5, 1234567, (0, 1, 2, 3, 4, 4)):
+        with pytest.raises(ValueError):
+            (board if isinstance(invalid, tuple) else Board()).encode(invalid)
+
+
+def test_fifteen_puzzle():
+    board = Board(4, 4)
+    state = (9, 4, 6, 3, 1, 5, 2, 7, 0, 8, 10, 11, 12, 13, 14, 15)
+    assert board.decode(board.encode(state)) == state
+    astar = solve_puzzle("AStarManhattan", state, board)
+    idastar = solve_puzzle("IDAStarManhattan", state, board)
+    assert astar['cost'] == idastar['cost'] == 20
+    assert astar['solution_path'][0] == state
+    assert astar['solution_path'][-1] == tuple(range(16))
+
+
+def test_pattern_database_dominates_manhattan():
+    random.seed(9)
+    for _ in range(30):
+        state = random_solvable_state()
+        optimal = solve_puzzle("Database", state)['cost']
+        assert manhattan_heuristic(state) <= pattern_database_heuristic(state) <= optimal
+        assert solve_puzzle("AStarPDB", state)['cost'] == optimal
+    assert pattern_database_heuristic(12345678) == 0
+
+
+def test_astar_pdb_is_optimal_despite_inconsistency():
+    # The additive pattern database is admissible but not consistent; about 1 state in 300 needs reopening
+    random.seed(8)
+    for _ in range(1000):
+        state = random_solvable_state()
+        assert solve_puzzle("AStarPDB", state)['cost'] == solve_puzzle("Database", state)['cost']
+    assert solve_puzzle("AStarPDB", 703254681)['cost'] == 23
+    assert solve_puzzle("AStarPDB", 784650312)['cost'] == 27
+
+
+def test_linear_conflict_and_walking_distance_are_admissible():
+    random.seed(10)
+    for _ in range(30):
+        state = random_solvable_state()
+        optimal = solve_puzzle("Database", state)['cost']
+        assert manhattan_heuristic(state) <= linear_conflict_heuristic(state) <= optimal
+        assert walking_distance_heuristic(state) <= optimal
+        for method in ("AStarLinearConflict", "AStarWalkingDistance"):
+            assert solve_puzzle(method, state)['cost'] == optimal
+    assert linear_conflict_heuristic(210345678) == 4  # tiles 1 and 2 swapped in their goal row
+
+
+def test_bidirectional_solvers_are_optimal():
+    random.seed(11)
+    states = [random_solvable_state() for _ in range(20)] + [12345678, 102345678]
+    for state in states:
+        optimal = solve_puzzle("Database", state)['cost']
+        for method in ("BidirectionalBFS", "BidirectionalAStarManhattan"):
+            result = solve_puzzle(method, state)
+            path = result['solution_path']
+            assert result['cost'] == optimal == len(path) - 1
+            assert path[0] == state and path[-1] == 12345678
+            assert all(after in get_neighbors(before) for before, after in zip(path, path[1:]))
+
+
+def test_solve_many_matches_solve_puzzle():
+    random.seed(12)
+    states = [random_solvable_state() for _ in range(12)]
+    expected = [solve_puzzle("AStarManhattan", state)['cost'] for state in states]
+    ordered = list(solve_many("AStarManhattan", states, workers=2, chunksize=5))
+    assert [result['cost'] for result in ordered] == expected
+    assert [result['solution_path'][0] for result in ordered] == states
+    unordered = dict(solve_many("AStarManhattan", iter(states), workers=2, chunksize=3, ordered=False))
+    assert sorted(unordered) == list(range(len(states)))
+    assert [unordered[index]['cost'] for index in range(len(states))] == expected
+
+
+def test_cli_streams_jsonl(tmp_path, capsys):
+    input_path = tmp_path / "states.txt"
+    input_path.write_text("641302758\n# comment\n\n102345678\nnot-a-state\n806547231\n")
+    assert cli_main(["IDSPuzzleSolver", str(input_path), "--timeout-per-puzzle", "0.5", "--summary"]) == 0
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [record['index'] for record in records] == [0, 1, 2, 3]
+    assert [record['status'] for record in records] == ["solved", "solved", "error", "budget_exhausted"]
+    assert records[0]['cost'] == 14 and records[1]['cost'] == 1
+    assert len(records[0]['solution']) == 14 and records[1]['solution'] == "L"
+    summary = json.loads(captured.err)
+    assert summary['puzzles'] == 4 and summary['statuses']['budget_exhausted'] == 1
+
+
+def test_cli_reports_invalid_states_as_errors(tmp_path, capsys):
+    input_path = tmp_path / "states.txt"
+    input_path.write_text("112345678\n9012345678\n102345678\n")
+    assert cli_main(["AStarManhattan", str(input_path)]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record['status'] for record in records] == ["error", "error", "solved"]
+    assert all("Not a Board(3, 3) state" in record['error'] for record in records[:2])
+
+
+def test_result_cache_tiers(tmp_path):
+    database_path = str(tmp_path / "results.sqlite")
+    cache = ResultCache(max_entries=2, path=database_path)
+    fresh = solve_puzzle("AStarManhattan", 806547231, cache=cache)
+    assert fresh['cached'] is False
+    cached = solve_puzzle("AStarManhattan", 806547231, cache=cache)
+    assert cached['cached'] is True
+    assert cached['solution_path'] == fresh['solution_path']
+    assert (cached['runtime'], cached['num_nodes']) == (fresh['runtime'], fresh['num_nodes'])
+    assert solve_puzzle("AStarManhattan", 102345678, cache=cache)['cost'] == 1
+    assert solve_puzzle("AStarManhattan", 102345687, cache=cache)['status'] == "unsolvable"
+    assert cache.stats()['evictions'] == 1 and cache.stats()['entries'] == 2
+    cache.close()
+
+    board = Board(4, 4)
+    state = (1, 0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15)
+    reopened = ResultCache(path=database_path)
+    assert solve_puzzle("AStarManhattan", 806547231, cache=reopened)['solution_path'] == fresh['solution_path']
+    assert solve_puzzle("AStarManhattan", state, board, cache=reopened)['cost'] == 1
+    assert solve_puzzle("AStarManhattan", state, board, cache=reopened)['cached'] is True
+    assert reopened.stats() == {"hits": 2, "disk_hits": 1, "misses": 1, "evictions": 0, "hit_rate": 2 / 3,
+                                "entries": 2}
+    reopened.close()
+
+
+def test_result_cache_keeps_method_specific_keys(tmp_path):
+    database_path = str(tmp_path / "results.sqlite")
+    # A file written before extras were stored gains the column on open
+    connection = sqlite3.connect(database_path)
+    connection.execute("CREATE TABLE results (method TEXT NOT NULL, board TEXT NOT NULL, state TEXT NOT NULL,"
+                       " status TEXT NOT NULL, cost INTEGER NOT NULL, depth INTEGER NOT NULL,"
+                       " num_nodes INTEGER NOT NULL, runtime REAL NOT NULL, moves TEXT NOT NULL,"
+                       " PRIMARY KEY (method, board, state))")
+    connection.commit()
+    connection.close()
+
+    cache = ResultCache(path=database_path)
+    fresh = solve_puzzle("ARAStarManhattan", 806547231, cache=cache)
+    cache.clear()
+    cached = solve_puzzle("ARAStarManhattan", 806547231, cache=cache)
+    assert cache.stats()['disk_hits'] == 1
+    assert set(cached) == set(fresh) | {"lookup_time"}
+    assert cached['suboptimality_bound'] == fresh['suboptimality_bound'] == 1.0
+    cache.put("Portfolio", 102345678, dict(fresh, winner="AStarManhattan", cost=1))
+    assert cache.get("Portfolio", 102345678)['winner'] == "AStarManhattan"
+    cache.close()
+
+
+def test_progress_observer_reports_at_interval():
+    for method in ("AStarManhattan", "BFSPuzzleSolver", "DFSPuzzleSolver", "IDSPuzzleSolver", "IDAStarManhattan",
+                   "BidirectionalBFS", "BidirectionalAStarManhattan"):
+        reports = []
+        result = solve_puzzle(method, 641302758, observer=reports.append, report_interval=10)
+        # BFS counts the goal without expanding it
+        assert (result['num_nodes'] - 1) // 10 <= len(reports) <= result['num_nodes'] // 10
+        assert [progress.num_nodes for progress in reports] == [10 * (i + 1) for i in range(len(reports))]
+        assert all(progress.elapsed >= 0 and progress.frontier_size >= 0 for progress in reports)
+
+
+def test_cancel_event_stops_every_search():
+    for method in ("AStarManhattan", "BFSPuzzleSolver", "DFSPuzzleSolver", "IDSPuzzleSolver", "IDAStarEuclidean"):
+        cancel_event = threading.Event()
+        result = solve_puzzle(method, 806547231, observer=lambda progress: cancel_event.set(),
+                              report_interval=100, cancel_event=cancel_event)
+        assert result['status'] == "cancelled" and result['solution_path'] == []
+        assert 100 <= result['num_nodes'] <= 100 + 1000
+
+    cancel_event = threading.Event()
+    results = []
+    worker = threading.Thread(target=lambda: results.append(
+        solve_puzzle("DFSPuzzleSolver", 806547231, cancel_event=cancel_event)))
+    worker.start()
+    cancel_event.set()
+    worker.join(timeout=5)
+    assert results[0]['status'] == "cancelled"
+
+    # The GUI's solver thread goes through solve_or_report, which passes the event on
+    cancel_event.clear()
+    result = solve_or_report("DFSPuzzleSolver", 806547231, observer=lambda progress: cancel_event.set(),
+                             report_interval=100, cancel_event=cancel_event)
+    assert result['status'] == "cancelled"
+
+
+def test_budgets_return_partial_results():
+    for method in ("AStarManhattan", "BFSPuzzleSolver", "DFSPuzzleSolver", "IDSPuzzleSolver", "IDAStarManhattan",
+                   "BidirectionalBFS", "BidirectionalAStarManhattan"):
+        result = solve_puzzle(method, 806547231, budget=SearchBudget(max_expansions=500))
+        assert result['status'] == "budget_exhausted" and result['budget'] == "expansions"
+        assert result['num_nodes'] == 500 and result['depth'] > 0 and result['solution_path'] == []
+        assert manhattan_heuristic(result['closest_state']) <= manhattan_heuristic(806547231)
+
+    result = solve_puzzle("IDSPuzzleSolver", 806547231, budget=SearchBudget(max_seconds=0.05))
+    assert result['budget'] == "deadline" and result['runtime'] < 1
+    result = solve_puzzle("BFSPuzzleSolver", 806547231, budget=SearchBudget(max_states=5000))
+    assert result['budget'] == "states" and result['num_nodes'] < 5000
+    # A budget that is not reached leaves the result untouched
+    assert solve_puzzle("AStarManhattan", 641302758, budget=SearchBudget(116, 10, 10000))['status'] == "solved"
+
+
+def test_anytime_solutions_improve_to_optimal():
+    random.seed(13)
+    for state in [641302758, 806547231] + [random_solvable_state() for _ in range(10)]:
+        optimal = solve_puzzle("Database", state)['cost']
+        solutions = list(solve_anytime(state))
+        costs = [solution['cost'] for solution in solutions]
+        assert costs == sorted(costs, reverse=True) and costs[-1] == optimal
+        assert all(solution['cost'] <= solution['suboptimality_bound'] * optimal + 1e-9 for solution in solutions)
+        assert all(len(solution['solution_path']) - 1 == solution['cost'] for solution in solutions)
+        assert solutions[-1]['suboptimality_bound'] == 1.0
+        assert solutions[-1]['solution_path'] == solve_puzzle("ARAStarManhattan", state)['solution_path']
+
+    first, = solve_anytime(641302758, budget=SearchBudget(max_expansions=406))
+    assert first['cost'] == 24 and first['suboptimality_bound'] == 2.0
+    result = solve_puzzle("ARAStarManhattan", 641302758, budget=SearchBudget(max_expansions=406))
+    assert result['status'] == "solved" and result['cost'] == 24
+    assert list(solve_anytime(806547231, budget=SearchBudget(max_expansions=10)))[0]['status'] == "budget_exhausted"
+
+
+def test_vector_bfs_enumerates_layers_and_solves():
+    pytest.importorskip("numpy")
+    from Logic.vector_bfs import VectorBFS
+
+    board = Board()
+    search = VectorBFS(board)
+    sizes = search.layer_sizes(board.goal)
+    assert len(sizes) == 32 and sizes[-1] == 2 and sum(sizes) == STATE_SPACE_SIZE // 2
+    assert search.layer_sizes(board.goal) == sizes
+    small = Board(2, 3)
+    assert sum(VectorBFS(small).layer_sizes(small.goal)) == small.state_space_size // 2
+
+    random.seed(19)
+    for state in [806547231, 12345678, 123456708] + [random_solvable_state() for _ in range(10)]:
+        result = solve_puzzle("VectorBFS", state)
+        assert result['cost'] == solve_puzzle("Database", state)['cost']
+        path = result['solution_path']
+        assert path[0] == state and path[-1] == 12345678
+        assert all(after in get_neighbors(before) for before, after in zip(path, path[1:]))
+    assert solve_puzzle("VectorBFS", 102345687)['status'] == "unsolvable"
+
+
+def test_hda_star_is_optimal_across_workers():
+    random.seed(20)
+    states = [806547231, 12345678, 102345678] + [random_solvable_state() for _ in range(4)]
+    for workers in (1, 3):
+        for state in states:
+            solver = HDAStarPuzzleSolver(state, manhattan_heuristic, workers=workers)
+            solver.solve()
+            assert solver.get_cost() == solve_puzzle("Database", state)['cost']
+            path = solver.get_steps()
+            assert path[0] == state and path[-1] == 12345678
+            assert all(after in get_neighbors(before) for before, after in zip(path, path[1:]))
+
+    board = Board(4, 4)
+    solver = HDAStarPuzzleSolver((9, 4, 6, 3, 1, 5, 2, 7, 0, 8, 10, 11, 12, 13, 14, 15), manhattan_heuristic,
+                                 workers=2, board=board)
+    solver.solve()
+    assert solver.get_cost() == 20 and solver.get_steps()[-1] == tuple(range(16))
+    assert solve_puzzle("HDAStarManhattan", 102345687)['status'] == "unsolvable"
+
+
+def test_portfolio_returns_first_answer_and_stops_the_rest():
+    for state in (806547231, 641302758, 102345687):
+        result = solve_puzzle("PortfolioOptimal", state)
+        assert result['winner'] in OPTIMAL_PORTFOLIO_METHODS
+        assert result['cost'] == solve_puzzle("Database", state)['cost']
+        assert solve_puzzle("Portfolio", state)['winner'] in PORTFOLIO_METHODS
+        assert multiprocessing.active_children() == []
+
+    with pytest.raises(ValueError):
+        solve_portfolio(806547231, ("AStarManhattan", "DFSPuzzleSolver"), optimal=True)
+    cancel_event = threading.Event()
+    cancel_event.set()
+    result = solve_portfolio(806547231, ("DFSPuzzleSolver", "IDSPuzzleSolver"), cancel_event=cancel_event)
+    assert result['status'] == "cancelled" and result['runtime'] < 1
+    result = solve_portfolio(806547231, ("IDSPuzzleSolver",), budget=SearchBudget(max_expansions=100))
+    assert result['status'] == "budget_exhausted" and result['winner'] is None
+
+    # Members killed before they report do not leave the race waiting forever
+    results = []
+    race = threading.Thread(target=lambda: results.append(solve_portfolio(806547231, ("IDSPuzzleSolver",) * 2)))
+    race.start()
+    while len(multiprocessing.active_children()) < 2:
+        time.sleep(0.01)
+    for member in multiprocessing.active_children():
+        member.kill()
+    race.join(timeout=5)
+    assert results[0]['status'] == "error" and results[0]['winner'] is None
+
+
+def test_registry_loads_solvers_lazily_and_accepts_plugins():
+    probe = ("import sys, Logic.solver_factory;"
+             " print(sorted(m for m in sys.modules if m.startswith(('Logic.', 'numpy'))))")
+    loaded = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert "Logic.astar_solver" not in loaded and "numpy" not in loaded
+
+    register_heuristic("zero", lambda state: 0)
+    register_solver("AStarZero", "Logic.astar_solver:AStarPuzzleSolver", "zero")
+    assert "AStarZero" in solver_names() and "zero" in heuristic_names()
+    assert solve_puzzle("AStarZero", 641302758)['cost'] == 14
+    with pytest.raises(ValueError):
+        solve_puzzle("NoSuchMethod", 641302758)
+
+
+def test_transpose_canonicalization_shares_cache_entries():
+    random.seed(23)
+    for _ in range(20):
+        packed = pack(random_solvable_state())
+        transposed = transpose_state(packed)
+        assert transpose_state(transposed) == packed
+        assert canonicalize(packed)[0] == canonicalize(transposed)[0]
+        canonical, flipped = canonicalize(packed)
+        assert uncanonicalize(canonical, flipped) == packed
+        path = [pack(state) for state in solve_puzzle("AStarManhattan", unpack(canonical))['solution_path']]
+        original_path = uncanonicalize_path(path, flipped)
+        assert original_path[0] == packed and original_path[-1] == GOAL_PACKED
+        assert packed_neighbors(original_path[0]).count(original_path[1]) == 1
+    assert transpose_state(GOAL_PACKED) == GOAL_PACKED
+
+    cache = ResultCache()
+    state = 806547231
+    mirrored = unpack(transpose_state(pack(state)))
+    fresh = solve_puzzle("AStarManhattan", state, cache=cache)
+    hit = solve_puzzle("AStarManhattan", mirrored, cache=cache)
+    assert hit['cached'] is True and hit['cost'] == fresh['cost']
+    assert hit['solution_path'][0] == mirrored and hit['solution_path'][-1] == 12345678
+    assert all(after in get_neighbors(before) for before, after in zip(hit['solution_path'], hit['solution_path'][1:]))
+    assert cache.stats()['entries'] == 1 and cache.stats()['hits'] == 1
+    assert solve_puzzle("AStarManhattan", state, cache=cache)['solution_path'] == fresh['solution_path']
+    unshared = ResultCache(symmetry=False)
+    solve_puzzle("AStarManhattan", state, cache=unshared)
+    assert solve_puzzle("AStarManhattan", mirrored, cache=unshared)['cached'] is False
+
+
+def test_binary_state_and_solution_files(tmp_path):
+    assert unpack_moves(pack_moves([0, 1, 2, 3, 3]), 5) == [0, 1, 2, 3, 3]
+    states = [806547231, 641302758, 102345687, 12345678]
+    states_path = str(tmp_path / "states.bin")
+    assert write_states(states_path, states) == 4
+    assert os.path.getsize(states_path) == 16 + 4 * len(states)
+    with StateFile(states_path) as state_file:
+        assert len(state_file) == 4 and list(state_file) == states and state_file[1] == 641302758
+        # A suspended iterator, as left by a solve that raised mid-batch, must not block closing
+        suspended = iter(state_file)
+        assert next(suspended) == states[0]
+
+    results_path = str(tmp_path / "results.bin")
+    assert cli_main(["AStarManhattan", states_path, "--binary-input", "--binary-output", results_path]) == 0
+    with SolutionFile(results_path) as solution_file:
+        records = list(solution_file)
+    assert [record.state for record in records] == states
+    assert [record.status for record in records] == ["solved", "solved", "unsolvable", "solved"]
+    for record in records:
+        assert record.solution_path() == solve_puzzle("AStarManhattan", record.state)['solution_path']
+    # 31 moves take 8 bytes after the 9-byte record header
+    assert os.path.getsize(results_path) == 16 + 9 * 4 + 8 + 4
+
+    # Records decode against the board of their file, not the classic board
+    small_board = Board(2, 3)
+    small_states_path = str(tmp_path / "small_states.bin")
+    small_results_path = str(tmp_path / "small_results.bin")
+    write_states(small_states_path, [(1, 2, 0, 3, 4, 5)], small_board)
+    assert cli_main(["AStarManhattan", small_states_path, "--binary-input", "--binary-output", small_results_path]) == 0
+    with SolutionFile(small_results_path) as solution_file:
+        (record,) = list(solution_file)
+    assert record.board == small_board and record.status == "solved"
+    assert record.solution_path() == solve_puzzle("AStarManhattan", (1, 2, 0, 3, 4, 5), small_board)['solution_path']
+    assert record.solution_path()[-1] == small_board.decode(small_board.goal)
+
+
+def test_solution_decodes_states_lazily():
+    result = solve_puzzle("AStarManhattan", 806547231)
+    solution = result['solution']
+    assert len(solution.moves) == result['cost'] == 31
+    # solution_path is the same lazy view, not a separately decoded list
+    assert result['solution_path'] is solution and solution.solution_path == list(solution)
+    # Stepping backwards and jumping around walk from the last position looked up
+    for index in [30, 29, 31, 0, 15, -1, 16, 3]:
+        assert solution[index] == result['solution_path'][index]
+    assert solution[5:8] == result['solution_path'][5:8]
+    with pytest.raises(IndexError):
+        solution[32]
+    assert Solution.from_path(result['solution_path']) == solution
+    assert len(solve_puzzle("IDSPuzzleSolver", 102345687)['solution']) == 0
+    # Every status carries a Solution, never a bare list
+    for other in (solve_or_report("AStarManhattan", 112345678),
+                  solve_puzzle("AStarManhattan", 806547231, budget=SearchBudget(max_expansions=10))):
+        assert isinstance(other['solution_path'], Solution) and len(other['solution_path']) == 0
+    # Results cross process boundaries without the board's tables
+    assert len(pickle.dumps(result)) < 1000 and pickle.loads(pickle.dumps(solution)).board is solution.board
+
+    board = Board(4, 4)
+    big = solve_puzzle("IDAStarManhattan", (1, 2, 3, 7, 4, 5, 6, 0, 8, 9, 10, 11, 12, 13, 14, 15), board)
+    assert big['solution'].board == board and big['solution'][-1] == board.goal_state
+    cache = ResultCache()
+    cache.put("AStarManhattan", 806547231, result)
+    assert cache.get("AStarManhattan", 806547231)['solution'] == solution